@@ -0,0 +1,93 @@
+// View toggles that only reshape data the browser already has. The server
+// sends each chart's base figure into a dcc.Store once; these clientside
+// callbacks derive what the toggles show from it without a round trip.
+//
+// Figures are copied before they are reshaped: Plotly annotates the objects
+// it draws, and the stored ones must stay as the server sent them.
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    views: {
+        // Percentage/absolute value radio on the vehicle parc chart
+        vehicleparc: function(figure, percentage_button) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            figure = copy(figure);
+            if (percentage_button === 'PX') {
+                percentStacked(figure, {
+                    title: {text: 'Percentage of total'}, ticksuffix: '%', rangemode: 'normal'
+                });
+            }
+            return figure;
+        },
+
+        // Percentage/absolute value radio on the hydrocarbon bulletin chart
+        hcbulletin: function(figure, hc_percentage_button) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            figure = copy(figure);
+            if (hc_percentage_button === 'PX') {
+                percentStacked(figure, {ticksuffix: '%'});
+            }
+            return figure;
+        },
+
+        // Region picker on the LA emissions map. The server sends the map of
+        // a sector with every authority and the region of each; the regions
+        // that aren't picked are masked out here
+        LAemissions: function(sector, regions) {
+            if (!sector) {
+                return window.dash_clientside.no_update;
+            }
+            var figure = copy(sector.figure);
+            var picked = new Set(regions || []);
+            var shown = sector.regions.map(function(region) { return picked.has(region); });
+            figure.data.forEach(function(trace) {
+                ['locations', 'z', 'customdata', 'hovertext'].forEach(function(key) {
+                    if (trace[key]) {
+                        trace[key] = values(trace[key]).filter(function(value, i) { return shown[i]; });
+                    }
+                });
+            });
+            return figure;
+        },
+
+        // Cars/LGV switch on the veh156 chart; both figures come with the page
+        veh156: function(veh156_selected_chart, figures) {
+            if (!figures || !figures[veh156_selected_chart]) {
+                return window.dash_clientside.no_update;
+            }
+            return copy(figures[veh156_selected_chart]);
+        }
+    }
+});
+
+
+function copy(figure) {
+    return JSON.parse(JSON.stringify(figure));
+}
+
+
+// A plain array from a trace attribute, decoding the base64 typed arrays
+// the server sends numeric data as (payload.py)
+var TYPED_ARRAYS = {
+    i1: Int8Array, u1: Uint8Array, u1c: Uint8ClampedArray, i2: Int16Array, u2: Uint16Array,
+    i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array
+};
+
+function values(array) {
+    if (!array || !array.bdata) {
+        return array;
+    }
+    var bytes = Uint8Array.from(atob(array.bdata), function(c) { return c.charCodeAt(0); });
+    return Array.from(new TYPED_ARRAYS[array.dtype](bytes.buffer));
+}
+
+
+// Stacked areas normalised to 100%, without the unstacked (total) lines
+function percentStacked(figure, yaxis) {
+    figure.data = figure.data.filter(function(trace) { return trace.stackgroup; });
+    figure.data.forEach(function(trace) { trace.groupnorm = 'percent'; });
+    figure.layout.yaxis = Object.assign(figure.layout.yaxis || {}, yaxis);
+}
@@ -0,0 +1,138 @@
+# One index of Local Authority Districts for every map join.
+#
+# The data files name authorities in their own ways ("Bristol, City of",
+# "Bristol LPA", "St. Albans", "Rhondda Cynon Taff") and only some carry ONS
+# codes, while the boundary file has LAD21CD codes and LAD21NM names. The
+# index gives every district in the boundary file a small integer ID next
+# to its code and name, and other spellings are matched through key(). It is
+# kept in geometry/lad21-index.json (see geometry.py) and only rebuilt when
+# the boundary file changes: districts keep their IDs across rebuilds and
+# new ones get new IDs.
+#
+# The served boundaries carry each district's ID as the feature id, so the
+# choropleths send integer locations with featureidkey='id' rather than
+# long names. Names and codes the index can't place are logged, instead of
+# quietly leaving those authorities off the map.
+#
+# ALIASES folds districts that have since merged into the merged one, so a
+# file can have several rows for one ID. Tables of per-district figures are
+# passed through unique(), which keeps one row per ID and logs the others;
+# amounts that add up (emissions) are summed per ID instead.
+
+import json
+import logging
+import os
+import re
+
+import numpy as np
+
+import datastore
+
+
+# Spellings that don't follow from the normalisation in key(): older names
+# of renamed districts and other variants met in the data files
+ALIASES = {
+    'rhondda cynon taff': 'rhondda cynon taf',
+    'the vale of glamorgan': 'vale of glamorgan',
+    'comhairle nan eilean siar': 'na h eileanan siar',
+    'eilean siar': 'na h eileanan siar',
+    'shepway': 'folkestone and hythe',
+    'taunton deane': 'somerset west and taunton',
+    'forest heath': 'west suffolk',
+    'st edmundsbury': 'west suffolk',
+    'suffolk coastal': 'east suffolk',
+    'waveney': 'east suffolk',
+    'bournemouth': 'bournemouth christchurch and poole',
+    'poole': 'bournemouth christchurch and poole',
+    'glasgow': 'glasgow city',
+    'edinburgh': 'city of edinburgh',
+}
+
+log = logging.getLogger(__name__)
+
+
+def key(name):
+    # 'Bristol, City of' and 'City of Bristol LPA' both give 'city of bristol'
+    name = _normalised(name)
+    return ALIASES.get(name, name)
+
+
+def _normalised(name):
+    name = str(name).strip().lower().replace('&', ' and ')
+    name = re.sub(r'^(.*),\s*(city|county) of$', r'\2 of \1', name)
+    name = re.sub(r'\s+(lpa|council|district council|borough council)$', '', name)
+    return ' '.join(re.sub(r"[^a-z0-9 ]", '', name.replace('-', ' ')).split())
+
+
+def build(collection, previous=()):
+    # Index entries for the features of a boundary FeatureCollection, reusing
+    # the IDs of the districts in previous
+    ids = {entry['code']: entry['id'] for entry in previous}
+    next_id = max(ids.values(), default=-1) + 1
+    entries = []
+    for feature in collection['features']:
+        code, name = feature['properties']['LAD21CD'], feature['properties']['LAD21NM']
+        if code not in ids:
+            ids[code] = next_id
+            next_id += 1
+        entries.append({'id': ids[code], 'code': code, 'name': name})
+    return sorted(entries, key=lambda entry: entry['id'])
+
+
+def load(source, path):
+    # The index for the boundary file source, rebuilt into path when that
+    # is missing or older than the boundaries
+    previous = []
+    if os.path.exists(path):
+        with open(path) as f:
+            previous = json.load(f)
+        if os.path.getmtime(path) >= os.path.getmtime(source):
+            return previous
+    with open(source) as f:
+        entries = build(json.load(f), previous)
+    datastore._atomic_write(path, json.dumps(entries, indent=0).encode())
+    return entries
+
+
+def with_ids(collection, entries):
+    # Copy of a boundary FeatureCollection with the index IDs as feature ids
+    ids = {entry['code']: entry['id'] for entry in entries}
+    return dict(collection, features=[dict(feature, id=ids[feature['properties']['LAD21CD']])
+                                      for feature in collection['features']])
+
+
+def ids(entries, names, codes=None, dataset=''):
+    # Index IDs for a column of names (or ONS codes where given), -1 where
+    # neither is known. entries is the LA_index dataset.
+    by_code = {entry['code']: entry['id'] for entry in entries}
+    by_key = {key(entry['name']): entry['id'] for entry in entries}
+    names = list(names)
+    codes = list(codes) if codes is not None else [None] * len(names)
+
+    found = np.array([by_code.get(code, by_key.get(key(name), -1)) for name, code in zip(names, codes)],
+                     dtype='int64')
+    missing = sorted({str(name) for name, found_id in zip(names, found) if found_id < 0})
+    if missing:
+        log.warning('%s: %d authorities not on the map: %s', dataset or 'LA index', len(missing),
+                    ', '.join(missing[:20]) + (' ...' if len(missing) > 20 else ''))
+    return found
+
+
+def unique(frame, names, dataset=''):
+    # frame with one row per 'LA id': a row naming the district itself wins
+    # over old districts merged into it, otherwise the first row. Rows the
+    # index couldn't place (-1) are all kept.
+    found = frame['LA id'].to_numpy()
+    aliased = np.array([_normalised(name) in ALIASES for name in frame[names]], dtype=bool)
+    keep = np.ones(len(frame), dtype=bool)
+    seen = set()
+    for i in np.argsort(aliased, kind='stable'):
+        if found[i] < 0:
+            continue
+        if found[i] in seen:
+            keep[i] = False
+        seen.add(found[i])
+    if not keep.all():
+        log.warning('%s: %d rows for districts already listed under another name, dropped: %s',
+                    dataset or 'LA index', (~keep).sum(), ', '.join(map(str, frame[names][~keep])))
+    return frame[keep]
@@ -0,0 +1,285 @@
+# Benchmarks for the figure callbacks, run against synthetic data.
+#
+#     python benchmark.py [--scales 1 10 100 1000] [--only update_cxtype ...]
+#                         [--output benchmark.json] [--compare previous.json]
+#
+# For every scale synthetic.py writes a full set of data files, with the row
+# counts multiplied by that scale, into a scratch directory, and a fresh
+# process imports the pages against it. Each callback is then called the way
+# Dash calls it (with the triggering input set) for every combination of its
+# inputs: once with an empty figure cache (cold), then again (warm).
+#
+# Recorded per call: wall time, peak memory allocated by the cold call
+# (tracemalloc, so Python and numpy allocations) and the size of the JSON
+# response. Loading and preparing the datasets a callback reads is timed
+# separately and is not part of the call times.
+#
+# Results go to --output as JSON. With --compare the totals per callback and
+# scale are checked against an earlier run, and the exit status is 1 when
+# any got slower by more than --threshold.
+
+import argparse
+import concurrent.futures
+import contextvars
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import synthetic
+
+
+# A zoomed-in view: the last five years of the synthetic series
+WINDOW = ('2017-06-30', '2022-06-30')
+
+
+def _cases():
+    # (callback, datasets it reads, [(inputs label, triggering input, args)])
+    import datastore
+    import pages
+    # Datasets are registered across the pages, e.g. evet reads chargepoints'
+    pages.register()
+    from pages import evet, grid, local_authorities, other_wg, vehicles
+
+    zoom = {'xaxis.range[0]': WINDOW[0], 'xaxis.range[1]': WINDOW[1]}
+    cases = []
+
+    cases.append((vehicles.update_vehicleparcfig, ['vehicleparc', 'vehicleparc_blocks'], [
+        ('%s / %s%s' % (vehicle, chart, ' / zoomed' if relayout else ''),
+         'vehicleparc-graph' if relayout else 'vehicle-picker', (vehicle, chart, relayout))
+        for vehicle in vehicles.vehicle_types_parc for chart in vehicles.chart_type
+        for relayout in (None, zoom)]))
+
+    cases.append((vehicles.update_hcbulletinfig, ['hcbulletin', 'bar_hcbulletinlist', 'line_hcbulletinlist'], [
+        ('%s%s' % (chart, ' / zoomed' if relayout else ''),
+         'hcbulletin-graph' if relayout else 'hc-chart-picker', (chart, relayout))
+        for chart in vehicles.hc_chart_type for relayout in (None, zoom)]))
+
+    # The veh156 picker is clientside now; this builds what page 4 ships
+    def build_veh156figs():
+        return vehicles.build_veh156figs(*[datastore.get(name) for name in ('veh156', 'veh156list', 'veh156list_LGV')])
+    cases.append((build_veh156figs, ['veh156', 'veh156list', 'veh156list_LGV'], [
+        ('Cars + Light goods vehicles', 'veh156-vehicle-picker', ())]))
+
+    # Regions are masked in the browser, so only the sector goes to the server
+    sectors = [option['value'] for option in datastore.get('sector_options')]
+    cases.append((local_authorities.update_figure, ['LAem_grid', 'sector_options'], [
+        (sector, 'sector-picker', (sector,)) for sector in sectors]))
+
+    cases.append((grid.update_cxtype, ['WPDcapacity', 'WPDcapacity_status', 'WPDindicator_list'], [
+        ('%s / %s' % (connection, indicator), 'connection-picker', (connection, indicator))
+        for connection in grid.selected_connection_list
+        for indicator in datastore.get('WPDindicator_list')]))
+
+    cases.append((evet.updateESCpub, ['ESCpub', 'ESCpri', 'ESCpubheader', 'ZapMapPUBx', 'rslt_df5', 'EVHSdevices'], [
+        (projection, 'projection_checklist', (projection,))
+        for projection in ['central_case', 'home', 'linear', 'all_public']]))
+
+    cases.append((evet.updateESCvehsales, ['ESCsales', 'ESCnewsales', 'ESCparc'], [
+        ('%s / %s' % (vehicle, chart), 'ESCsales-type-picker', (vehicle, chart))
+        for vehicle in evet.ESCsales_vehicle_types for chart in evet.ESCsales_chart_types]))
+
+    modes = other_wg.COVIDTUmode_options
+    tu_cases = []
+    for granularity in other_wg.TU_granularity_options:
+        for selected in [[mode] for mode in modes] + [modes]:
+            label = '%s / %s' % (granularity, selected[0] if len(selected) == 1 else 'all modes')
+            tu_cases.append((label, 'TU-granularity', (selected, granularity, None, None)))
+        drawn = {'granularity': granularity, 'modes': modes, 'range': None}
+        tu_cases.append(('%s / all modes / zoomed' % granularity, 'transportusage-graph',
+                         (modes, granularity, zoom, drawn)))
+        # Mode toggles patch traces in or out of the drawn figure
+        tu_cases.append(('%s / all modes -> %s' % (granularity, modes[0]), 'TU-mode-picker',
+                         ([modes[0]], granularity, None, drawn)))
+        tu_cases.append(('%s / %s -> all modes' % (granularity, modes[0]), 'TU-mode-picker',
+                         (modes, granularity, None, dict(drawn, modes=[modes[0]]))))
+        tu_cases.append(('%s / all modes, zoomed -> %s added' % (granularity, modes[-1]), 'TU-mode-picker',
+                         (modes, granularity, None, dict(drawn, modes=modes[:-1], range=list(WINDOW)))))
+    cases.append((other_wg.update_transportusagefig, list(other_wg.TU_granularities.values()), tu_cases))
+
+    return cases
+
+
+def _call(callback, triggered, args):
+    # Dash's callback context, as its docs suggest for testing callbacks
+    from dash._callback_context import context_value
+    from dash._utils import AttributeDict
+
+    def run():
+        context_value.set(AttributeDict(triggered_inputs=[{'prop_id': triggered + '.value', 'value': None}]))
+        return callback(*args)
+    return contextvars.copy_context().run(run)
+
+
+def _measure(directory, only):
+    import datastore
+    import figurecache
+    from plotly.io.json import to_json_plotly
+
+    # go.Line and friends warn on every call, which would bury the report
+    warnings.simplefilter('ignore', DeprecationWarning)
+    os.chdir(directory)
+    results, loads = [], []
+    for callback, datasets, combinations in _cases_or_error(loads):
+        name = callback.__name__
+        if only and name not in only:
+            continue
+
+        start = time.perf_counter()
+        try:
+            for dataset in datasets:
+                datastore.get(dataset)
+        except Exception as error:
+            loads.append({'callback': name, 'error': repr(error)})
+            continue
+        loads.append({'callback': name, 'seconds': time.perf_counter() - start})
+
+        for label, triggered, args in combinations:
+            result = {'callback': name, 'inputs': label}
+            try:
+                figurecache.clear()
+                start = time.perf_counter()
+                output = _call(callback, triggered, args)
+                result['cold_seconds'] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                _call(callback, triggered, args)
+                result['warm_seconds'] = time.perf_counter() - start
+
+                result['payload_bytes'] = len(to_json_plotly(output))
+
+                figurecache.clear()
+                tracemalloc.start()
+                _call(callback, triggered, args)
+                result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            except Exception as error:
+                result['error'] = repr(error)
+            finally:
+                tracemalloc.stop()
+            results.append(result)
+    return results, loads
+
+
+def _cases_or_error(loads):
+    try:
+        return _cases()
+    except Exception as error:
+        loads.append({'callback': None, 'error': repr(error)})
+        return []
+
+
+def run(scale, only=()):
+    directory = tempfile.mkdtemp(prefix='dashboard-benchmark-')
+    try:
+        synthetic.write(directory, scale)
+        # Read by the new process when it imports the datastore
+        os.environ.update(DASHBOARD_CACHE_DIR=os.path.join(directory, '.datacache'),
+                          DASHBOARD_GEOMETRY_DIR=os.path.join(directory, 'geometry'),
+                          FIGURE_CACHE_URL='memory')
+        context = multiprocessing.get_context('spawn')
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results, loads = pool.submit(_measure, directory, only).result()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    for entry in results + loads:
+        entry['scale'] = scale
+    return results, loads
+
+
+def summarize(results):
+    groups = {}
+    for result in results:
+        if 'error' not in result:
+            groups.setdefault((result['callback'], result['scale']), []).append(result)
+    summary = []
+    for (callback, scale), group in sorted(groups.items()):
+        cold = [result['cold_seconds'] for result in group]
+        summary.append({
+            'callback': callback, 'scale': scale, 'calls': len(group),
+            'cold_total_seconds': sum(cold),
+            'cold_median_seconds': statistics.median(cold),
+            'cold_max_seconds': max(cold),
+            'warm_median_seconds': statistics.median(result['warm_seconds'] for result in group),
+            'payload_max_bytes': max(result['payload_bytes'] for result in group),
+            'peak_max_bytes': max(result['peak_bytes'] for result in group),
+        })
+    return summary
+
+
+def report(summary, results, loads):
+    print('%-26s %6s %5s %10s %10s %10s %11s %10s' % (
+        'callback', 'scale', 'calls', 'cold med', 'cold max', 'warm med', 'payload max', 'peak max'))
+    for row in summary:
+        print('%-26s %5dx %5d %8.1fms %8.1fms %8.2fms %9.1fkB %8.1fMB' % (
+            row['callback'], row['scale'], row['calls'],
+            row['cold_median_seconds'] * 1e3, row['cold_max_seconds'] * 1e3, row['warm_median_seconds'] * 1e3,
+            row['payload_max_bytes'] / 1e3, row['peak_max_bytes'] / 1e6))
+    for entry in loads + results:
+        if 'error' in entry:
+            print('%s at %dx (%s): %s' % (entry['callback'], entry['scale'], entry.get('inputs', 'loading'),
+                                          entry['error']))
+
+
+def compare(summary, previous, threshold):
+    before = {(row['callback'], row['scale']): row for row in previous['summary']}
+    regressions = 0
+    for row in summary:
+        old = before.get((row['callback'], row['scale']))
+        if old is None or not old['cold_total_seconds']:
+            continue
+        ratio = row['cold_total_seconds'] / old['cold_total_seconds']
+        flag = ''
+        if ratio > threshold:
+            flag = '  <- slower'
+            regressions += 1
+        print('%-26s %5dx %6.2fx%s' % (row['callback'], row['scale'], ratio, flag))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the figure callbacks on synthetic data.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--only', nargs='+', default=[], help='callback names to run')
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--compare', help='earlier --output to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='slowdown ratio counted as a regression (default 1.2)')
+    options = parser.parse_args()
+
+    results, loads = [], []
+    for scale in options.scales:
+        print('scale %dx...' % scale, file=sys.stderr)
+        scale_results, scale_loads = run(scale, options.only)
+        results += scale_results
+        loads += scale_loads
+    summary = summarize(results)
+    report(summary, results, loads)
+
+    import dash
+    import pandas
+    import plotly
+    with open(options.output, 'w') as f:
+        json.dump({'created': datetime.datetime.now().isoformat(timespec='seconds'),
+                   'versions': {'python': platform.python_version(), 'pandas': pandas.__version__,
+                                'plotly': plotly.__version__, 'dash': dash.__version__},
+                   'scales': options.scales,
+                   'summary': summary, 'results': results, 'loads': loads}, f, indent=1)
+
+    if options.compare:
+        with open(options.compare) as f:
+            previous = json.load(f)
+        if compare(summary, previous, options.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Renders the static figures ahead of time, so the dashboard loads them from
+# the datastore cache instead of building them on its first page view.
+#
+#     python build_figures.py [name ...]
+#
+# With no names the Local Authority key indicator maps are built. The datasets
+# they share (LAdf and what it is read from) are built once here first, then
+# each figure is rendered in its own worker process; the cache entries are
+# keyed on the data, boundary and theme files they were made from, so running
+# this again only rebuilds figures whose inputs have changed.
+
+import concurrent.futures
+import os
+import sys
+import time
+
+import datastore
+import pages
+
+
+FIGURES = ('fig1', 'fig2', 'fig3', 'fig4', 'fig5', 'fig6', 'fig7')
+
+
+def build(name):
+    pages.register()
+    start = time.perf_counter()
+    datastore.get(name)
+    return name, time.perf_counter() - start
+
+
+def main(names):
+    # Workers building a shared dependency each would race on its cache files
+    pages.register()
+    start = time.perf_counter()
+    shared = sorted(datastore.upstream(names) - set(names))
+    for name in shared:
+        datastore.get(name)
+    print('%s: %.2fs' % (', '.join(shared) or 'no shared datasets', time.perf_counter() - start))
+
+    workers = min(len(names), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for name, seconds in pool.map(build, names):
+            print('%s: %.2fs' % (name, seconds))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or FIGURES)
@@ -0,0 +1,223 @@
+# Build the simplified LAD21 boundary files used by the choropleths.
+#
+#     python build_geometry.py
+#
+# Reads geometry.SOURCE and writes one GeoJSON per level in geometry.LEVELS,
+# plus lad21-bounds.json, into geometry.GEOMETRY_DIR, along with gzip (and
+# brotli) copies of each level for the server to send as they are. Features
+# get their IDs from the LA index (lad21-index.json, brought up to date
+# first). Rerun it whenever the boundary file is replaced.
+#
+# Simplification is done on shared arcs rather than on each polygon: every
+# ring is cut at the points where three or more districts meet, each piece
+# of boundary is simplified exactly once, and both neighbours reuse the same
+# result. That keeps the map free of slivers and overlaps at every level.
+
+import json
+import math
+import os
+import sys
+
+import authorities
+import compression
+import geometry
+
+
+KEEP_PROPERTIES = ('LAD21CD', 'LAD21NM')
+
+# Degrees of longitude are shorter than degrees of latitude this far north,
+# so distances are measured with longitudes scaled by cos(54 deg).
+LON_SCALE = math.cos(math.radians(54))
+
+
+## Reading
+
+def read_rings(path):
+    with open(path) as f:
+        collection = json.load(f)
+
+    features = []
+    for feature in collection['features']:
+        shape = feature['geometry']
+        polygons = shape['coordinates'] if shape['type'] == 'MultiPolygon' else [shape['coordinates']]
+        polygons = [[[(round(x, 6), round(y, 6)) for x, y, *_ in ring] for ring in polygon]
+                    for polygon in polygons]
+        properties = {key: feature['properties'][key] for key in KEEP_PROPERTIES
+                      if key in feature['properties']}
+        features.append((properties, polygons))
+    return features
+
+
+def open_ring(ring):
+    # Drop the closing point and any repeated consecutive points
+    points = [point for i, point in enumerate(ring) if i == 0 or point != ring[i - 1]]
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    return points
+
+
+## Topology
+
+def find_junctions(rings):
+    # A point is a junction when it is not always surrounded by the same two
+    # neighbours, i.e. where a shared boundary starts or ends.
+    neighbours = {}
+    junctions = set()
+    for ring in rings:
+        n = len(ring)
+        for i, point in enumerate(ring):
+            pair = frozenset((ring[i - 1], ring[(i + 1) % n]))
+            seen = neighbours.setdefault(point, pair)
+            if seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+def split_ring(ring, junctions):
+    # Cut a ring into arcs that start and end on junctions. Rings without
+    # any junction (islands, enclaves) become a single closed arc starting
+    # at their smallest point, so both sides of an enclave agree on it.
+    starts = [i for i, point in enumerate(ring) if point in junctions]
+    if not starts:
+        start = ring.index(min(ring))
+        return [ring[start:] + ring[:start + 1]]
+
+    rotated = ring[starts[0]:] + ring[:starts[0]]
+    arcs = []
+    current = [rotated[0]]
+    for point in rotated[1:]:
+        current.append(point)
+        if point in junctions:
+            arcs.append(current)
+            current = [point]
+    current.append(rotated[0])
+    arcs.append(current)
+    return arcs
+
+
+def canonical(arc):
+    # The same arc is met once in each direction; store it one way round
+    if (arc[0], arc[1]) <= (arc[-1], arc[-2]):
+        return tuple(arc), False
+    return tuple(reversed(arc)), True
+
+
+## Simplification
+
+def distance(point, start, end):
+    px, py = point[0] * LON_SCALE, point[1]
+    ax, ay = start[0] * LON_SCALE, start[1]
+    bx, by = end[0] * LON_SCALE, end[1]
+    dx, dy = bx - ax, by - ay
+    if dx == 0 and dy == 0:
+        return math.hypot(px - ax, py - ay)
+    t = max(0, min(1, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+def douglas_peucker(arc, tolerance):
+    keep = [False] * len(arc)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(arc) - 1)]
+    while stack:
+        first, last = stack.pop()
+        furthest, index = 0, None
+        for i in range(first + 1, last):
+            d = distance(arc[i], arc[first], arc[last])
+            if d > furthest:
+                furthest, index = d, i
+        if index is not None and furthest > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(arc, keep) if kept]
+
+
+def quantize(points, digits):
+    points = [(round(x, digits), round(y, digits)) for x, y in points]
+    return [point for i, point in enumerate(points) if i == 0 or point != points[i - 1]]
+
+
+## Levels
+
+def build_level(topology, tolerance, digits):
+    simplified = {}
+
+    def simplify(arc):
+        key, reverse = canonical(arc)
+        if key not in simplified:
+            simplified[key] = quantize(douglas_peucker(list(key), tolerance), digits)
+        points = simplified[key]
+        return points[::-1] if reverse else points
+
+    output = []
+    for properties, polygons in topology:
+        parts = []
+        for polygon in polygons:
+            rings = []
+            for arcs in polygon:
+                points = []
+                for arc in arcs:
+                    points.extend(simplify(arc)[1 if points else 0:])
+                # Rings smaller than the tolerance collapse to a line; drop them
+                if len(points) >= 4:
+                    rings.append([list(point) for point in points])
+                elif not rings:
+                    break
+            if rings:
+                parts.append(rings)
+
+        if not parts:
+            # Keep tiny districts visible rather than lose them altogether
+            outer = [point for arc in polygons[0][0] for point in arc[1:]]
+            parts = [[[list(point) for point in quantize(outer[-1:] + outer, digits)]]]
+        shape = ({'type': 'Polygon', 'coordinates': parts[0]} if len(parts) == 1 else
+                 {'type': 'MultiPolygon', 'coordinates': parts})
+        output.append({'type': 'Feature', 'properties': properties, 'geometry': shape})
+    return {'type': 'FeatureCollection', 'features': output}
+
+
+def bounds(rings):
+    xs = [x for ring in rings for x, _ in ring]
+    ys = [y for ring in rings for _, y in ring]
+    return {'lon': [min(xs), max(xs)], 'lat': [min(ys), max(ys)]}
+
+
+def write_json(path, value):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(value, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def main(source=geometry.SOURCE):
+    features = [(properties, [[ring for ring in map(open_ring, polygon) if len(ring) >= 3]
+                              for polygon in polygons])
+                for properties, polygons in read_rings(source)]
+    rings = [ring for _, polygons in features for polygon in polygons for ring in polygon]
+    junctions = find_junctions(rings)
+    topology = [(properties, [[split_ring(ring, junctions) for ring in polygon]
+                              for polygon in polygons if polygon])
+                for properties, polygons in features]
+
+    os.makedirs(geometry.GEOMETRY_DIR, exist_ok=True)
+    index = authorities.load(source, geometry.index_path())
+    for level, settings in geometry.LEVELS.items():
+        collection = authorities.with_ids(build_level(topology, settings['tolerance'], settings['digits']), index)
+        write_json(geometry.path(level), collection)
+        compression.precompress(geometry.path(level))
+        points = sum(len(ring) for feature in collection['features']
+                     for ring in _rings(feature['geometry']))
+        print('%-7s %8d points %9d bytes' % (level, points, os.path.getsize(geometry.path(level))))
+
+    write_json(geometry.bounds_path(), bounds(rings))
+
+
+def _rings(shape):
+    if shape['type'] == 'Polygon':
+        return shape['coordinates']
+    return [ring for polygon in shape['coordinates'] for ring in polygon]
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
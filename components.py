@@ -0,0 +1,210 @@
+# Components shared by every page: the interactivity toast, the navbar, the
+# home page and the page layout registry used by the pages package.
+
+import functools
+import inspect
+import json
+
+import dash_bootstrap_components as dbc
+from dash import dcc, html, Input, Output, callback
+from plotly.io.json import to_json_plotly
+
+import datastore
+
+
+# # 3. Define App Layout
+# 
+# This defines the global page layout across all pages. Individual page layout definitions are in later Step 4 onwards.
+
+# ##### 1. Defining toast component for interactivity pop-up
+
+# In[4]:
+
+
+toast = html.Div(
+    [
+        dbc.Button(
+            "Learn about interactivity",
+            id="positioned-toast-toggle",
+            color="primary",
+            n_clicks=0,
+        ),
+        dbc.Toast(
+            "Interact with charts whenever you hover, click-and-drag, or select points. Double-click items in legend to isolate in chart. Reset changes by clicking home icon on top right of plot. Plots are highly customisable and can be tweaked upon request. They can all be downloaded as png files or embedded via an iframe link.",
+            id="positioned-toast",
+            header="Interactivity",
+            is_open=False,
+            dismissable=True,
+            icon="danger",
+            # top: 66 positions the toast below the navbar
+            style={"position": "fixed", "top": 100, "right": 10, "width": 350},
+        ),
+    ]
+)
+
+
+@callback(
+    Output("positioned-toast", "is_open"),
+    [Input("positioned-toast-toggle", "n_clicks")],
+    prevent_initial_call=True,
+)
+def open_toast(n):
+    if n:
+        return True
+    return False
+
+
+# ##### 2. Defining navigation bar component
+
+# In[5]:
+
+
+ZEMO_LOGO = "https://transportandenergy.com/wp-content/uploads/2021/02/ZemoPartnership_Logo.png"
+
+navbar = dbc.Navbar(
+
+        [
+    html.A(
+        # Use row and col to control vertical alignment of logo / brand
+        dbc.Row(
+            [
+                dbc.Col(html.Img(src=ZEMO_LOGO, height="100px")),
+                dbc.Col(dbc.NavbarBrand('Data Monitoring Portal', class_name="mx-auto g-0 d-flex justify-content-center", style={'font-size':40})),
+            ],
+            align="center",
+            justify = "between"
+            #className="g-0",
+        ),
+        href='/page-content',
+    ),
+
+    dbc.Row([
+        dbc.Col([
+            toast
+        ], width =3),
+        dbc.Col(
+        [dbc.DropdownMenu(
+                children=[
+                    dbc.DropdownMenuItem('Emissions Data', href='/page-2'),
+                    dbc.DropdownMenuItem('Chargepoint Data', href='/page-3'),
+                    dbc.DropdownMenuItem('Vehicle Data', href='/page-4'),
+                    dbc.DropdownMenuItem('Local Authority Data', href='/page-5'),
+                    dbc.DropdownMenuItem('EVET Modelling Data', href='/page-6'),
+                    dbc.DropdownMenuItem('Grid Infrastructure Data', href='/page-7'),
+                    dbc.DropdownMenuItem('Other Zemo WG Data', href='/page-1'),
+                ],
+                align_end=True,
+                in_navbar=False,
+                #direction='start',
+                size='lg',
+                color="info",
+                label="Jump to Data Category",
+                        ),
+        ], width =3)
+            ],     
+    className="flex-nowrap mt-3 mt-md-0 me-3 ms-auto",
+    align="center")  
+        ],
+    color="primary",
+    dark=True,
+    sticky ='top'
+    
+)
+
+
+# # 4. Home page layout
+
+# In[8]:
+
+
+index_page = html.Div([
+    dbc.Row([
+        dbc.Col([
+            html.Div([
+    dcc.Markdown('''   
+    ### Welcome to the Data Monitoring portal (Beta) 
+    created, maintained and provided by [Zemo Partnership&apos;s Energy Infrastructure Working Group](https://www.zemo.org.uk/work-with-us/energy-infrastructure/working-group.htm)
+                 ''')], 
+                style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+               'backgroundColor':'#FFFFFF',
+               'border': 'thin lightgrey dashed', 
+                               'padding': '6px 0px 0px 8px'}),
+            html.Div([
+    dcc.Markdown('''
+    This web application provides a centralised repository for interactive data visualisations that monitor the electrification of transport and energy in the UK, as well as transparent and easy access to all the data sources used.
+
+    Built with Python, Dash, and deployed via HerokuApp, this application provides EIWG members with an in-depth look at the key indicators within the seven categories below. 
+
+    Questions, comments, or concerns? Feel free to reach out at meziane.benmaamar@zemo.org.uk!
+
+    NOTE: This app optimized for desktop use - A mobile layout will be released in the future.
+
+    _Last updated: September 30th, 2022_
+                 ''')
+            ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+               'backgroundColor':'#FFFFFF',
+               'border': 'thin lightgrey dashed', 
+                               'padding': '6px 0px 0px 8px'})
+                ], width = 7),
+
+    ]),
+    html.Div([
+    dbc.Row([
+    dbc.ButtonGroup([
+        dbc.Button('Emissions Data', href='/page-2', color="info", className="me-1"),    
+        dbc.Button('Chargepoint Data', href='/page-3', color="info", className="me-1"),
+        dbc.Button('Vehicle Data', href='/page-4', color="info", className="me-1"),
+        dbc.Button('Local Authority Data', href='/page-5', color="info", className="me-1"),
+        dbc.Button('EVET Modelling Data', href='/page-6', color="info", className="me-1"),
+        dbc.Button('Grid Infrastructure Data', href='/page-7', color="info", className="me-1"),
+        dbc.Button('Other Zemo WG Data', href='/page-1', color="dark", className="me-1")
+                    ]),  
+            ], className="g-0", justify = 'center',) 
+                    ]),
+    html.Div([
+    dbc.Row([
+        dbc.Col(
+            html.Div([
+            html.Iframe(src="https://www.zemo.org.uk/",
+            style={"height": "800px", "width": "100%", "max-width": "none"}),
+                    ], style= {'width': 'max'}), width='12'
+                )
+            ]) 
+                ])
+
+]),
+
+
+# In[48]:
+
+
+## Page layouts are registered through page_layout() with the path they are
+## served on. The layout is only built the first time the page is visited,
+## then kept as the plain dicts and lists of its JSON, so later visits skip
+## walking the component tree and Plotly's encoder. It isn't kept as bytes:
+## display_page returns it as a callback output and Dash encodes those
+## itself, which for plain data is a fast json/orjson pass. Graphs driven by a
+## callback carry the figure for their default dropdown values inline, and
+## those callbacks use prevent_initial_call, so a page view is one request.
+
+ROUTES = {}
+
+
+def page_layout(name, path, depends=(), figures=()):
+    # figures: the memoized figure functions the layout calls for its inline
+    # figures. Their datasets are added to depends, past the builder's own
+    # arguments, so the layout is rebuilt whenever one of them changes.
+    depends = tuple(depends)
+    for figure in figures:
+        depends += tuple(dataset for dataset in figure.depends if dataset not in depends)
+
+    def decorator(builder):
+        count = len(inspect.signature(builder).parameters)
+
+        @functools.wraps(builder)
+        def build(*args):
+            return json.loads(to_json_plotly(builder(*args[:count])))
+        datastore.register(name, depends=depends)(build)
+        ROUTES[path] = name
+        return builder
+    return decorator
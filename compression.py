@@ -0,0 +1,154 @@
+# gzip / brotli compression of the server's responses.
+#
+# install(app) compresses every text-like response of at least MIN_BYTES
+# with the best encoding the browser accepts (brotli when the brotli package
+# is installed, else gzip). Callback responses are mostly the same few
+# payloads over and over (cached figures, page layouts), so compressed
+# bodies are kept in memory keyed by a hash of the uncompressed bytes, up to
+# CACHE_BYTES per process: a repeat only costs the hash, not another
+# compression.
+#
+# Files that never change between deploys (the boundary GeoJSON) go through
+# send_file() below instead, which serves .br / .gz copies kept next to the
+# file. build_geometry.py writes them; otherwise the first request does.
+#
+# Dash's component bundles (_dash-component-suites) and /assets are
+# compressed like everything else; their bodies repeat too, so they come
+# out of the memory cache after the first request.
+
+import collections
+import gzip
+import hashlib
+import os
+import threading
+
+import flask
+
+import datastore
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', 1024))
+CACHE_BYTES = int(os.environ.get('COMPRESSION_CACHE_BYTES', 64 * 2 ** 20))
+
+TYPES = ('text/', 'application/json', 'application/javascript', 'application/geo+json',
+         'application/xml', 'image/svg+xml')
+
+# Per request: fast settings. For files compressed once: the smallest output.
+LEVELS = {'br': 5, 'gzip': 6}
+FILE_LEVELS = {'br': 11, 'gzip': 9}
+EXTENSIONS = {'br': '.br', 'gzip': '.gz'}
+
+_cache = collections.OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def compress(data, encoding, level=None):
+    if level is None:
+        level = LEVELS[encoding]
+    if encoding == 'br':
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def accepted(accept_encoding):
+    # Best encoding the client accepts, or None
+    qualities = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, parameters = part.partition(';')
+        quality = 1.0
+        if parameters.strip().startswith('q='):
+            try:
+                quality = float(parameters.strip()[2:])
+            except ValueError:
+                continue
+        qualities[name.strip().lower()] = quality
+    for encoding in ('br', 'gzip'):
+        if encoding == 'br' and brotli is None:
+            continue
+        if qualities.get(encoding, qualities.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def _cached(data, encoding):
+    global _cache_bytes
+    key = (hashlib.sha1(data).digest(), encoding)
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    body = compress(data, encoding)
+    if len(body) > CACHE_BYTES // 4:
+        return body
+    with _lock:
+        if key not in _cache:
+            _cache[key] = body
+            _cache_bytes += len(body)
+        while _cache_bytes > CACHE_BYTES:
+            _cache_bytes -= len(_cache.popitem(last=False)[1])
+    return body
+
+
+def install(app):
+    @app.server.after_request
+    def compress_response(response):
+        if not (response.mimetype or '').startswith(TYPES):
+            return response
+        response.vary.add('Accept-Encoding')
+        if (response.status_code != 200 or response.is_streamed and not response.direct_passthrough
+                or 'Content-Encoding' in response.headers or flask.request.method == 'HEAD'):
+            return response
+        encoding = accepted(flask.request.headers.get('Accept-Encoding'))
+        if encoding is None:
+            return response
+        if response.content_length is not None and response.content_length < MIN_BYTES:
+            return response
+
+        # send_file responses hand their file straight to the server; read it
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < MIN_BYTES:
+            return response
+        response.set_data(_cached(data, encoding))
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            # Same resource, different bytes
+            response.set_etag(etag, weak=True)
+        return response
+
+
+def send_file(path, mimetype, **kwargs):
+    # flask.send_file, from a precompressed copy when the client takes one
+    encoding = accepted(flask.request.headers.get('Accept-Encoding'))
+    if encoding is None or os.path.getsize(path) < MIN_BYTES:
+        response = flask.send_file(path, mimetype=mimetype, **kwargs)
+        response.vary.add('Accept-Encoding')
+        return response
+
+    response = flask.send_file(_precompressed(path, encoding), mimetype=mimetype, **kwargs)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def precompress(path):
+    # Write the .br / .gz copies now rather than on the first request
+    for encoding in EXTENSIONS:
+        if encoding != 'br' or brotli is not None:
+            _precompressed(path, encoding)
+
+
+def _precompressed(path, encoding):
+    compressed = path + EXTENSIONS[encoding]
+    if not os.path.exists(compressed) or os.path.getmtime(compressed) < os.path.getmtime(path):
+        with open(path, 'rb') as f:
+            datastore._atomic_write(compressed, compress(f.read(), encoding, FILE_LEVELS[encoding]))
+    return compressed
@@ -0,0 +1,533 @@
+# Lazy dataset registry for the dashboard.
+#
+# Every dataset, and everything derived from one (helper frames, figures,
+# page layouts), is declared once with @register and only built the first
+# time something asks for it with get(). Dependencies are named in the
+# declaration and handed to the loader as arguments, so opening /page-2 only
+# reads the two emissions CSVs instead of every file the app knows about.
+#
+# Datasets read from a source file, and derived frames registered with
+# cache=True, are also kept in a columnar on-disk cache (Arrow IPC files, or
+# pickles when pyarrow isn't installed). Cache entries are keyed on the
+# content hash of every source file they were built from plus the source
+# code of the loaders involved, so a restart only re-parses a CSV after the
+# file, or the cleaning code for it, has actually changed. The code includes
+# this repo's modules and functions a loader refers to (timeseries.py, a
+# helper next to it), as well as payload.py and its settings for the
+# datasets involved, since those shape the cached figure JSON. Files a loader
+# uses without reading them through the registry (boundary files, themes)
+# can be named with files= so they are part of the key too.
+#
+# Plotly figures registered with cache=True are stored as JSON (with the
+# compact arrays of payload.py) and come back as plain dicts, ready to hand
+# to dcc.Graph without touching Plotly.
+#
+# A source can also carry a schema, which is applied once while the CSV is
+# read so loaders and callbacks only ever see typed columns:
+#
+#     thousands  thousands separator handled by the C tokenizer, e.g. ','
+#     dtype      dtypes passed straight to read_csv
+#     dates      {column: strftime format}, None to let pandas infer it
+#     dayfirst   used for dates without an explicit format
+#     numeric    columns converted to float64
+#     scale      [(columns, factor)] applied after conversion, e.g. x100
+#
+# Columns are given by name, by positional slice (as in .iloc), or as a list
+# mixing both.
+#
+# watch() polls the source files in a background thread. When one changes,
+# only the datasets read from it and everything derived from them are
+# dropped; the ones that had been loaded are rebuilt into a new snapshot
+# which then replaces the old one in a single assignment. Requests running
+# meanwhile keep reading the previous snapshot without waiting for the
+# rebuild, while get() and fingerprint() on the reloading thread see the new
+# one, so figures a page layout draws inline are rebuilt from the new data.
+# Fingerprints (which double as dataset versions) move on with the files, so
+# figurecache entries for the old data stop being used.
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import logging
+import threading
+import time
+import types
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import payload
+
+
+CACHE_DIR = os.environ.get('DASHBOARD_CACHE_DIR', '.datacache')
+# Modules under here (outside an installed package) count as loader code
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Seconds between checks of the source files in watch(), 0 to not watch
+WATCH_INTERVAL = float(os.environ.get('DASHBOARD_WATCH_INTERVAL', 5))
+
+log = logging.getLogger(__name__)
+
+_loaders = {}
+_depends = {}
+_sources = {}
+_schemas = {}
+_files = {}
+_cached = set()
+_values = {}
+_fingerprints = {}
+
+# Re-entrant because loaders resolve their own dependencies through get()
+_lock = threading.RLock()
+# One reload at a time; the snapshot it is building is kept per thread
+_reload_lock = threading.Lock()
+_rebuilding = threading.local()
+
+# Called with the set of invalidated names after watch() swaps in a snapshot
+on_reload = []
+
+# Context manager factory wrapped around every build, given the dataset name
+# (set by profile_startup.py)
+tracer = None
+
+
+def register(name, depends=(), source=None, schema=None, cache=False, files=()):
+    def decorator(loader):
+        if name in _loaders:
+            raise ValueError('dataset %r is already registered' % name)
+        _loaders[name] = loader
+        _depends[name] = tuple(depends)
+        _files[name] = tuple(files)
+        if source is not None:
+            _sources[name] = source
+            _schemas[name] = schema or {}
+        if source is not None or cache:
+            _cached.add(name)
+        return loader
+    return decorator
+
+
+def source(name, path, schema=None):
+    # Dataset that is used exactly as it is read from disk
+    register(name, source=path, schema=schema)(lambda frame: frame)
+
+
+def get(name):
+    snapshot = getattr(_rebuilding, 'snapshot', None)
+    if snapshot is not None:
+        # Called from a loader that reload() is running
+        return _load(name, *snapshot)
+
+    try:
+        return _values[name]
+    except KeyError:
+        pass
+
+    if name not in _loaders:
+        raise KeyError('unknown dataset %r' % name)
+
+    with _lock:
+        # Another request may have loaded it while we waited for the lock
+        return _load(name, _values, _fingerprints)
+
+
+def loaded():
+    return sorted(_values)
+
+
+def upstream(names):
+    # names and every dataset they are derived from
+    found = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in found:
+            found.add(name)
+            pending.extend(_depends.get(name, ()))
+    return found
+
+
+def preload(names=None):
+    # Build everything up front, e.g. in the master of a pre-forking server
+    # so the workers share one copy. Failures are logged and left lazy.
+    for name in sorted(names or _loaders):
+        try:
+            get(name)
+        except Exception:
+            log.exception('preloading %s failed', name)
+
+
+def _load(name, values, fingerprints):
+    if name not in values:
+        if tracer is None:
+            values[name] = _build(name, values, fingerprints)
+        else:
+            with tracer(name):
+                values[name] = _build(name, values, fingerprints)
+    return values[name]
+
+
+def _build(name, values, fingerprints):
+    if name in _cached:
+        key = _fingerprint(name, fingerprints)
+        frame = _read_cache(name, key)
+        if frame is not None:
+            return frame
+
+    args = [_load(dependency, values, fingerprints) for dependency in _depends[name]]
+    if name in _sources:
+        args.insert(0, _read_source(_sources[name], _schemas[name]))
+    value = _loaders[name](*args)
+
+    if name in _cached and isinstance(value, pd.DataFrame):
+        _write_cache(name, key, value)
+    elif name in _cached and hasattr(value, 'to_plotly_json'):
+        # The same plain dict a later run reads back from the cache file
+        return (orjson or json).loads(_write_figure(name, key, value))
+    return value
+
+
+## Reloading
+
+def dependents(paths):
+    # Datasets read from any of paths, and everything derived from them
+    paths = {os.path.abspath(path) for path in paths}
+    stale = {name for name in _loaders
+             if os.path.abspath(_sources.get(name, '')) in paths
+             or paths.intersection(map(os.path.abspath, _files[name]))}
+    grew = True
+    while grew:
+        grew = False
+        for name in _loaders:
+            if name not in stale and stale.intersection(_depends[name]):
+                stale.add(name)
+                grew = True
+    return stale
+
+
+def reload(paths):
+    # Rebuild what was loaded from paths, then swap the new snapshot in.
+    # The rebuild doesn't hold _lock: loaders may take figurecache locks, which
+    # request threads hold while they call get().
+    global _values, _fingerprints
+    stale = dependents(paths)
+    with _reload_lock:
+        values = {name: value for name, value in _values.items() if name not in stale}
+        fingerprints = {name: key for name, key in _fingerprints.items() if name not in stale}
+        _rebuilding.snapshot = values, fingerprints
+        try:
+            for name in sorted(stale.intersection(_values)):
+                _load(name, values, fingerprints)
+        finally:
+            del _rebuilding.snapshot
+        with _lock:
+            # Keep what requests loaded into the old snapshot meanwhile
+            for name in set(_values) - stale - set(values):
+                values[name] = _values[name]
+            for name in set(_fingerprints) - stale - set(fingerprints):
+                fingerprints[name] = _fingerprints[name]
+            _values, _fingerprints = values, fingerprints
+    return stale
+
+
+def watched():
+    paths = set(_sources.values())
+    for files in _files.values():
+        paths.update(files)
+    return sorted(paths)
+
+
+def watch(interval=WATCH_INTERVAL):
+    def stamp(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll():
+        stamps = {path: stamp(path) for path in watched()}
+        while True:
+            time.sleep(interval)
+            # Sources registered since the last pass are picked up here
+            current = {path: stamp(path) for path in watched()}
+            changed = [path for path, now in current.items()
+                       if path in stamps and now != stamps[path] and now is not None]
+            stamps = current
+            if not changed:
+                continue
+            try:
+                stale = reload(changed)
+            except Exception:
+                # Keep serving the previous snapshot until the file is fixed
+                log.exception('reloading %s failed', ', '.join(changed))
+                continue
+            log.info('reloaded %s: %d datasets invalidated', ', '.join(changed), len(stale))
+            for hook in on_reload:
+                hook(stale)
+
+    thread = threading.Thread(target=poll, name='datastore-watch', daemon=True)
+    thread.start()
+    return thread
+
+
+def _read_source(path, schema):
+    if not path.endswith('.csv'):
+        with open(path) as f:
+            return json.load(f)
+
+    frame = pd.read_csv(path, thousands=schema.get('thousands'), dtype=schema.get('dtype'))
+
+    for column, date_format in schema.get('dates', {}).items():
+        if date_format is None:
+            frame[column] = pd.to_datetime(frame[column], dayfirst=schema.get('dayfirst', False))
+        else:
+            frame[column] = pd.to_datetime(frame[column], format=date_format)
+
+    numeric = _columns(frame, schema.get('numeric', []))
+    if numeric:
+        frame[numeric] = frame[numeric].astype('float64')
+
+    for columns, factor in schema.get('scale', []):
+        columns = _columns(frame, columns)
+        frame[columns] = frame[columns].astype('float64') * factor
+
+    return frame
+
+
+def _columns(frame, spec):
+    if isinstance(spec, str):
+        return [spec]
+    if isinstance(spec, slice):
+        return frame.columns[spec].tolist()
+    return [column for item in spec for column in _columns(frame, item)]
+
+
+## Cache keys
+
+def fingerprint(name):
+    snapshot = getattr(_rebuilding, 'snapshot', None)
+    return _fingerprint(name, _fingerprints if snapshot is None else snapshot[1])
+
+
+def _fingerprint(name, fingerprints):
+    try:
+        return fingerprints[name]
+    except KeyError:
+        pass
+
+    digest = hashlib.sha256()
+    digest.update(name.encode())
+    digest.update(code_version(_loaders[name]).encode())
+    digest.update(_payload_version(upstream([name])).encode())
+    if name in _sources:
+        digest.update(_file_hash(_sources[name]).encode())
+        digest.update(repr(sorted(_schemas[name].items())).encode())
+    for path in _files[name]:
+        digest.update(_file_hash(path).encode())
+    for dependency in _depends[name]:
+        digest.update(_fingerprint(dependency, fingerprints).encode())
+
+    fingerprints[name] = digest.hexdigest()
+    return fingerprints[name]
+
+
+def _loader_source(loader):
+    try:
+        return inspect.getsource(loader)
+    except (OSError, TypeError):
+        return loader.__code__.co_code.hex()
+
+
+_code_versions = {}
+_module_hashes = {}
+
+
+def code_version(function):
+    # Hash of function's source and of the repo's own code it refers to
+    try:
+        return _code_versions[function]
+    except KeyError:
+        pass
+    digest = hashlib.sha256()
+    functions, modules = [function], set()
+    seen = set()
+    while functions:
+        current = inspect.unwrap(functions.pop())
+        if current in seen:
+            continue
+        seen.add(current)
+        digest.update(_loader_source(current).encode())
+        namespace = getattr(current, '__globals__', {})
+        for referenced in _names(getattr(current, '__code__', None)):
+            value = namespace.get(referenced)
+            if isinstance(value, types.ModuleType):
+                modules.add(value)
+            elif isinstance(value, types.FunctionType) and _local(value.__code__.co_filename):
+                functions.append(value)
+    for module in sorted(_local_modules(modules), key=lambda module: module.__name__):
+        digest.update(_module_hash(module).encode())
+    _code_versions[function] = digest.hexdigest()
+    return _code_versions[function]
+
+
+def _names(code):
+    # Global names used by code, including its nested functions and lambdas
+    if code is None:
+        return set()
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= _names(constant)
+    return names
+
+
+def _local(path):
+    path = os.path.abspath(path or '')
+    return path.startswith(ROOT + os.sep) and 'site-packages' not in path
+
+
+def _local_modules(modules):
+    # The local ones among modules, and the local modules they import
+    found = set()
+    pending = [module for module in modules if _local(getattr(module, '__file__', None))]
+    while pending:
+        module = pending.pop()
+        if module not in found:
+            found.add(module)
+            pending.extend(value for value in vars(module).values()
+                           if isinstance(value, types.ModuleType) and _local(getattr(value, '__file__', None)))
+    return found
+
+
+def _module_hash(module):
+    if module.__name__ not in _module_hashes:
+        with open(module.__file__, 'rb') as f:
+            _module_hashes[module.__name__] = hashlib.sha256(f.read()).hexdigest()
+    return _module_hashes[module.__name__]
+
+
+def _payload_version(datasets):
+    # What payload.to_json makes of a figure built from datasets
+    return '%s %s %s' % (_module_hash(payload), payload.digits(datasets), payload.TYPED_ARRAYS)
+
+
+_hash_index = None
+# reload() hashes files without holding _lock
+_hash_lock = threading.Lock()
+
+
+def _file_hash(path):
+    with _hash_lock:
+        return _hashed(path)
+
+
+def _hashed(path):
+    # Hashing is only redone when the file's mtime or size has moved on
+    # since the last run; the result is remembered in sources.json.
+    global _hash_index
+    if _hash_index is None:
+        try:
+            with open(os.path.join(CACHE_DIR, 'sources.json')) as f:
+                _hash_index = json.load(f)
+        except (OSError, ValueError):
+            _hash_index = {}
+
+    stat = os.stat(path)
+    entry = _hash_index.get(os.path.abspath(path))
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        return entry['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+
+    _hash_index[os.path.abspath(path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                                          'sha256': digest.hexdigest()}
+    _atomic_write(os.path.join(CACHE_DIR, 'sources.json'),
+                  json.dumps(_hash_index, indent=1).encode())
+    return digest.hexdigest()
+
+
+## Columnar cache files
+
+def _cache_path(name, key, extension):
+    return os.path.join(CACHE_DIR, '%s-%s.%s' % (name, key[:16], extension))
+
+
+def _read_cache(name, key):
+    path = _cache_path(name, key, 'json')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return (orjson or json).loads(f.read())
+
+    path = _cache_path(name, key, 'arrow')
+    if pa is not None and os.path.exists(path):
+        # Numeric columns stay backed by the mapped file, so processes
+        # loading the same entry share its pages instead of each holding a copy
+        with pa.memory_map(path) as f:
+            return pa.ipc.open_file(f).read_all().to_pandas(split_blocks=True)
+
+    path = _cache_path(name, key, 'pkl')
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+    return None
+
+
+def _remove_stale(name, key):
+    # Dataset names never contain '-', so this only matches builds of name.
+    # Another process may be writing (or removing) the same entries.
+    if os.path.isdir(CACHE_DIR):
+        current = '%s-%s.' % (name, key[:16])
+        for stale in os.listdir(CACHE_DIR):
+            if stale.startswith(name + '-') and not stale.startswith(current) and not stale.endswith('.tmp'):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, stale))
+                except FileNotFoundError:
+                    pass
+
+
+def _write_figure(name, key, figure):
+    _remove_stale(name, key)
+    # Typed arrays, rounded as set for the datasets it is built from
+    blob = payload.to_json(figure, payload.digits(upstream([name]))).encode()
+    _atomic_write(_cache_path(name, key, 'json'), blob)
+    return blob
+
+
+def _write_cache(name, key, frame):
+    _remove_stale(name, key)
+
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(frame)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type object columns can't be stored as Arrow
+            table = None
+        if table is not None:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            _atomic_write(_cache_path(name, key, 'arrow'), sink.getvalue().to_pybytes())
+            return
+
+    _atomic_write(_cache_path(name, key, 'pkl'), pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _atomic_write(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
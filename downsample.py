@@ -0,0 +1,91 @@
+# Largest-Triangle-Three-Buckets downsampling for time series charts.
+#
+# Long series are sent to the browser at a fixed point budget per trace,
+# picked with LTTB so peaks and troughs survive. When a chart is zoomed in
+# (or a range selector button is pressed) its callback receives the new
+# x range through relayoutData and asks for the rows again: the overview is
+# kept at the same coarse budget, and the visible window gets a budget of
+# its own, so detail grows as the window shrinks while the payload stays
+# roughly constant however long the history gets.
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+from dash.exceptions import PreventUpdate
+
+
+POINTS = int(os.environ.get('DOWNSAMPLE_POINTS', 600))
+
+
+def lttb(x, y, budget):
+    # Indices of the points to keep, always including the first and last
+    n = len(x)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    edges = np.linspace(1, n - 1, budget - 1).astype(int)
+
+    keep = np.empty(budget, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    with warnings.catch_warnings():
+        # nanmean warns about all-missing buckets, which are expected here
+        warnings.simplefilter('ignore', RuntimeWarning)
+        for i in range(budget - 2):
+            start, end = edges[i], edges[i + 1]
+            following = slice(end, edges[i + 2] if i + 2 < len(edges) else n)
+            next_x, next_y = np.nanmean(x[following]), np.nanmean(y[following])
+            area = np.abs((x[a] - next_x) * (y[start:end] - y[a])
+                          - (x[a] - x[start:end]) * (next_y - y[a]))
+            # Missing values never win, unless the whole bucket is missing
+            a = start + int(np.argmax(np.nan_to_num(area, nan=-1)))
+            keep[i + 1] = a
+    return keep
+
+
+def rows(frame, x_column, y, x_range=None, budget=POINTS):
+    # Rows of frame to plot. y is the column (or a Series) whose shape is
+    # preserved; stacked charts pass their total so every trace shares rows.
+    if not frame[x_column].is_monotonic_increasing:
+        frame = frame.sort_values(x_column)
+    if isinstance(y, str):
+        y = frame[y]
+    else:
+        y = y.loc[frame.index]
+    x = _numeric(frame[x_column])
+    y = y.to_numpy(dtype='float64')
+
+    keep = lttb(x, y, budget)
+    if x_range is not None:
+        start, end = _numeric(pd.Series(x_range, dtype=frame[x_column].dtype))
+        window = np.flatnonzero((x >= start) & (x <= end))
+        if len(window):
+            # One point either side so lines run to the edge of the plot
+            window = np.arange(max(window[0] - 1, 0), min(window[-1] + 2, len(x)))
+            keep = np.union1d(keep, window[lttb(x[window], y[window], budget)])
+    return frame.iloc[keep]
+
+
+def x_range(relayout):
+    # Visible x window from a graph's relayoutData: (start, end), or None
+    # once the chart is zoomed all the way out. Events that don't move the
+    # x axis (autosize, legend clicks, y-only zoom) cancel the callback.
+    relayout = relayout or {}
+    if relayout.get('xaxis.autorange'):
+        return None
+    if 'xaxis.range[0]' in relayout and 'xaxis.range[1]' in relayout:
+        return relayout['xaxis.range[0]'], relayout['xaxis.range[1]']
+    if 'xaxis.range' in relayout:
+        return tuple(relayout['xaxis.range'])
+    raise PreventUpdate
+
+
+def _numeric(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ns]').astype('int64').astype('float64')
+    return values.to_numpy(dtype='float64')
+
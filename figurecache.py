@@ -0,0 +1,318 @@
+# Shared cache for figure-producing callbacks.
+#
+# Most dashboard callbacks map a handful of dropdown values onto a figure, so
+# the same few figures get rebuilt over and over for different users. With
+# @memoize the first request for a combination builds the figure as usual
+# and stores its serialized JSON; later requests for the same inputs and the
+# same dataset versions are answered from the cache without touching pandas
+# or Plotly's validators.
+#
+# Where the entries live is picked with FIGURE_CACHE_URL:
+#
+#     memory                     in-process LRU (default, one per worker)
+#     sqlite:///path/to/file     SQLite file shared by every worker on a host
+#     redis://host:6379/0        Redis, shared across hosts (needs redis-py)
+#
+# A miss is computed by one worker only: the others asking for the same key
+# wait on a lock and then read the stored result. Entries expire after
+# FIGURE_CACHE_TTL seconds (0 keeps them until evicted) and the least
+# recently used ones are dropped once the cache grows past MAX_BYTES. For
+# Redis the size limit is the server's maxmemory policy instead.
+
+import collections
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import datastore
+import payload
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+URL = os.environ.get('FIGURE_CACHE_URL', 'memory')
+MAX_BYTES = int(os.environ.get('FIGURE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+TTL = float(os.environ.get('FIGURE_CACHE_TTL', 0))
+
+# A worker that died mid-computation stops blocking the others after this
+LOCK_TIMEOUT = 60
+
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+_callback_stats = collections.defaultdict(lambda: {'hits': 0, 'misses': 0})
+_stats_lock = threading.Lock()
+
+
+def memoize(depends=(), unordered=()):
+    # depends:   datasets the figure is built from; their fingerprints are
+    #            part of the key so a changed source never serves stale figures
+    # unordered: multi-select arguments whose order doesn't affect the figure
+    def decorator(callback):
+        parameters = list(inspect.signature(callback).parameters)
+        unordered_positions = [parameters.index(name) for name in unordered]
+
+        @functools.wraps(callback)
+        def wrapper(*args):
+            key = _key(callback, args, unordered_positions, depends)
+            blob = backend.get(key)
+            outcome = 'hits'
+            if blob is None:
+                with backend.lock(key):
+                    # Someone else may have built it while we waited
+                    blob = backend.get(key)
+                    if blob is None:
+                        outcome = 'misses'
+                        blob = _encode(callback(*args), depends)
+                        _store(key, blob)
+            _count(callback.__name__, outcome)
+            return json.loads(blob)
+        # Read by components.page_layout for layouts drawing this inline
+        wrapper.depends = tuple(depends)
+        return wrapper
+    return decorator
+
+
+def uncached(memoized, *args):
+    # A memoized figure built without the cache (e.g. a zoomed-in window),
+    # in the same encoding the cached ones are sent in
+    return json.loads(_encode(memoized.__wrapped__(*args), memoized.depends))
+
+
+def _encode(figure, depends):
+    digits = payload.digits(datastore.upstream(depends))
+    return payload.to_json(figure, digits).encode()
+
+
+def _key(callback, args, unordered_positions, depends):
+    inputs = [sorted(arg) if i in unordered_positions and isinstance(arg, list) else arg
+              for i, arg in enumerate(args)]
+    versions = [datastore.fingerprint(dataset) for dataset in depends]
+    # Shared backends outlive deploys: the code and encoding settings count too
+    code = [datastore.code_version(callback), datastore._payload_version(datastore.upstream(depends))]
+    key = json.dumps([callback.__name__, inputs, versions, code], sort_keys=True, default=str)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _count(name, outcome):
+    # A request served by another request's build counts as a hit
+    with _stats_lock:
+        _stats[outcome] += 1
+        _callback_stats[name][outcome] += 1
+
+
+def _store(key, blob):
+    if len(blob) > MAX_BYTES:
+        return
+    evicted = backend.set(key, blob)
+    with _stats_lock:
+        _stats['evictions'] += evicted
+
+
+## Backends
+
+class MemoryBackend:
+    def __init__(self):
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # key: [lock, requests holding or waiting for it], for keys being built
+        self._flights = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            blob, stored = entry
+            if TTL and stored < time.time() - TTL:
+                del self._entries[key]
+                self._size -= len(blob)
+                return None
+            self._entries.move_to_end(key)
+            return blob
+
+    def set(self, key, blob):
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key)[0])
+            self._entries[key] = (blob, time.time())
+            self._size += len(blob)
+            while self._size > MAX_BYTES:
+                _, (old, _) = self._entries.popitem(last=False)
+                self._size -= len(old)
+                evicted += 1
+        return evicted
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        # One lock per key, so a figure built from another memoized figure
+        # never waits on itself and unrelated builds run side by side
+        with self._lock:
+            flight = self._flights.setdefault(key, [threading.Lock(), 0])
+            flight[1] += 1
+        try:
+            with flight[0]:
+                yield
+        finally:
+            with self._lock:
+                flight[1] -= 1
+                if not flight[1]:
+                    del self._flights[key]
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._size}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SQLiteBackend:
+    # Hits only refresh the LRU timestamp once it is this old, so reads
+    # don't turn into a write per request
+    TOUCH_AFTER = 60
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _db(self):
+        # One connection per thread, and never one inherited from the master
+        db = getattr(self._local, 'db', None)
+        if db is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute('CREATE TABLE IF NOT EXISTS figures'
+                       ' (key TEXT PRIMARY KEY, blob BLOB, size INTEGER, stored REAL, used REAL)')
+            db.execute('CREATE INDEX IF NOT EXISTS figures_used ON figures (used)')
+            db.execute('CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, expires REAL)')
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def get(self, key):
+        db = self._db()
+        row = db.execute('SELECT blob, stored, used FROM figures WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        blob, stored, used = row
+        now = time.time()
+        if TTL and stored < now - TTL:
+            db.execute('DELETE FROM figures WHERE key = ?', (key,))
+            return None
+        if used < now - self.TOUCH_AFTER:
+            db.execute('UPDATE figures SET used = ? WHERE key = ?', (now, key))
+        return bytes(blob)
+
+    def set(self, key, blob):
+        db = self._db()
+        now = time.time()
+        with db:
+            db.execute('BEGIN IMMEDIATE')
+            db.execute('INSERT OR REPLACE INTO figures VALUES (?, ?, ?, ?, ?)',
+                       (key, blob, len(blob), now, now))
+            evicted = 0
+            if TTL:
+                evicted += db.execute('DELETE FROM figures WHERE stored < ?', (now - TTL,)).rowcount
+            excess = db.execute('SELECT TOTAL(size) FROM figures').fetchone()[0] - MAX_BYTES
+            if excess > 0:
+                oldest = []
+                for old, size in db.execute('SELECT key, size FROM figures ORDER BY used'):
+                    if excess <= 0:
+                        break
+                    oldest.append((old,))
+                    excess -= size
+                db.executemany('DELETE FROM figures WHERE key = ?', oldest)
+                evicted += len(oldest)
+        return evicted
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        db = self._db()
+        while True:
+            now = time.time()
+            db.execute('DELETE FROM locks WHERE key = ? AND expires < ?', (key, now))
+            if db.execute('INSERT OR IGNORE INTO locks VALUES (?, ?)',
+                          (key, now + LOCK_TIMEOUT)).rowcount:
+                break
+            time.sleep(0.05)
+        try:
+            yield
+        finally:
+            db.execute('DELETE FROM locks WHERE key = ?', (key,))
+
+    def stats(self):
+        entries, size = self._db().execute('SELECT COUNT(*), TOTAL(size) FROM figures').fetchone()
+        return {'entries': entries, 'bytes': int(size), 'path': self.path}
+
+    def clear(self):
+        self._db().execute('DELETE FROM figures')
+
+
+class RedisBackend:
+    PREFIX = 'figurecache:figure:'
+    LOCK_PREFIX = 'figurecache:lock:'
+
+    def __init__(self, url):
+        if redis is None:
+            raise RuntimeError('FIGURE_CACHE_URL=%s needs the redis package' % url)
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        return self.client.get(self.PREFIX + key)
+
+    def set(self, key, blob):
+        self.client.set(self.PREFIX + key, blob, ex=int(TTL) or None)
+        return 0
+
+    def lock(self, key):
+        return self.client.lock(self.LOCK_PREFIX + key, timeout=LOCK_TIMEOUT)
+
+    def stats(self):
+        return {'entries': sum(1 for _ in self.client.scan_iter(self.PREFIX + '*'))}
+
+    def clear(self):
+        for key in self.client.scan_iter(self.PREFIX + '*'):
+            self.client.delete(key)
+
+
+def _backend(url):
+    if url == 'memory':
+        return MemoryBackend()
+    if url.startswith('sqlite:///'):
+        return SQLiteBackend(url[len('sqlite:///'):])
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisBackend(url)
+    raise ValueError('unsupported FIGURE_CACHE_URL %r' % url)
+
+
+backend = _backend(URL)
+
+
+def stats():
+    with _stats_lock:
+        lookups = _stats['hits'] + _stats['misses']
+        counts = dict(_stats,
+                      hit_rate=_stats['hits'] / lookups if lookups else None,
+                      max_bytes=MAX_BYTES,
+                      ttl=TTL,
+                      backend=type(backend).__name__,
+                      callbacks={name: dict(counts) for name, counts in _callback_stats.items()})
+    counts.update(backend.stats())
+    return counts
+
+
+def clear():
+    backend.clear()
@@ -0,0 +1,116 @@
+# Local Authority District boundaries at several levels of detail.
+#
+# The full LAD21 boundary file is several MB and was embedded in every
+# choropleth. build_geometry.py turns it into simplified, coordinate-quantized
+# copies (one per entry in LEVELS) plus the precomputed map bounds, and this
+# module makes them available to the dashboard. Until the build has been run
+# the full file is used, so nothing breaks on a fresh checkout.
+#
+# Figures don't embed the boundaries: their geojson is a versioned URL served
+# by the route below, which the browser fetches once per level and then
+# keeps, so a choropleth update only carries locations and values. Every
+# feature served has its district's ID from the LA index (authorities.py)
+# as its id, which is what the choropleths' locations refer to.
+
+import json
+import os
+
+import flask
+
+import authorities
+import compression
+import datastore
+
+
+SOURCE = 'Local_Authority_Districts_(December_2021)_GB_BUC.geojson'
+GEOMETRY_DIR = os.environ.get('DASHBOARD_GEOMETRY_DIR', 'geometry')
+
+# Douglas-Peucker tolerance in degrees (of latitude) and decimal places kept
+# for each level. Neighbouring districts share every boundary arc, so any
+# level can be drawn without gaps or overlaps between them.
+LEVELS = {
+    'fine': dict(tolerance=0.0005, digits=4),
+    'medium': dict(tolerance=0.002, digits=3),
+    'coarse': dict(tolerance=0.008, digits=3),
+}
+
+
+def path(level):
+    # Named for the feature ids, so files from before they were added aren't used
+    return os.path.join(GEOMETRY_DIR, 'lad21-%s-ids.geojson' % level)
+
+
+def bounds_path():
+    return os.path.join(GEOMETRY_DIR, 'lad21-bounds.json')
+
+
+def index_path():
+    return os.path.join(GEOMETRY_DIR, 'lad21-index.json')
+
+
+def full_path():
+    # SOURCE with the feature ids, served until build_geometry.py has run
+    return os.path.join(GEOMETRY_DIR, 'lad21-full-ids.geojson')
+
+
+def dataset(level):
+    # Registry name of the boundaries to draw at this level
+    if os.path.exists(path(level)):
+        return 'LA_map2_' + level
+    return 'LA_map2'
+
+
+def files(level):
+    # Files a figure drawn at this level depends on, for datastore files=
+    drawn = [path(level) if os.path.exists(path(level)) else SOURCE]
+    if os.path.exists(bounds_path()):
+        drawn.append(bounds_path())
+    return tuple(drawn)
+
+
+def url(level):
+    # The version changes with the file, so it can be cached for good
+    return '/geometry/%s-%s.geojson' % (level, datastore.fingerprint(dataset(level))[:16])
+
+
+def send(level):
+    if level not in LEVELS:
+        flask.abort(404)
+    return compression.send_file(os.path.abspath(path(level) if os.path.exists(path(level)) else _full()),
+                                 mimetype='application/geo+json', max_age=365 * 24 * 3600)
+
+
+def _full():
+    if not os.path.exists(full_path()) or os.path.getmtime(full_path()) < os.path.getmtime(SOURCE):
+        collection = authorities.with_ids(datastore.get('LA_map2'), datastore.get('LA_index'))
+        datastore._atomic_write(full_path(), json.dumps(collection, separators=(',', ':')).encode())
+    return full_path()
+
+
+def geos():
+    # Keyword arguments for fig.update_geos() that frame Great Britain. The
+    # bounds are precomputed at build time, so the browser doesn't have to
+    # walk the whole GeoJSON for fitbounds="geojson" on every render.
+    try:
+        bounds = datastore.get('LA_map2_bounds')
+    except KeyError:
+        return dict(fitbounds='geojson')
+    return dict(fitbounds=False,
+                lonaxis_range=bounds['lon'], lataxis_range=bounds['lat'],
+                center=dict(lon=sum(bounds['lon']) / 2, lat=sum(bounds['lat']) / 2))
+
+
+datastore.source('LA_map2', SOURCE)
+
+
+@datastore.register('LA_index', files=(SOURCE,))
+def load_LA_index():
+    return authorities.load(SOURCE, index_path())
+
+
+for _level in LEVELS:
+    if os.path.exists(path(_level)):
+        datastore.source('LA_map2_' + _level, path(_level))
+
+if os.path.exists(bounds_path()):
+    datastore.source('LA_map2_bounds', bounds_path())
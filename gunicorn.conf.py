@@ -0,0 +1,76 @@
+# Production settings, picked up automatically by
+#
+#     gunicorn ultimatedashboard_cleaned_ofgem:server
+#
+# The app is imported once in the master (preload_app) and every dataset,
+# figure and page layout is built there before the workers are forked, so
+# they start out sharing one copy of the data copy-on-write. gc.freeze()
+# moves those objects out of the collector's reach, so collections in the
+# workers don't write to (and unshare) the pages holding them. Anything a
+# worker still has to load itself comes from the memory-mapped Arrow cache,
+# whose pages the kernel shares between processes as well.
+#
+# Figure callbacks share one SQLite cache file unless FIGURE_CACHE_URL says
+# otherwise, so a figure built by one worker is reused by all of them.
+#
+# Callback metrics from every worker are collected in PROMETHEUS_MULTIPROC_DIR
+# so /metrics reports all of them, whichever worker answers the scrape.
+#
+# The master keeps watching the data files. After a reload it restarts the
+# workers gracefully (SIGHUP), so the new ones are forked from the updated
+# snapshot instead of each worker rebuilding its own.
+
+import gc
+import os
+import shutil
+import signal
+
+import datastore
+
+
+def _cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+os.environ.setdefault('FIGURE_CACHE_URL',
+                      'sqlite:///' + os.path.join(datastore.CACHE_DIR, 'figures.sqlite3'))
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(datastore.CACHE_DIR, 'metrics'))
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+bind = '0.0.0.0:%s' % os.environ.get('PORT', '3007')
+preload_app = True
+
+# Callbacks are CPU bound (pandas and figure building), so one worker per
+# core, with a couple of threads each to cover requests waiting on I/O.
+# WEB_CONCURRENCY overrides the worker count, as on Heroku.
+workers = int(os.environ.get('WEB_CONCURRENCY') or _cpus())
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+timeout = 120
+
+
+def on_starting(server):
+    # Samples left over from an earlier run would be added to this one's
+    shutil.rmtree(os.environ['PROMETHEUS_MULTIPROC_DIR'], ignore_errors=True)
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'])
+
+
+def when_ready(server):
+    datastore.preload()
+    datastore.on_reload.append(lambda stale: os.kill(os.getpid(), signal.SIGHUP))
+    server.log.info('preloaded %d datasets', len(datastore.loaded()))
+
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+
+def child_exit(server, worker):
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,159 @@
+# Prometheus metrics for the Dash callbacks, served on /metrics.
+#
+# install(app) wraps every server-side callback once Dash has registered
+# them, and records per callback (labelled with the function name):
+#
+#     dash_callback_seconds{phase}       compute (the callback itself),
+#                                        serialize (Dash's JSON encoding of
+#                                        its outputs) and total (the whole
+#                                        /_dash-update-component request)
+#     dash_callback_response_bytes       size of the response body sent
+#     dash_callback_calls_total{outcome} ok, prevented (PreventUpdate), error
+#     dash_callback_exceptions_total     errors by exception type
+#     dash_callback_distinct_inputs      distinct input/state combinations
+#                                        seen, i.e. how many figures a cache
+#                                        for it would have to hold
+#
+# Needs prometheus_client; without it nothing is installed. Under gunicorn
+# every worker writes its samples to PROMETHEUS_MULTIPROC_DIR (set up in
+# gunicorn.conf.py) and /metrics reports the sum over all of them.
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import flask
+import dash._callback
+from dash.exceptions import PreventUpdate
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+
+# Distinct input combinations remembered per callback
+MAX_DISTINCT_INPUTS = 10000
+
+log = logging.getLogger(__name__)
+
+_local = threading.local()
+_names = {}
+_inputs = {}
+_lock = threading.Lock()
+
+
+def install(app):
+    if prometheus_client is None:
+        log.warning('prometheus_client is not installed, /metrics is disabled')
+        return
+
+    global SECONDS, RESPONSE_BYTES, CALLS, EXCEPTIONS, DISTINCT_INPUTS
+    SECONDS = prometheus_client.Histogram(
+        'dash_callback_seconds', 'Time spent per callback request', ['callback', 'phase'],
+        buckets=(.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30))
+    RESPONSE_BYTES = prometheus_client.Histogram(
+        'dash_callback_response_bytes', 'Size of callback responses', ['callback'],
+        buckets=[2 ** power for power in range(8, 26, 2)])
+    CALLS = prometheus_client.Counter(
+        'dash_callback_calls', 'Callback invocations', ['callback', 'outcome'])
+    EXCEPTIONS = prometheus_client.Counter(
+        'dash_callback_exceptions', 'Exceptions raised by callbacks', ['callback', 'exception'])
+    DISTINCT_INPUTS = prometheus_client.Gauge(
+        'dash_callback_distinct_inputs', 'Distinct input combinations seen', ['callback'],
+        multiprocess_mode='max')
+
+    # Dash encodes callback outputs through this module-level name
+    dash._callback.to_json = _timed_to_json(dash._callback.to_json)
+
+    server = app.server
+
+    @server.before_request
+    def start_callback_request():
+        if not flask.request.path.endswith('_dash-update-component'):
+            return
+        # Dash's own before_request hook has merged @callback registrations
+        # into callback_map by now; wrap any we haven't seen yet
+        for key, entry in app.callback_map.items():
+            if 'callback' in entry and not getattr(entry['callback'], 'timed', False):
+                _names[key] = getattr(entry['callback'], '__name__', key)
+                entry['callback'] = _timed(_names[key], entry['callback'])
+
+        body = flask.request.get_json(silent=True) or {}
+        name = _names.get(body.get('output'))
+        if name is None:
+            return
+        flask.g.callback_name = name
+        flask.g.callback_start = time.perf_counter()
+        _count_inputs(name, [body.get('inputs'), body.get('state')])
+
+    @server.after_request
+    def finish_callback_request(response):
+        name = flask.g.pop('callback_name', None)
+        if name is not None:
+            SECONDS.labels(name, 'total').observe(time.perf_counter() - flask.g.callback_start)
+            if not response.is_streamed:
+                RESPONSE_BYTES.labels(name).observe(len(response.get_data()))
+        return response
+
+    @server.route('/metrics')
+    def metrics():
+        registry = prometheus_client.REGISTRY
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            registry = prometheus_client.CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return flask.Response(prometheus_client.generate_latest(registry),
+                              mimetype=prometheus_client.CONTENT_TYPE_LATEST)
+
+
+def _timed(name, callback):
+    @functools.wraps(callback)
+    def timed(*args, **kwargs):
+        _local.serialize = 0.0
+        _local.timing = True
+        start = time.perf_counter()
+        try:
+            result = callback(*args, **kwargs)
+        except PreventUpdate:
+            CALLS.labels(name, 'prevented').inc()
+            raise
+        except Exception as error:
+            CALLS.labels(name, 'error').inc()
+            EXCEPTIONS.labels(name, type(error).__name__).inc()
+            raise
+        finally:
+            _local.timing = False
+            elapsed = time.perf_counter() - start
+            SECONDS.labels(name, 'compute').observe(elapsed - _local.serialize)
+            SECONDS.labels(name, 'serialize').observe(_local.serialize)
+        CALLS.labels(name, 'ok').inc()
+        return result
+    timed.timed = True
+    return timed
+
+
+def _timed_to_json(to_json):
+    @functools.wraps(to_json)
+    def timed_to_json(obj):
+        if not getattr(_local, 'timing', False):
+            return to_json(obj)
+        start = time.perf_counter()
+        try:
+            return to_json(obj)
+        finally:
+            _local.serialize += time.perf_counter() - start
+    return timed_to_json
+
+
+def _count_inputs(name, values):
+    digest = hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode()).digest()
+    with _lock:
+        seen = _inputs.setdefault(name, set())
+        if len(seen) < MAX_DISTINCT_INPUTS:
+            seen.add(digest)
+        DISTINCT_INPUTS.labels(name).set(len(seen))
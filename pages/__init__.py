@@ -0,0 +1,43 @@
+# One module per dashboard page. Each module registers its own datasets,
+# figures and callbacks, and its layout with components.page_layout(), at
+# import time. Registering is cheap: nothing is read or built until a page
+# is first visited. Dash needs every callback before the first request, so
+# the app calls register() up front, which imports every module in PAGES;
+# add new pages to that list.
+#
+# # 5. All Data & Visualisations
+# 
+# This section processes data and visualisations across the active pages.
+# 
+# 1. Other Zemo WG Data
+# 2. Emissions Data
+# 3. Chargepoint Data
+# 4. Vehicle Data
+# 5. Local Authority Data
+# 6. EVET Modelling Data**
+# 7. Grid Infrastructure Data**
+# 
+# ** These data is handled separately in Section 5 (Page Layout Definitions) tentatively as data is still stored in Plotly Studio (i.e. referenced via iframes rather than direct processing here). To be transferred via code.
+
+# # 5. Page Layout Definitions
+# 
+# Each cell is page_x_layout
+# 
+# for x in:
+# 1. Other Zemo WG Data
+# 2. Emissions Data
+# 3. Chargepoint Data
+# 4. Vehicle Data
+# 5. Local Authority Data
+# 6. EVET Modelling Data
+# 7. Grid Infrastructure Data
+
+
+import importlib
+
+
+PAGES = ['other_wg', 'emissions', 'chargepoints', 'vehicles', 'local_authorities', 'evet', 'grid']
+
+
+def register():
+    return [importlib.import_module('pages.' + page) for page in PAGES]
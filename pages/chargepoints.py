@@ -0,0 +1,172 @@
+# /page-3: Chargepoint Data
+
+import plotly.graph_objs as go
+import dash_bootstrap_components as dbc
+from dash import dcc, html
+
+import datastore
+from components import navbar, page_layout
+from theme import zemo_template_spike, width_template
+
+
+# ## Chargepoint Data - Key Indicator
+
+# In[16]:
+
+
+@datastore.register('ZapMapPUBx', source='ZapMapPUBCP.csv',
+                    schema=dict(thousands=',', numeric=['slow', 'fast', 'Rapid', 'Ultra - Rapid', 'Total', 'Forecast']))
+def load_ZapMapPUBx(ZapMapPUB):
+    ZapMapPUB = ZapMapPUB.rename (columns = {'Unnamed: 0':'Year'}) 
+    ZapMapPUBx = ZapMapPUB[['slow', 'fast', 'Rapid', 'Ultra - Rapid', 'Total', 'Forecast']]
+
+    ZapMapPUBx = ZapMapPUBx.join(ZapMapPUB['Year'])
+    ZapMapPUBx['growthrate'] = ZapMapPUBx['Total'].pct_change()
+    return ZapMapPUBx
+
+
+# ### Various chargepoint and connector mixed charts
+
+# In[17]:
+
+
+@datastore.register('ZapMapfig', depends=('ZapMapPUBx',))
+def build_ZapMapfig(ZapMapPUBx):
+    layout = go.Layout()
+    ZapMapfig = go.Figure(layout=layout)
+
+    #ZapMapPUB['Rapid Devices'] = pd.to_numeric(ZapMapPUB['Rapid Devices'],errors='coerce')
+    #ZapMapPUB['Total  Devices'] = pd.to_numeric(ZapMapPUB['Total  Devices'],errors='coerce')
+
+
+    ZapMapfig.add_trace(go.Bar(x=ZapMapPUBx['Year'], y=ZapMapPUBx['slow'].dropna().astype(int), 
+                   name="Slow Devices (3-5kW)"))
+    ZapMapfig.add_trace(go.Bar(x=ZapMapPUBx['Year'], y=ZapMapPUBx['fast'].dropna().astype(int), 
+                   name="Fast Devices (7-22kW)"))  
+    ZapMapfig.add_trace(go.Bar(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Rapid'].dropna().astype(int), 
+                   name="Rapid Devices (25-99kW)"))  
+    ZapMapfig.add_trace(go.Bar(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Ultra - Rapid'].dropna().astype(int), 
+                   name="Ultra-Rapid Devices (100kW+)"))  
+
+    ZapMapfig.add_trace(go.Line(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Total'].dropna().astype(int)
+                 , name="Total Chargepoint Devices"))
+
+    ZapMapfig.update_layout(template = zemo_template_spike, title = 'U.K Public Chargepoints Numbers (Source: <a href="https://www.zap-map.com/statistics/#points">ZapMap, September 2022</a>)')
+
+    #ZapMapfig.update_layout(font=dict(family="Calibri", size=24), title = "U.K Public Chargepoints Numbers (Source: ZapMap)")
+    return ZapMapfig
+
+
+# In[18]:
+
+
+# Converting chargepoint data to datetime format for buttons
+date_format_3 = '%y-%b'
+
+datastore.source('rslt_df5', 'EVHS-WCSdata.csv',
+                 schema=dict(thousands=',', dates={'Date': date_format_3}, numeric=['Charging Devices Installed']))
+
+
+@datastore.register('EVHSdevices', depends=('rslt_df5',))
+def load_EVHSdevices(rslt_df5):
+    return rslt_df5['Charging Devices Installed']
+
+
+@datastore.register('UKprivateCP', depends=('rslt_df5', 'EVHSdevices'))
+def build_UKprivateCP(rslt_df5, EVHSdevices):
+    layout = go.Layout(
+    )
+    UKprivateCP = go.Figure(layout=layout)
+    #UKprivateCP.update_layout(xaxis=dict(
+    #    rangeselector=dict(
+    #            buttons=list([
+    #                dict(count=1, label="1m", step="month", stepmode="backward"),
+    #                dict(count=6, label="6m", step="month", stepmode="backward"),
+    #                dict(count=1, label="YTD", step="year", stepmode="todate"),
+    #                dict(count=1, label="1y", step="year", stepmode="backward"),
+    #                dict(step="all")])),
+    #    rangeslider=dict(visible=True),
+    #    type="date"
+    #))
+
+
+
+    UKprivateCP.add_trace(go.Bar(x=rslt_df5['Date'], y=rslt_df5['Sockets installed'].fillna(0).astype(int).cumsum(),name="WCS Sockets installed"))                 
+
+    UKprivateCP.add_trace(go.Bar(x=rslt_df5['Date'], y=EVHSdevices.head(-1).cumsum(), name="EVHS Charging Devices Installed"))
+
+
+    UKprivateCP.update_yaxes(rangemode="tozero")
+    UKprivateCP.update_layout(barmode = 'stack')
+
+    UKprivateCP.update_layout(template = zemo_template_spike, title = 'U.K Private Chargepoints installed via EVHS and WCS grants (Source: <a href="https://www.gov.uk/government/statistics/electric-vehicle-charging-device-grant-scheme-statistics-january-2022/electric-vehicle-charging-device-grant-scheme-statistics-january-2022#annex-a-evhs-and-wcs-regional-table">DfT, July 2022</a>)')
+    return UKprivateCP
+
+
+# In[19]:
+
+
+datastore.source('connectionTypes', 'connectionTypes.csv')
+
+
+@datastore.register('connectorType', depends=('connectionTypes',))
+def build_connectorType(connectionTypes):
+    layout = go.Layout()
+
+    connectorType = go.Figure(layout=layout)
+
+    connectorType.add_trace(go.Bar(x=connectionTypes['Year'], y=connectionTypes['CHAdeMO'], 
+                   name="CHAdeMO"))                 
+
+    connectorType.add_trace(go.Bar(x=connectionTypes['Year'], y=connectionTypes['CCS']
+                 , name="CCS"))
+
+    connectorType.add_trace(go.Bar(x=connectionTypes['Year'], y=connectionTypes['Type 2']
+                 , name="Type 2"))
+
+    connectorType.add_trace(go.Bar(x=connectionTypes['Year'], y=connectionTypes['Tesla (type 2 & CC)']
+                 , name="Tesla (type 2 & CC)"))
+
+
+    connectorType.update_yaxes(rangemode="tozero")
+
+    connectorType.update_layout(template=zemo_template_spike, title = 'U.K Public Rapid Chargepoints Numbers by connection type (Source: <a href="https://www.zap-map.com/statistics/#points">ZapMap, September 2022</a>)')
+    return connectorType
+
+
+# In[52]:
+
+
+@page_layout('page_3_layout', '/page-3', depends=('ZapMapfig', 'UKprivateCP', 'connectorType'))
+def build_page_3_layout(ZapMapfig, UKprivateCP, connectorType):
+    return html.Div([
+        navbar,
+        html.H1('Chargepoint Data', style={'textAlign': 'center'}),
+        html.Div(id='page-3-content'),
+        dcc.Markdown('''
+            **Public charging infrastructure across United Kingdom [DfT July 2022 statistics](https://www.gov.uk/government/statistics/electric-vehicle-charging-device-grant-scheme-statistics-july-2022)**      
+                    '''),
+        dbc.Row(dbc.Col(
+        html.Div(dcc.Graph(id = 'UKpubCP',
+                 figure = ZapMapfig,
+                 #style={'width': '800'},
+                 responsive = True), 
+                 #style={'display': 'inline-block'}
+                ), width = width_template)),
+        dbc.Row(dbc.Col(
+        html.Div(dcc.Graph(id = 'UKprivateCP',
+                 figure = UKprivateCP,
+                 #style={'width': '800'},
+                 responsive = True), 
+                 #style={'display': 'inline-block'}
+                ), width = width_template)),
+        dbc.Row(dbc.Col(
+        html.Div(dcc.Graph(id = 'connectortype',
+                 figure = connectorType,
+                 #style={'width': '800'},
+                 responsive = True), 
+                # style={'display': 'inline-block'}
+                ), width = width_template)),
+    ], 
+    #style={'width': '100%', 'display': 'inline-block'}
+    )
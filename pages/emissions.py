@@ -0,0 +1,108 @@
+# /page-2: Emissions Data
+
+import plotly.graph_objs as go
+from plotly.subplots import make_subplots
+import dash_bootstrap_components as dbc
+from dash import dcc, html
+
+import datastore
+from components import navbar, page_layout
+from theme import zemo_template, zemo_template_spike, width_template
+
+
+# ## Emissions Data - Key Indicator
+
+# ### Sub-sector stacked bar chart
+
+# In[14]:
+
+
+datastore.source('totEdata', 'totalemissions.csv')
+
+
+@datastore.register('transportemissions', depends=('totEdata',))
+def build_transportemissions(totEdata):
+    totElist = totEdata.columns.values.tolist()
+    totElist = totElist[1:]
+
+    layout = go.Layout()    
+    transportemissions = go.Figure(layout=layout)
+
+
+    transportemissions.add_trace(go.Line(x=totEdata['Year'], y=totEdata[totElist[0]], name=totElist[0]))
+
+    for sector in totElist[1:]:
+        transportemissions.add_trace(go.Bar(x=totEdata['Year'], y=totEdata[sector], name=sector))
+
+    transportemissions.update_yaxes(rangemode="tozero", title = 'MTCO<sub>2e</sub>')
+
+    transportemissions.update_layout(barmode = 'stack', template = zemo_template, title = 'Greenhouse gas emissions within transport sub-sectors, UK 1990-2020 (MtCO2e) (Source: <a href="https://www.gov.uk/government/statistics/final-uk-greenhouse-gas-emissions-national-statistics-1990-to-2020">BEIS, 2020</a>)')
+    return transportemissions
+
+
+# ### Sector subplots
+
+# In[15]:
+
+
+datastore.source('emissions', 'subsector_emissions.csv')
+
+
+@datastore.register('emissionsplot', depends=('emissions',))
+def build_emissionsplot(emissions):
+    emissionsplot = go.Figure()
+
+    emissionsplot = make_subplots(specs=[[{"secondary_y": True}]])
+
+    emissionsplot = make_subplots(rows = 2, cols = 2, subplot_titles=("Transport", "Residential", "Business", "Energy Supply"), print_grid=True)
+
+    emissionsplot.add_trace(go.Bar(x=emissions['Year'], y=emissions['Transport'], 
+                   name='Transport'), row=1, col=1)
+
+    emissionsplot.add_trace(go.Bar(x=emissions['Year'], y=emissions['Residential'], 
+                   name='Residential'), row=1, col=2)
+    emissionsplot.add_trace(go.Bar(x=emissions['Year'], y=emissions['Energy Supply'], 
+                   name='Energy Supply'), row=2, col=2)
+    emissionsplot.add_trace(go.Bar(x=emissions['Year'], y=emissions['Business'], 
+                   name='Business'), row=2, col=1)
+
+    emissionsplot.update_xaxes(rangemode="tozero", row=1, col=1&2)
+
+    emissionsplot.update_yaxes(title = 'MTCO<sub>2</sub>')
+
+    emissionsplot.update_layout(title = 'Territorial Carbon dioxide emissions by sector, UK 1990-2021 (MtCO<sub>2</sub>) (Source: <a href="https://www.gov.uk/government/statistics/provisional-uk-greenhouse-gas-emissions-national-statistics-2021">BEIS, 2021</a>)<br><sup>Top four most emitting sectors. 2021 data is provisional.</sup>', template = zemo_template_spike)
+    return emissionsplot
+
+
+# In[51]:
+
+
+@page_layout('page_2_layout', '/page-2', depends=('transportemissions', 'emissionsplot'))
+def build_page_2_layout(transportemissions, emissionsplot):
+    return html.Div([
+        navbar,
+        html.H1('Emissions Data', style={'textAlign': 'center'}),
+        html.Div(id='page-2-content'),
+
+        dbc.Row(
+                dbc.Col(
+                    html.Div(dcc.Graph(id = 'transport emissions',
+                figure = transportemissions,
+                responsive = True 
+                  #style={'display': 'inline-block'}
+                )),
+                    width= width_template,
+                )
+            ),
+        html.Br(),
+        dbc.Row(
+                dbc.Col(
+                    html.Div(dcc.Graph(id = 'sectoral emissions',
+                 figure = emissionsplot,
+                 responsive = True
+                 )),
+                    width= width_template,
+                )
+            ),
+
+    ])
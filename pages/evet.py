@@ -0,0 +1,316 @@
+# /page-6: EVET Modelling Data
+
+import plotly.graph_objs as go
+from plotly.subplots import make_subplots
+import dash_bootstrap_components as dbc
+from dash import dcc, html, Input, Output, callback
+
+import datastore
+import figurecache
+from components import navbar, page_layout
+from theme import zemo_template
+
+
+# ## EVET Modelling Data - Key Indicator
+
+# ### EVET parc sales pie chart
+
+# In[37]:
+
+
+@datastore.register('ESCpub', source='ESC_cp_numbers.csv')
+def load_ESCpub(ESCpub):
+    ESCpub['Year'] = ESCpub['Year'].astype(str)
+    return ESCpub
+
+
+@datastore.register('ESCpubheader', depends=('ESCpub',))
+def load_ESCpubheader(ESCpub):
+    return ESCpub.columns.tolist()
+
+
+datastore.source('ESCpri', 'ESC_home_cp.csv')
+
+
+@datastore.register('ESCparc', source='ESC_vehicle_parc.csv')
+def load_ESCparc(ESCparc):
+    ESCparc = ESCparc.T
+
+    ESCparc.columns = ESCparc.iloc[0].astype(str)
+    ESCparc = ESCparc.iloc[1: , :]
+
+    SMMT_data = [18350000, 13500000, 3150000, 0]
+
+    ESCparc['SMMT'] = SMMT_data
+    return ESCparc
+
+
+datastore.source('ESCsales', 'ESC_propofsales_powertrain.csv', schema=dict(scale=[(slice(1, -1), 100)]))
+
+
+datastore.source('ESCnewsales', 'ESC_new_sales_powertrain.csv')
+
+
+# In[41]:
+
+
+@datastore.register('ESCparcfig', depends=('ESCparc',))
+def build_ESCparcfig(ESCparc):
+    # Create subplots: use 'domain' type for Pie subplot
+    ESCparcfig = make_subplots(rows=1, cols=2, specs=[[{'type':'domain'}, {'type':'domain'}]])
+    ESCparcfig.add_trace(go.Pie(labels=ESCparc.index, values=ESCparc['2030.0'], name="2030"),
+                  1, 1)
+    ESCparcfig.add_trace(go.Pie(labels=ESCparc.index, values=ESCparc['2035.0'], name="2035"),
+                  1, 2)
+
+    # Use `hole` to create a donut-like pie chart
+    ESCparcfig.update_traces(hole=.4, hoverinfo="label+value+name")
+
+    ESCparcfig.update_layout(template = zemo_template,
+        title_text="Vehicle parc split by powertrain, EVET central case modelling",
+        # Add annotations in the center of the donut pies.
+        annotations=[dict(text='2030', x=0.19, y=0.5, font_size=20, showarrow=False),
+                     dict(text='2035', x=0.81, y=0.5, font_size=20, showarrow=False)])
+    #ESCparcfig.show()
+    return ESCparcfig
+
+
+# In[60]:
+
+
+ESCsales_chart_types = ['Total sales', 'New sales', 'Parc 2030 and 2035']
+
+ESCsales_vehicle_types = ['Car', 'Van']
+
+
+
+# In[61]:
+
+
+##Unused plotly chart studio charts for modelling graphs
+
+# dcc.Markdown('''
+# 2.5 million BEV cars will need to be sold per year in the UK by 2030; a rate 13 times greater than the
+# record-breaking levels seen in 2021, consuming as much as 7% of forecast global BEV car
+# production.
+# '''),
+# html.Div([
+# html.Iframe(src="https://plotly.com/~Mezo/192/?showlink=false ",
+#             style={"height": "800px", "width": "100%", "max-width": "none"}),
+#         ], style = style_template),
+# html.Br(),
+# html.Div([
+# html.Iframe(src="https://plotly.com/~Mezo/198/",
+#             style={"height": "800px", "width": "100%", "max-width": "none"}),
+#         ], style = style_template),
+# html.Br(),
+# html.Div([
+# html.Iframe(src="https://plotly.com/~Mezo/184/",
+#             style={"height": "800px", "width": "100%", "max-width": "none"}), 
+#         ], style = style_template),
+
+
+# ### Interactive EVET chargepoint modelling visualisation
+
+# In[63]:
+
+
+@callback(Output('ESC-pub', 'figure'), 
+              [Input('projection_checklist', 'value')],
+              prevent_initial_call=True)
+
+
+@figurecache.memoize(depends=('ESCpub', 'ESCpri', 'ESCpubheader', 'ZapMapPUBx', 'rslt_df5', 'EVHSdevices'))
+def updateESCpub(projection_checklist):
+    ESCpub = datastore.get('ESCpub')
+    ESCpri = datastore.get('ESCpri')
+    ESCpubheader = datastore.get('ESCpubheader')
+    ZapMapPUBx = datastore.get('ZapMapPUBx')
+    rslt_df5 = datastore.get('rslt_df5')
+    EVHSdevices = datastore.get('EVHSdevices')
+    layout = go.Layout()
+
+    figESCpub = go.Figure(layout=layout)
+
+    if projection_checklist == 'central_case':
+        for x in ESCpubheader[1:5]:
+            figESCpub.add_trace(go.Scatter(x=ESCpub['Year'].iloc[2:], y=ESCpub[x], name=x, fill='tonexty', mode= 'none', stackgroup = 'one'))
+        figESCpub.add_trace(go.Scatter(x=ESCpub['Year'].iloc[2:], y=ESCpub['Total Public Chargepoints'], name='<b>Taskforce Projection (Central case)</b>', mode= 'lines', line = dict(dash='dash', color = '#000000')))
+        figESCpub.add_trace(go.Line(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Total'].dropna().astype(int), name="Total Chargepoint Devices"))
+    
+    elif projection_checklist == 'home':
+        figESCpub.add_trace(go.Scatter(x=rslt_df5['Date'], y=EVHSdevices.head(-1).cumsum(), name="EVHS Charging Devices Installed", mode= 'lines'))
+        figESCpub.add_trace(go.Scatter(x=ESCpub['Year'].iloc[3:], y=ESCpri['Home Chargepoints'], name='<b>Taskforce Projection</b>', mode= 'lines', line = dict(dash='dash', color='#000000')))
+        figESCpub.update_xaxes(rangeselector = dict(
+                buttons=list([
+                                dict(count=15, label="2020-", step="year", stepmode="backward"),
+                                dict(step="all")])
+                                )),
+    elif projection_checklist == 'all_public':
+        figESCpub.add_trace(go.Scatter(x=ESCpub['Year'].iloc[2:], y=ESCpub['Total Public Chargepoints'], name='<b>Taskforce Projection (Central case)</b><sup>1</sup>', mode= 'lines', line = dict(dash='dash', color = '#000000')))
+        figESCpub.add_trace(go.Scatter(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Forecast'], name='<br><i>Linear projection based <br>on YoY installations TD</b>', mode= 'lines', line = dict(dash='dash')))
+        figESCpub.add_trace(go.Line(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Total'].dropna().astype(int), name="Total Chargepoint Devices"))
+    
+    else:
+        figESCpub.add_trace(go.Scatter(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Forecast'], name='<br><i>Linear projection based <br>on YoY installations 2016-</b>', mode= 'lines', line = dict(dash='dash')))
+        figESCpub.add_trace(go.Line(x=ZapMapPUBx['Year'], y=ZapMapPUBx['Total'].dropna().astype(int), name="Total Chargepoint Devices"))
+    
+    figESCpub.update_yaxes(rangemode="tozero", title = "Number of Chargepoints")
+    figESCpub.add_annotation(text='Zemo analysis based on <a href="https://evenergytaskforce.com/reports/ev-energy-taskforce-drivers-for-success-2035/">EVET modelling</a>, <a href="https://www.zap-map.com/statistics/#points">ZapMap</a> and <a href="https://www.gov.uk/government/statistics/electric-vehicle-charging-device-grant-scheme-statistics-january-2022/electric-vehicle-charging-device-grant-scheme-statistics-january-2022#annex-a-evhs-and-wcs-regional-table">DfT</a> reporting data',
+                  xref="paper", yref="paper",
+                  x=1, y=-0.25, showarrow=False),
+    
+    figESCpub.update_layout(template=zemo_template, 
+    title = '<sup>Central case: Scenario 2 (Mix of uptake for OSR and LRH) with Near Home charging user preferences updated based on ESC extended consumer engagement</sup>'
+#            xaxis=dict(
+#    autorange=True,
+#    range=["2012-10-31 18:36:37.3129", "2016-05-10 05:23:22.6871"],
+#    rangeslider=dict(
+#        autorange=True,
+#        range=["2012-10-31 18:36:37.3129", "2016-05-10 05:23:22.6871"]
+    #), type="date"
+                )
+
+    return figESCpub
+
+
+# ### Interactive EVET vehicles parc and sales modelling visualisation
+
+# In[65]:
+
+
+@callback(Output('ESCsales-fig', 'figure'), 
+              [Input('ESCsales-mode-picker', 'value'), Input('ESCsales-type-picker','value')],
+              prevent_initial_call=True)
+
+
+@figurecache.memoize(depends=('ESCsales', 'ESCnewsales', 'ESCparc'))
+def updateESCvehsales(ESCvehtype, sales_or_newsales):
+    ESCsales = datastore.get('ESCsales')
+    ESCnewsales = datastore.get('ESCnewsales')
+    ESCparc = datastore.get('ESCparc')
+    ESCsales_list = ESCsales.columns[1:-1]
+    ESCnewsales_list = ESCnewsales.columns[1:-1]
+    layout = go.Layout()
+
+    figESCveh = go.Figure(layout=layout)
+
+    figESCsales_data = ESCsales[ESCsales['Type'].isin(ESCvehtype.split())]
+    figESCnewsales_data = ESCnewsales[ESCnewsales['Type'].isin(ESCvehtype.split())]
+
+    if sales_or_newsales == 'Total sales':
+        for fueltype in ESCsales_list:
+            figESCveh.add_trace(go.Bar(x=figESCsales_data['Year'], y=figESCsales_data[fueltype], name=fueltype))
+            figESCveh.update_yaxes(rangemode="tozero", title = 'Percentage of Total sales', ticksuffix = '%')
+            figESCveh.update_layout(barmode = 'stack', template = zemo_template, title = 'EVET modelling, Total Vehicle sales')
+    
+    elif sales_or_newsales == 'Parc 2030 and 2035':
+        figESCveh = make_subplots(rows=1, cols=3, specs=[[{'type':'domain'}, {'type':'domain'}, {'type':'domain'}]])
+        figESCveh.add_trace(go.Pie(labels=ESCparc.index, values=ESCparc['2030.0'], name="2030", scalegroup='one', title = '<b>Taskforce modelling, 2030</b><br>Total: ~36,500,000'),
+                      1, 1)
+        figESCveh.add_trace(go.Pie(labels=ESCparc.index, values=ESCparc['2035.0'], name="2035", scalegroup='one', title = '<b>Taskforce modelling, 2035</b><br>Total: ~36,200,000'),
+                      1, 2)
+        figESCveh.add_trace(go.Pie(labels=ESCparc.index, values=ESCparc['SMMT'], name="2035", scalegroup='one', title = "<b>SMMT modelling, 2035<br><sup>('Other' from SMMT is assumed to be ICEVs)</sup></b><br>Total: ~35,000,000"),
+                      1, 3)
+        # Use `hole` to create a donut-like pie chart
+        figESCveh.update_traces(hole=0, hoverinfo="label+value+name",
+                                marker=dict(line=dict(color='#000000', width=1)))
+        figESCveh.update_layout(template = zemo_template,
+            title_text="Vehicle parc by powertrain, Taskforce modelling 2030 (LHS) vs. 2035 (Center) vs. SMMT modelling (RHS) ",
+            # Add annotations in the center of the donut pies.
+            #annotations=[dict(text='2030', x=0.2, y=0.5, font_size=20, showarrow=False),
+            #             dict(text='2035', x=0.8, y=0.5, font_size=20, showarrow=False)]
+                               )        
+    else:
+        for fueltype in ESCnewsales_list:
+            figESCveh.add_trace(go.Bar(x=figESCnewsales_data['Year'], y=figESCnewsales_data[fueltype], name=fueltype))
+            figESCveh.update_yaxes(rangemode="tozero", title = 'Total New sales (millions)')
+            figESCveh.update_layout(barmode = 'stack', template = zemo_template, title = 'EVET modelling, Total New sales (millions)')        
+
+    
+    
+    return figESCveh
+
+
+# In[66]:
+
+
+@page_layout('page_6_layout', '/page-6', depends=('ESCpub', 'ESCsales'),
+             figures=(updateESCpub, updateESCvehsales))
+def build_page_6_layout(ESCpub, ESCsales):
+    return html.Div([
+        navbar,
+        html.H1('EVET Modelling Data', style={'textAlign': 'center'}),
+        html.Div(id='page-6-content'),
+    dbc.Tabs([
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [
+        html.Div([
+        dcc.Markdown('''
+                In developing its [analysis](https://evenergytaskforce.com/reports/ev-energy-taskforce-drivers-for-success-2035/), the EV Energy Taskforce employed the Energy Systems Catapult’s latest transport focused
+                framework to model the interplay between zero emission vehicles, users and the energy system that
+                serves them. The analysis drew upon the collective know-how of the Taskforce’s wide range of stakeholders to
+                agree underlying assumptions and scrutinise the outputs.
+
+                The work describes outcomes consistent with the goals of the Sixth Carbon Budget. It is predicated on the
+                assumption that private sector investment is fundamental, that the preferences of consumers (both private
+                and commercial) are reflected, that provision is adequate to meet their needs and that whole system costs are
+                minimised. The analysis explored a range of cases and reflects possible conditions in a mature and balanced
+                market and provides some clear messages which should inform the development of government policy and
+                decisions about industry investment.
+        '''),
+        dcc.Markdown('''
+                In the central case **500,000** public chargepoints need to be deployed by 2035 – from fewer than
+                **35,000** in place today – to provide drivers with the confidence to buy electric vehicles and the means to
+                charge them.
+        '''),
+        dcc.Dropdown(id = 'projection_checklist', options = [
+            {'label': 'EV Energy Taskforce central case, Public chargepoints', 'value': 'central_case'},
+            {'label': 'EV Energy Taskforce central case, Home chargepoints', 'value':'home'},
+            {'label': 'Linear projection based on Y-o-Y installations 2016-TD', 'value':'linear'},
+            {'label': 'All public chargepoints', 'value':'all_public'},
+                            ], value = 'central_case'),
+        dcc.Graph(id = 'ESC-pub',
+                figure = updateESCpub('central_case'),
+                responsive = True
+                ),
+            ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                           'padding': '6px 0px 0px 8px'}),
+                ])), label = 'Chargepoint Visualisations'),
+    dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [    
+        html.Div([
+        dcc.Markdown('''
+                To meet the UK’s decarbonisation targets, annual BEV sales will need to reach 2.5 million by 2030. To put
+                this in context, Deloitte forecasts that global electric car production capacity will be 35 million units in 2030, 
+                so sales of electric cars in the UK would represent over 7% of global production capacity in that year.
+                By 2035, this could mean 26.8 million BEVs on the road, compared with 337,718 battery electric cars and
+                vans today.
+
+                From 2030 through 2035, the scale of the electrification of the vehicle parc will put pressure on the
+                automotive industry to deliver 18.5 million BEVs to enable their uptake.
+        '''),
+        dcc.Dropdown(id='ESCsales-type-picker', 
+                 options=[{'label': x, 'value': x} for x in ESCsales_chart_types],
+                 placeholder = 'Select chart type',
+                                    value= 'Total sales'),
+        dcc.Dropdown(id='ESCsales-mode-picker', 
+                 options=[{'label': x, 'value': x} for x in ESCsales_vehicle_types],
+                 placeholder = 'Select Cars/Vans',
+                                    value= 'Car'),
+        dcc.Graph(id = 'ESCsales-fig',
+                    figure = updateESCvehsales('Car', 'Total sales'),
+                    responsive = True
+                    ),
+
+                ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                           'padding': '6px 0px 0px 8px'})
+                ])), label = 'Vehicle Visualisations')
+
+
+    ], 
+    #style={'width': '100%', 'display': 'inline-block'}
+    )
+    ])
@@ -0,0 +1,378 @@
+# /page-7: Grid Infrastructure Data
+
+import plotly.graph_objs as go
+from plotly.subplots import make_subplots
+import dash_bootstrap_components as dbc
+from dash import dcc, html, Input, Output, callback
+
+import datastore
+import figurecache
+from components import navbar, page_layout
+from theme import zemo_template, zemo_template_spike, style_template, width_template
+
+
+# ## Grid Infrastructure Data - Key Indicator
+
+# ### WPD LCT data
+
+# In[42]:
+
+
+#an API may be possible here check out the new NGED portal
+
+
+@datastore.register('WPDLCTconnections', source='lct_con-4.csv', schema=dict(dates={'date': None}, dayfirst=True))
+def load_WPDLCTconnections(WPDLCTconnections):
+    WPDLCTconnections.sort_values(['date'], ascending=[False])
+
+
+
+    WPDLCTconnections['month_date'] = WPDLCTconnections['date'].dt.strftime('%b-%Y')
+    WPDLCTconnections['month_date']
+    #WPDLCTconnections = WPDLCTconnections.rename(columns = {'group_date':'Date'})
+    return WPDLCTconnections
+
+
+@datastore.register('wpd_LCT', depends=('WPDLCTconnections',), cache=True)
+def load_wpd_LCT(WPDLCTconnections):
+    wpd_LCT = WPDLCTconnections.groupby(['date']).sum()
+
+    wpd_LCT.sort_values(['date'], ascending=[True])
+
+    wpd_LCT.reset_index(inplace=True)
+    return wpd_LCT
+
+
+@datastore.register('WPDLCTenquiries', source='lct_enq-4.csv', schema=dict(dates={'date': None}, dayfirst=True))
+def load_WPDLCTenquiries(WPDLCTenquiries):
+    WPDLCTenquiries.sort_values(['date'], ascending=[False])
+
+
+
+    WPDLCTenquiries['month_date'] = WPDLCTenquiries['date'].dt.strftime('%b-%Y')
+    WPDLCTenquiries['month_date']
+    #WPDLCTenquiries = WPDLCTenquiries.rename(columns = {'group_date':'Date'})
+    return WPDLCTenquiries
+
+
+@datastore.register('wpd_LCT_enq', depends=('WPDLCTenquiries',), cache=True)
+def load_wpd_LCT_enq(WPDLCTenquiries):
+    wpd_LCT_enq = WPDLCTenquiries.groupby(['date']).sum()
+
+    wpd_LCT_enq.sort_values(['date'], ascending=[True])
+
+    wpd_LCT_enq.reset_index(inplace=True)
+    return wpd_LCT_enq
+
+
+@datastore.register('wpdLCTconnections', depends=('wpd_LCT', 'wpd_LCT_enq'))
+def build_wpdLCTconnections(wpd_LCT, wpd_LCT_enq):
+    layout = go.Layout()
+
+    wpdLCTconnections = go.Figure(layout=layout)
+
+
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT['date'], y=wpd_LCT['EV'].cumsum(), name="Electric Vehicle chargepoint"))
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT_enq['date'], y=wpd_LCT_enq['EV'].cumsum(), name="Electric Vehicle chargepoint enquiries", line=dict(width=2, dash = 'dash')))                 
+
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT['date'], y=wpd_LCT['HP'].cumsum(), name="Heat pump", visible='legendonly'))
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT_enq['date'], y=wpd_LCT_enq['HP'].cumsum(), name="Heat pump enquiries", line=dict(width=2, dash = 'dash'), visible='legendonly'))
+
+
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT['date'], y=wpd_LCT['PV'].cumsum(), name="PV generation", visible='legendonly'))
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT_enq['date'], y=wpd_LCT_enq['PV'].cumsum(), name="PV generation enquiries", line=dict(width=2, dash = 'dash'), visible='legendonly'))
+
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT['date'], y=wpd_LCT['ES'].cumsum(), name="Storage", visible='legendonly'))
+    wpdLCTconnections.add_trace(go.Scatter(x=wpd_LCT_enq['date'], y=wpd_LCT_enq['ES'].cumsum(), name="Storage enquiries", line=dict(width=2, dash = 'dash'), visible='legendonly'))
+
+
+    wpdLCTconnections.update_yaxes(rangemode="tozero", title = "Number of LCT connections and enquiries")
+
+    wpdLCTconnections.update_layout(template=zemo_template_spike, title = 'Number of connections per low carbon technology (LCT) on WPD networks from April 2017 to October 2022 (Source: <a href="https://connecteddata.westernpower.co.uk/dataset/lct-enquiries">NGED Connected Data Portal, October 2022</a>)')
+    return wpdLCTconnections
+
+
+#py.plot(wpdLCTconnections, filename = 'wpdLCTconnections', auto_open = False)
+
+
+# In[43]:
+
+
+#List for dcc.dropdown component in the layout 
+selected_connection_list = ['Budget Estimates Provided', 'Connection Offer Accepted', 'Connection Offer Not Accepted']
+
+
+# ### WPD Capacity data
+
+# In[44]:
+
+
+@datastore.register('WPDcapacity', source='new-connections-may-2022-update.csv')
+def load_WPDcapacity(WPDcapacity):
+    WPDcapacity = WPDcapacity.sort_values(by ='Connection Status')
+
+    WPDcapacity['Proposed Connection Voltage (kV)'] = WPDcapacity['Proposed Connection Voltage (kV)'].astype(str)
+    return WPDcapacity
+
+
+@datastore.register('WPDcapacity_status', depends=('WPDcapacity',))
+def load_WPDcapacity_status(WPDcapacity):
+    WPDcapacity2021 = WPDcapacity[WPDcapacity['year']==2021]
+    WPDcapacity2022 = WPDcapacity[WPDcapacity['year']==2022]
+
+
+
+    WPDcapacity2021_BEP = WPDcapacity2021[WPDcapacity2021['Connection Status']== 'Budget Estimates Provided']
+    WPDcapacity2022_BEP = WPDcapacity2022[WPDcapacity2022['Connection Status']== 'Budget Estimates Provided']
+
+    WPDcapacity2021_COA = WPDcapacity2021[WPDcapacity2021['Connection Status']== 'Connection Offer Accepted']
+    WPDcapacity2022_COA = WPDcapacity2022[WPDcapacity2022['Connection Status']== 'Connection Offer Accepted']
+
+    WPDcapacity2021_CNA = WPDcapacity2021[WPDcapacity2021['Connection Status']== 'Connection Offer Not Accepted']
+    WPDcapacity2022_CNA = WPDcapacity2022[WPDcapacity2022['Connection Status']== 'Connection Offer Not Accepted']
+
+    return {'2021_BEP': WPDcapacity2021_BEP, '2022_BEP': WPDcapacity2022_BEP,
+            '2021_COA': WPDcapacity2021_COA, '2022_COA': WPDcapacity2022_COA,
+            '2021_CNA': WPDcapacity2021_CNA, '2022_CNA': WPDcapacity2022_CNA}
+
+
+# ### Interactive WPD capacity visualisation
+
+# In[45]:
+
+
+# List for dcc.dropdown element in page layout 
+
+
+@datastore.register('WPDindicator_list', depends=('WPDcapacity',))
+def load_WPDindicator_list(WPDcapacity):
+    WPDindicator_list = WPDcapacity.columns
+    WPDindicator_list = WPDindicator_list[6:10]
+    return WPDindicator_list
+
+
+# ### ENA Flexibility market data
+
+# In[46]:
+
+
+datastore.source('rslt_df8', 'flexfigures_2022-23.csv')
+
+
+@datastore.register('industryflex', depends=('rslt_df8',))
+def build_industryflex(rslt_df8):
+    layout = go.Layout(
+            #height = 620, width = 750,
+            #margin=go.Margin(l=100),
+           )
+
+    industryflex = go.Figure(layout=layout)
+
+    industryflex = make_subplots(specs=[[{"secondary_y": True}]])
+
+    industryflex.add_trace(go.Bar(x=rslt_df8['Period'], y=rslt_df8['Sustain (MW)'],name="Sustain (MW)"))
+    industryflex.add_trace(go.Bar(x=rslt_df8['Period'], y=rslt_df8['Secure (MW)'], name="Secure (MW)"))
+    industryflex.add_trace(go.Bar(x=rslt_df8['Period'], y=rslt_df8['Restore (MW)'], name="Restore (MW)"))
+    industryflex.add_trace(go.Bar(x=rslt_df8['Period'], y=rslt_df8['Dynamic (MW)'], name="Dynamic (MW)"))
+    industryflex.add_trace(go.Bar(x=rslt_df8['Period'], y=rslt_df8['Reactive Power (MVAr)'], name="Reactive Power (MVAr)"))
+
+    # Change the bar mode
+    industryflex.update_layout(barmode='stack')
+
+
+    industryflex.add_trace(
+         go.Scatter(mode='markers', marker_color='black', marker_symbol='x', x=rslt_df8['Period'], 
+                    y=rslt_df8['Percentage of Total Tendered'], name="Percentage of Total Tendered (%)"),
+        secondary_y=True)
+
+    industryflex.update_yaxes(ticksuffix = "", 
+            title_text='Units of Flexibility (MW or MVar)', 
+            tickangle = 0,
+            title_font_size=18, 
+            color = 'rgb(82, 82, 82)',
+            #gridcolor='#444',
+            ticklabelmode = 'instant', secondary_y=False )
+
+    industryflex.update_yaxes(range=[0, 100], 
+                ticksuffix = "%", 
+                title = "Percentage of Tendered",
+                color = '#444',
+                secondary_y = True)
+    industryflex.update_layout(xaxis = dict(
+            showline=True,
+            showgrid=True,
+            showticklabels=True,
+            linewidth=1,
+            ticks='outside',
+            tickfont=dict(
+                #family='Poppins',
+                size=12,
+                color='#444'),
+          ),
+
+            yaxis = dict(
+            showline=True,
+            showgrid=True,
+            showticklabels=True,
+            linewidth=1,
+            ticks='outside',
+            tickfont=dict(
+                #family='Poppins',
+                size=12,
+                color='#444',)
+            ),
+
+            plot_bgcolor='White'
+                     )
+
+    industryflex.update_yaxes(rangemode="tozero")
+
+    industryflex.update_layout(template = zemo_template, title = 'Historic DNO Flexibility Contracted/Tendered (Source: <a href="https://www.energynetworks.org/industry-hub/resource-library/?search=ON22-WS1A-P0+Flexibility+Figures+2022%2F23&id=267">ENA 2022</a>)<br><sup>Change in reporting period reflects alignment with Ofgem SLC 31E- Flexibility statements reporting cycle</sup>')
+    return industryflex
+
+
+# ### Smart Meter data
+
+# In[47]:
+
+
+datastore.source('smartmeters', 'smfigures_06_2022.csv',
+                 schema=dict(thousands=',', dtype={'Smart in smart mode': 'int64', 'Smart in traditional mode': 'int64', 'Not-smart': 'int64'}))
+
+
+@datastore.register('smplot', depends=('smartmeters',))
+def build_smplot(smartmeters):
+    layout = go.Layout(
+            #margin=go.Margin(l=100),
+            title = " Smart Meter Uptake to date UK")
+    smplot = go.Figure(layout=layout)
+
+
+    smplot.add_trace(go.Bar(x = smartmeters['Quarter'], 
+                                         y = smartmeters['Smart in smart mode'], name="Smart in smart mode"))
+    smplot.add_trace(go.Bar(x = smartmeters['Quarter'], 
+                                         y = smartmeters['Smart in traditional mode'], name="Smart in traditional mode"))
+    smplot.add_trace(go.Bar(x = smartmeters['Quarter'], 
+                                         y = smartmeters['Not-smart'], name="Traditional"))
+
+    smplot.update_yaxes(title = 'Meters in operation')
+    smplot.update_layout(template=zemo_template_spike, barmode = 'stack', title = 'U.K Quarterly Domestic electricity meters operated by large energy suppliers (Source: <a href="https://www.gov.uk/government/statistics/smart-meters-in-great-britain-quarterly-update-june-2022">BEIS, 2022</a>)')
+    #smplot.layout.font.family = 'Poppins'
+    return smplot
+
+
+# ### Interactive WPD LCT connections visualisation
+
+# In[67]:
+
+
+#an API may be possible here
+
+@callback(Output('WPDcapacityfig-graph', 'figure'),
+              [Input('connection-picker', 'value'), Input('WPDindicator-picker', 'value')],
+              prevent_initial_call=True)
+
+
+@figurecache.memoize(depends=('WPDcapacity', 'WPDcapacity_status'))
+def update_cxtype(selected_connection, WPDindicator_selected):
+    WPDcapacity = datastore.get('WPDcapacity')
+    WPDcapacity_status = datastore.get('WPDcapacity_status')
+
+    layout = go.Layout()
+
+    xy=WPDcapacity.filter(regex=WPDindicator_selected)
+        
+    WPDindicator_list = xy.columns.values.tolist()
+
+    WPDcapacityfig = go.Figure(layout=layout)
+
+    if selected_connection == 'Budget Estimates Provided':
+        for cxtype in WPDindicator_list:
+            WPDcapacityfig.add_trace(go.Bar(x=WPDcapacity_status['2021_BEP']['Proposed Connection Voltage (kV)'], y=WPDcapacity_status['2021_BEP'][cxtype].cumsum(), name=cxtype + ' 2021', marker_opacity = 0.95))
+            WPDcapacityfig.add_trace(go.Bar(x=WPDcapacity_status['2022_BEP']['Proposed Connection Voltage (kV)'], y=WPDcapacity_status['2022_BEP'][cxtype].cumsum(), name=cxtype + ' May 2022', marker_color = '#007526', marker_opacity = 0.95))                 
+
+    elif selected_connection == 'Connection Offer Not Accepted':
+        for cxtype in WPDindicator_list:
+            WPDcapacityfig.add_trace(go.Bar(x=WPDcapacity_status['2021_CNA']['Proposed Connection Voltage (kV)'], y=WPDcapacity_status['2021_CNA'][cxtype].cumsum(), name=cxtype + ' 2021', marker_opacity = 0.95))
+            WPDcapacityfig.add_trace(go.Bar(x=WPDcapacity_status['2022_CNA']['Proposed Connection Voltage (kV)'], y=WPDcapacity_status['2022_CNA'][cxtype].cumsum(), name=cxtype + ' May 2022', marker_color = '#007526', marker_opacity = 0.95))                 
+
+    else:
+        for cxtype in WPDindicator_list:
+            WPDcapacityfig.add_trace(go.Bar(x=WPDcapacity_status['2021_COA']['Proposed Connection Voltage (kV)'], y=WPDcapacity_status['2021_COA'][cxtype].cumsum(), name=cxtype + ' 2021', marker_opacity = 0.95))
+            WPDcapacityfig.add_trace(go.Bar(x=WPDcapacity_status['2022_COA']['Proposed Connection Voltage (kV)'], y=WPDcapacity_status['2022_COA'][cxtype].cumsum(), name=cxtype + ' May 2022', marker_color = '#007526', marker_opacity = 0.95))                 
+
+
+    WPDcapacityfig.update_yaxes(rangemode="tozero", title = "Number of LCT connections and enquiries")
+    WPDcapacityfig.update_xaxes(type='category', title = "Grid Connection Voltage (kV)")
+
+    WPDcapacityfig.update_layout(template=zemo_template, title = 'Number of connections per low carbon technology (LCT) on WPD networks<br>from April 2017 to October 2022 (Source: <a href="https://connecteddata.westernpower.co.uk/dataset/lct-enquiries">NGED Connected Data Portal, October 2022</a>)')
+
+    return WPDcapacityfig
+#py.plot(wpdLCTconnections, filename = 'wpdLCTconnections', auto_open = False)#
+
+
+# In[68]:
+
+
+@page_layout('page_7_layout', '/page-7', depends=('wpdLCTconnections', 'industryflex', 'smplot', 'WPDindicator_list'),
+             figures=(update_cxtype,))
+def build_page_7_layout(wpdLCTconnections, industryflex, smplot, WPDindicator_list):
+    return html.Div([
+        navbar,
+        html.H1('Grid Infrastructure Data', style={'textAlign': 'center'}),
+        html.Div(id='page-7-content'),
+    dbc.Tabs([
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [ 
+        html.Div([
+        dbc.Row(dbc.Col(
+        dcc.Graph(id = 'wpdLCTconnections',
+                figure = wpdLCTconnections,
+                responsive = True,
+                style= style_template
+                ), width = width_template)),
+        dbc.Row(dbc.Col(
+        dcc.Graph(id = 'industryflex',
+                figure = industryflex,
+                responsive = True,
+                style= style_template
+                ), width = width_template)),
+        dbc.Row(dbc.Col(
+        dcc.Graph(id = 'smplot',
+                figure = smplot,
+                responsive = True,
+                style= style_template
+                ), width = width_template)),
+        dbc.Row(dbc.Col(
+        html.Iframe(src="https://plotly.com/~Mezo/85/?showlink=false ",
+                    style={"height": "800px", "width": "100%"}), width = width_template)),
+                ], style = style_template),
+            ]
+                    )
+                        ), label = 'External Local Authority Data Visualisation'),
+        dbc.Tab(dbc.Card(
+            dbc.CardBody(
+                [
+        html.Div([
+        dcc.Dropdown(
+            id='connection-picker',
+            options=[{'label': x, 'value': x} for x in selected_connection_list],
+            value='Budget Estimates Provided',
+            placeholder='Filter by connection status (default is Budget Estimates Provided)', multi=True, clearable=False),
+
+        dcc.Dropdown(
+            id='WPDindicator-picker',
+            options=[{'label': x, 'value': x} for x in WPDindicator_list],
+            value='Total Demand Capacity (MW)', placeholder='Filter by indicator (default is Total Demand Capacity (MW))', clearable=False),
+
+        dcc.Graph(id = 'WPDcapacityfig-graph',
+                figure = update_cxtype('Budget Estimates Provided', 'Total Demand Capacity (MW)'),
+                responsive = True, style = style_template
+                )
+        ], style = style_template),
+                ]
+                    )
+                        ), label = 'Internal National Grid ED (formerly WPD) grid connections monitoring', disabled=True)        
+    ])
+        ], style= {'background_color':'#001a70'})
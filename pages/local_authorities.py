@@ -0,0 +1,552 @@
+# /page-5: Local Authority Data
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import dash_bootstrap_components as dbc
+from dash import dcc, html, Input, Output, ClientsideFunction, callback, clientside_callback
+
+import authorities
+import datastore
+import figurecache
+import geometry
+import theme
+from components import navbar, page_layout
+from theme import theme_color_scale, zemo_template_choro
+
+
+# ## Local Authority Data - Key Indicator
+
+# In[25]:
+
+
+## Simplified boundaries sized for each map (run build_geometry.py to create them):
+## the side-by-side key indicator maps are small enough for the medium level,
+## the sectoral emissions map gets the fine one.
+LA_map_panel = 'medium'
+LA_map_large = 'fine'
+datastore.source('LAem', 'uk-local-authority-ghg-emissions-2020-dataset.csv')
+
+
+# In[26]:
+
+
+## Planning authority names are matched to the map through the LA index
+@datastore.register('LAdf', source='LACPpercapita_2022_q2.csv', depends=('LA_index',))
+def load_LAdf(LAdf, LA_index):
+    LAdf = LAdf.rename(columns = {'percapita':'Chargepoints per 100k people'})
+    LAdf = LAdf.rename(columns = {'percapita (excl. London)':'Chargepoints per 100k people (excl. London)'})
+    LAdf = LAdf.rename(columns = {'number':'Total Number of Public Chargepoints'})
+    LAdf = LAdf.rename(columns = {'rdpercapita':'Rapid Chargepoints per 100k people'})
+    LAdf = LAdf.rename(columns = {'number rd':'Total Number of Rapid Public Chargepoints'})
+    LAdf = LAdf.rename(columns = {'Recent quarterly growth rate (%)':'January-April Quarterly growth rate (%)'})
+
+
+
+    #df['Average quarterly growth rate (%)'] = df['Average quarterly growth rate (%)'].astype(float)
+    LAdf.round(2)
+
+    LAdf.drop(columns= LAdf.columns[-8:], inplace=True)
+
+    LAdf['Local Planning Authority'] = LAdf['name'].str.replace(r' LPA$', '', regex=True)
+    LAdf['LA id'] = authorities.ids(LA_index, LAdf['Local Planning Authority'], dataset='LAdf')
+    ## One polygon per district: drop old districts listed next to their merged one
+    return authorities.unique(LAdf, 'Local Planning Authority', dataset='LAdf')
+
+
+# In[27]:
+
+
+# Defining dropdown labels
+@datastore.register('sector_options', depends=('LAem',))
+def load_sector_options(LAem):
+    sector_options = []
+
+    for sector in LAem['LA GHG Sub-sector'].unique():
+        sector_options.append({'label': str(sector), 'value': sector})
+    return sector_options
+
+
+@datastore.register('region_options', depends=('LAem',))
+def load_region_options(LAem):
+    region_options = []
+
+    for region in LAem['Region'].unique():
+        region_options.append({'label': str(region), 'value': region})
+    return region_options
+'''  
+region_options2 = []
+for region2 in LAdf['Region'].unique():
+    region_options2.append({'label': str(region2), 'value': region2})
+
+cpstats_options = [{'label':'Chargepoints per 100k people' , 'value2':'Chargepoints per 100k people'}, 
+                   {'label':'Chargepoints per 100k people (excl. London)' , 'value2':'Chargepoints per 100k people (excl. London)'}, 
+                   {'label':'Total Number of Public Chargepoints' , 'value2':'Total Number of Public Chargepoints'}, 
+                   {'label':'Rapid Chargepoints per 100k people' , 'value2':'Rapid Chargepoints per 100k people'}, 
+                   {'label':'Total Number of Rapid Public Chargepoints' , 'value2':'Total Number of Rapid Public Chargepoints'}, 
+                   {'label':'Recent quarterly growth rate (%)', 'value2':'Recent quarterly growth rate (%)'},
+                   {'label':'January-April Quarterly growth rate (%)', 'value2':'January-April Quarterly growth rate (%)'}]
+'''  
+
+
+# In[28]:
+
+
+# Defining dropdown text in app layout
+markdown_text = '''### 
+The UK produces a breakdown of greenhouse gas emissions by Local Authority area as a subset of its annual inventory of greenhouse gas emissions. 
+The main data sources are the UK National Atmospheric Emissions Inventory and the BEIS National Statistics of energy consumption for local authority areas.
+Those emissions excluded are aviation, shipping and military transport for which there is no obvious basis for allocation to local areas.
+'''
+
+markdown_subtext = '''###
+The nationally available data sets for GHG begin in 2005. 
+- Prior to this period, the publication statistics covered emissions of carbon dioxide only. 
+- Shown here is the most recent data for the year __2020__ (last updated in June 2022).
+'''
+
+
+# ### Creating choropleth graphs for LA data
+
+# In[29]:
+
+
+## The key indicator maps only change with LAdf, the boundaries and the theme,
+## so they are kept on disk as JSON (build_figures.py renders them ahead of a
+## deploy) and later starts hand the stored dicts straight to dcc.Graph.
+LA_map_files = geometry.files(LA_map_panel) + (theme.__file__,)
+
+
+@datastore.register('fig1', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig1(LAdf):
+    fig1 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), 
+                        color="Total Number of Public Chargepoints",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator",
+                        color_continuous_scale=theme_color_scale, 
+                        hover_name = LAdf['Total Number of Public Chargepoints'], 
+                        #template = 'ggplot2', 
+                        basemap_visible = True,
+                        range_color = [1, 400],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Total number of Public chargepoints', 
+                      # height = 620, width = 900
+                        )
+    fig1.update_geos(visible=False, **geometry.geos())
+    fig1.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    fig1.update_coloraxes(colorbar_title_text="Number of public chargepoints", colorbar_tickprefix = ">", colorbar_showtickprefix = "last", colorbar_title_side = "right")
+
+    #fig1.layout.font.family = 'Poppins'
+    return fig1
+
+
+# In[30]:
+
+
+@datastore.register('fig2', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig2(LAdf):
+    fig2 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), color="Total Number of Rapid Public Chargepoints",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator", 
+                        color_continuous_scale=theme_color_scale, 
+                        hover_name = LAdf['Total Number of Rapid Public Chargepoints'], 
+                        #template = 'ggplot2', 
+                        basemap_visible = True,
+                        #range_color = [1, 401],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Total number of Rapid Public chargepoints', 
+                        #height = 620, width = 900
+                        )
+    fig2.update_geos(visible=False, **geometry.geos())
+    fig2.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    fig2.update_coloraxes(colorbar_title_text="Number of rapid public chargepoints", colorbar_title_side = "right")
+    #fig2.layout.font.family = 'Poppins'
+    return fig2
+
+
+# In[31]:
+
+
+@datastore.register('fig3', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig3(LAdf):
+    fig3 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), color="Chargepoints per 100k people (excl. London)",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator", 
+                        color_continuous_scale=theme_color_scale, 
+                        hover_name = LAdf['Chargepoints per 100k people (excl. London)'], 
+                        template = 'ggplot2', 
+                        basemap_visible = True,
+                        #range_color = [1, 401],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Public chargepoints per 100k people (excl. London)', 
+                        #height = 620, width = 900
+                        )
+    fig3.update_geos(visible=False, **geometry.geos())
+    fig3.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    fig3.update_coloraxes(colorbar_title_text="Number of public chargepoints", colorbar_title_side = "right")
+
+    #fig3.layout.font.family = 'Poppins'
+    return fig3
+
+
+# In[32]:
+
+
+@datastore.register('fig4', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig4(LAdf):
+    fig4 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), color="Chargepoints per 100k people",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator", 
+                        color_continuous_scale=theme_color_scale, 
+                        hover_name = LAdf['Chargepoints per 100k people'], 
+                        template = 'ggplot2', 
+                        basemap_visible = True,
+                        range_color = [1, 500],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Public chargepoints per 100k people', 
+                        #height = 620, width = 900
+                        )
+    fig4.update_geos(visible=False, **geometry.geos())
+    fig4.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    fig4.update_coloraxes(colorbar_title_text="Number of public chargepoints", colorbar_tickprefix = ">", colorbar_showtickprefix = "last", colorbar_title_side = "right")
+
+    #fig4.layout.font.family = 'Poppins'
+    return fig4
+
+
+# In[33]:
+
+
+@datastore.register('fig5', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig5(LAdf):
+    fig5 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), color="Rapid Chargepoints per 100k people",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator", 
+                        color_continuous_scale=theme_color_scale, 
+                        hover_name = LAdf['Rapid Chargepoints per 100k people'], 
+                        template = 'ggplot2', 
+                        basemap_visible = True,
+                        #range_color = [1, 401],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Rapid Public chargepoints per 100k people', 
+                        #height = 620, width = 900
+                        )
+    fig5.update_geos(visible=False, **geometry.geos())
+    fig5.update_coloraxes(colorbar_title_text="Number of rapid public chargepoints", colorbar_title_side = "right")
+    fig5.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    #fig5.layout.font.family = 'Poppins'
+    return fig5
+
+
+# In[34]:
+
+
+@datastore.register('fig6', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig6(LAdf):
+    fig6 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), color="Average yearly growth rate (%)",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator", 
+                        color_continuous_scale=theme_color_scale, 
+                        hover_name = LAdf['Average yearly growth rate (%)'], 
+                        template = 'ggplot2', 
+                        basemap_visible = True,
+                        #range_color = [1, 401],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Average yearly growth rate since October 2019', 
+                        #height = 620, width = 900
+                        )
+    fig6.update_geos(visible=False, **geometry.geos())
+    fig6.update_coloraxes(colorbar_title_text="Average yearly growth rate", colorbar_title_side = "right", colorbar_ticksuffix = "%", colorbar_showticksuffix = "all")
+    fig6.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    #fig6.layout.font.family = 'Poppins'
+    return fig6
+
+
+# In[35]:
+
+
+@datastore.register('fig7', depends=('LAdf',), cache=True, files=LA_map_files)
+def build_fig7(LAdf):
+    fig7 = px.choropleth(LAdf, geojson=geometry.url(LA_map_panel), color="January-April Quarterly growth rate (%)",
+                        locations="LA id", featureidkey="id",
+                        hover_data={"LA id": False, "Local Planning Authority": True},
+                        projection="mercator", 
+                        color_continuous_scale="thermal_r", 
+                        hover_name = LAdf['January-April Quarterly growth rate (%)'], 
+                        template = 'ggplot2', 
+                        basemap_visible = True,
+                        #range_color = [0,50],
+                        #color_discrete_map = {"missingdata":"#000000"},
+                        title = 'Average quarterly growth rate since October 2019', 
+                        #height = 620, width = 900
+                        )
+    fig7.update_geos(visible=False, **geometry.geos())
+    fig7.update_coloraxes(colorbar_title_text="Average quarterly growth rate", colorbar_title_side = "right", colorbar_ticksuffix = "%", colorbar_showticksuffix = "all")
+    fig7.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    #fig7.layout.font.family = 'Poppins'
+    return fig7
+
+
+# In[36]:
+
+
+## Defining list of dropdown values for LA region dcc.dropdown option below
+@datastore.register('pcvalueLAdata', depends=('LAem',))
+def load_pcvalueLAdata(LAem):
+    valueLAdata = LAem['Region'].unique()
+    pcvalueLAdata = valueLAdata.tolist()
+    return pcvalueLAdata
+
+
+# ### Interactive local authority sectoral emissions visualisation
+
+# In[57]:
+
+
+## LAem as one Local Authority x sub-sector array for the latest year, with
+## a row per LA index ID. A sector is then a column and a region selection
+## a mask over the rows, however many are picked.
+LAem_value = 'CO2 emissions within the scope of influence of LAs (kt CO2e)'
+
+
+@datastore.register('LAem_grid', depends=('LAem', 'LA_index'))
+def load_LAem_grid(LAem, LA_index):
+    if 'Calendar Year' in LAem:
+        LAem = LAem[LAem['Calendar Year'] == LAem['Calendar Year'].max()]
+    codes = LAem['Local Authority Code'] if 'Local Authority Code' in LAem else None
+    LAem = LAem.assign(LA_id=authorities.ids(LA_index, LAem['Local Authority'], codes, dataset='LAem'))
+    LAem = LAem[LAem['LA_id'] >= 0]
+    ## The source has a row per greenhouse gas, the map shows their total;
+    ## old districts merged into one (authorities.ALIASES) add up into it too
+    totals = (LAem.groupby(['LA_id', 'LA GHG Sub-sector'])[LAem_value]
+                  .sum(min_count=1).unstack())
+    authority = LAem.groupby('LA_id')[['Local Authority', 'Region']].first().loc[totals.index]
+    sectors = list(LAem['LA GHG Sub-sector'].unique())
+    return {'ids': totals.index.tolist(), 'names': authority['Local Authority'].tolist(),
+            'regions': authority['Region'].tolist(), 'sectors': sectors,
+            'values': totals[sectors].to_numpy(dtype='float64')}
+
+
+def LAem_sector_values(LAem_grid, selected_sector):
+    if selected_sector not in LAem_grid['sectors']:
+        return np.full(len(LAem_grid['names']), np.nan)
+    return LAem_grid['values'][:, LAem_grid['sectors'].index(selected_sector)]
+
+
+@figurecache.memoize(depends=('LAem_grid', geometry.dataset(LA_map_large)))
+def build_emissions_map(selected_sector):
+    LAem_grid = datastore.get('LAem_grid')
+
+    filtered_LAem_2 = pd.DataFrame({
+        'LA id': LAem_grid['ids'],
+        'Local Authority': LAem_grid['names'],
+        LAem_value: LAem_sector_values(LAem_grid, selected_sector),
+        'LA GHG Sub-sector': selected_sector,
+        'Region': LAem_grid['regions'],
+    }).dropna(subset=[LAem_value])
+    fig = px.choropleth(
+        filtered_LAem_2,
+        geojson=geometry.url(LA_map_large),
+        color="CO2 emissions within the scope of influence of LAs (kt CO2e)",
+        color_continuous_scale=theme_color_scale, 
+        locations="LA id",
+        featureidkey="id",
+        projection="mercator",
+        hover_name = "Local Authority",
+        hover_data={'LA id': False, 'Local Authority': True, 'CO2 emissions within the scope of influence of LAs (kt CO2e)': True, 'LA GHG Sub-sector': True, 'Region': True},
+        title='GHG emissions within the scope of influence of LAs',
+                        )
+    fig.update_geos(visible=False, **geometry.geos())
+    # Define layout specificities
+    fig.update_traces(uirevision = "Don't change")
+    fig.update_coloraxes(colorbar_title_text="GHG emissions within the scope of influence of LAs (ktCO2e)", colorbar_orientation = 'v', colorbar_title_font_size = 12, colorbar_title_side = "right", colorbar_ticksuffix = "(kt CO2e)", colorbar_showticksuffix = "none")
+    fig.update_layout(margin={"r":0,"t":25,"l":0,"b":0}, template = zemo_template_choro)
+    return fig
+
+
+def LAem_sector(selected_sector):
+    ## The map of a sector with every authority, plus the region of each of
+    ## its rows; the browser masks them with the region picker (views.js)
+    LAem_grid = datastore.get('LAem_grid')
+    present = ~np.isnan(LAem_sector_values(LAem_grid, selected_sector))
+    return {'figure': build_emissions_map(selected_sector),
+            'regions': [region for region, shown in zip(LAem_grid['regions'], present) if shown]}
+
+
+@callback(Output('LAem-sector', 'data'),
+              Input('sector-picker', 'value'),
+              prevent_initial_call=True)
+
+def update_figure(selected_sector):
+    return LAem_sector(selected_sector)
+
+
+clientside_callback(
+    ClientsideFunction(namespace='views', function_name='LAemissions'),
+    Output('my-graph', 'figure'),
+    [Input('LAem-sector', 'data'), Input('region-picker', 'value')],
+    prevent_initial_call=True)
+
+
+# In[58]:
+
+
+TUmode_options = ['Cars', 'Light Commerical Vehicles','Heavy Goods Vehicles','National Rail','TfL Tube','TfL Bus','Bus (excl. London)', 'Cycling']
+
+
+# In[59]:
+
+
+@page_layout('page_5_layout', '/page-5', depends=('fig1', 'fig2', 'fig3', 'fig5', 'fig6', 'fig7', 'sector_options', 'region_options', 'pcvalueLAdata'),
+             figures=(build_emissions_map,))
+def build_page_5_layout(fig1, fig2, fig3, fig5, fig6, fig7, sector_options, region_options, pcvalueLAdata):
+    LAem_initial = LAem_sector('Total')
+    return html.Div([
+            navbar,
+            html.H1('Local Authority Data', style={'textAlign': 'center'}),
+            html.Div([
+            dcc.Markdown('''
+            Future work includes full United Kingdom map and DNO region breakdown
+
+            _Last updated: September 30th, 2022_
+                         ''')
+                    ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                       'backgroundColor':'#FFFFFF',
+                       'border': 'thin lightgrey dashed', 
+                                       'padding': '6px 0px 0px 8px'}),
+    dbc.Tabs([
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [ 
+        dcc.Markdown('''
+            **Public charging infrastructure by Local Planning Authority across Great Britain [Source: DfT, July 2022](https://www.gov.uk/government/statistics/electric-vehicle-charging-device-statistics-july-2022)**
+            '''),
+        dbc.Row(
+            [
+                dbc.Col([
+                html.Div(
+                dcc.Markdown('''
+    **Public chargepoints (including Rapids)**
+            '''), style={'display': 'inline-block'}),  
+                    dcc.Graph(id = 'LAgraph1',
+                 figure = fig1,
+                 responsive = True,
+                 style={'width': '800', 'border-width':'1', 'border':'thin lightgrey dashed', 'border-bottom-style':'hidden'}),
+                # style={'display': 'inline-block'}
+                ]),
+                dbc.Col([
+                html.Div(
+                dcc.Markdown('''
+                    **Rapid chargepoints**        
+            '''), style={'display': 'inline-block'}),  
+                    dcc.Graph(id = 'LAgraph2',
+                 figure = fig2,
+                 responsive = True,
+                 style={'width': '800', 'border-width':'1', 'border':'thin lightgrey dashed', 'border-bottom-style':'hidden'}),
+                # style={'display': 'inline-block'}
+                                ]),
+            ], align="center",
+                ),
+        dbc.Row(
+            [
+                dbc.Col(dcc.Graph(id = 'LAgraph3',
+                 figure = fig3,
+                 responsive = True,
+                 style={'width': '800', 'border-width':'1', 'border':'thin lightgrey dashed', 'border-top-style':'hidden'}),
+              #   style={'display': 'inline-block'}
+                                ),
+                dbc.Col(dcc.Graph(id = 'LAgraph5',
+                 figure = fig5,
+                 responsive = True,
+                 style={'width': '800', 'border-width':'1', 'border':'thin lightgrey dashed', 'border-top-style':'hidden'}),
+                # style={'display': 'inline-block'}
+                       ),
+            ], align="center"),
+        html.Br(),
+        dcc.Markdown('''
+        **These figures show the chargepoint numbers growth rate across different timescales**
+                     '''),
+         dbc.Row(
+             [            
+                dbc.Col(dcc.Graph(id = 'LAgraph7',
+                 figure = fig7,
+                 responsive = True,
+                 style={'width': '800', 'border-width':'1', 'border':'thin lightgrey dashed'}),
+                 #style={'display': 'inline-block'}
+                       ),
+                dbc.Col(dcc.Graph(id = 'LAgraph6',
+                 figure = fig6,
+                 responsive = True,
+                 style={'width': '800', 'border-width':'1', 'border':'thin lightgrey dashed'}),
+                # style={'display': 'inline-block'}
+                                )
+            ], align="center",
+                 ),
+        html.Br(),
+        dcc.Markdown('''
+        **Carbon dioxide equivalent emissions within the scope of influence of LAs (kt CO2e) [Source: BEIS, 2020](https://www.data.gov.uk/dataset/723c243d-2f1a-4d27-8b61-cdb93e5b10ff/uk-local-authority-and-regional-greenhouse-gas-emissions)**
+        '''),
+        dbc.Row([
+            dbc.Col(html.Div([
+                    html.Div([
+                                dcc.Markdown(children=markdown_text)
+                            ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                               'padding': '6px 0px 0px 8px'}),
+                    html.Div([
+                                dcc.Markdown(children=markdown_subtext)
+                            ],style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                               'padding': '6px 0px 0px 8px'}),
+                    dcc.Markdown(''' 
+                        Sub-sector of GHG emissions:
+                                 '''),
+                    dcc.Dropdown(id='sector-picker', options=sector_options,
+                                                     value= 'Total'),
+                    dcc.Markdown('''
+                        Regions:
+                                 '''),
+                    dcc.Dropdown(id='region-picker', options=region_options, 
+                                 placeholder='Filter by region',
+                                            value= pcvalueLAdata , multi=True)
+                            ], style={'marginLeft': 10, 'marginRight': 0, 'marginTop': 10, 'marginBottom': 10, 
+                                   'padding': '6px 0px 0px 8px'}), width = 4
+                   ),
+            dbc.Col([
+                    dcc.Store(id='LAem-sector', data=LAem_initial),
+                    dcc.Graph(id='my-graph', responsive = True, 
+                    figure=LAem_initial['figure'],
+                    style={'border-width':'0', 'border':'thin lightgrey dashed'})
+                    ]),
+                ]),
+            ])
+                ), label="Internal geo-spatial Data Visualisation"),
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [
+        dbc.Row([
+            dbc.Col(
+                html.Div([
+                dcc.Markdown(''' 
+        The [National Map of EV Charge Point Coverage provided by Field Dynamics and supported by ZapMap and Ordinance survey](https://www.field-dynamics.co.uk/research/public-charger-catchment-research/)
+        assesses public chargepoint access for households without access to off-street charging space suitable for a small EV ('On-Street households)'. 
+        Adequate coverage is defined as being **within 5 minutes walking distance to a public charger**. In their assessment of council areas across Great Britain that are 
+        outside of London, it was found that **90%** of these On-Street households are outside of a 5-minute walk to a public charger. '''),            
+
+                html.Iframe(src="https://onstreetcharging.acceleratedinsightplatform.com/",
+                style={"height": "800px", "width": "100%", "max-width": "none"}),
+                        ]), width='auto'
+                    )
+                ])            
+            ]
+                    )
+                        ), label = 'External Local Authority Data Visualisation')
+        ])
+
+
+    ])
+    
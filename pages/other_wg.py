@@ -0,0 +1,345 @@
+# /page-1: Other Zemo WG Data
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objs as go
+import statsmodels.api as sm
+import dash_bootstrap_components as dbc
+from dash import dcc, html, Input, Output, State, callback, ctx, Patch
+
+import datastore
+import downsample
+import figurecache
+import timeseries
+from components import navbar, page_layout
+from theme import zemo_template_spike
+
+
+# ## Other Zemo WG Data - Key Indicator
+
+# In[9]:
+
+
+datastore.source('df', 'mass-energy-af-v2.csv')
+
+#line of best fit modelling
+@datastore.register('dfdropna', depends=('df',), cache=True)
+def load_dfdropna(df):
+    dfdropna = df.dropna()
+
+    x = sm.add_constant(dfdropna['MIRO (kg)'])
+    model = sm.OLS(dfdropna['Z (Wh/km)'], x).fit()
+    dfdropna['bestfit']=model.fittedvalues
+
+
+    dfdropna['weightedMIRO'] = dfdropna['MIRO (kg)']*dfdropna['Number']
+
+
+    wAVG = dfdropna['weightedMIRO'].sum() / dfdropna['Number'].sum()
+
+    print("Median MIRO (kg):", dfdropna['MIRO (kg)'].median(),
+          ", Weighted average (kg):", wAVG)
+    return dfdropna
+
+
+# ### Bubble, 3d and box plots for mass vs energy
+
+# In[10]:
+
+
+@datastore.register('fig3dpx', depends=('df',))
+def build_fig3dpx(df):
+    fig3dpx = px.scatter_3d(df, x='MIRO (kg)', y='Z (Wh/km)', z='Number',
+                  color='Fuel',
+                  title = 'Volume of model fleet on third axis', 
+                  #size = 'Number',
+                  symbol='Fuel', opacity=1)
+
+    #fig3dpx.update_layout(autosize=False, width=500,height=500)
+    return fig3dpx
+
+
+@datastore.register('boxfig', depends=('df',))
+def build_boxfig(df):
+    ##box plots
+    x = 'Z (Wh/km)'
+
+    a = df.query('Fuel== "PLUG-IN HYBRID ELECTRIC"')[x]
+    b = df.query('Fuel == "ELECTRICITY"')[x]
+    c = df.query('Fuel == "PLUG-IN ELECTRIC DIESEL"')[x]
+    d = df.query('Fuel == "EREVS"')[x]
+
+
+    data = [go.Box(y=a, name = 'Plug-in Hybrid Electric'), go.Box(y=b, name = 'EV'), go.Box(y=c, name='Plug-in Electric Diesel'), go.Box(y=d, name = 'EREV')]
+
+    layout = go.Layout(title = 'Box plot distributions for the Z (Wh/km) for different fuels',
+                       yaxis = dict(title='Z (Wh/km)'),
+                       xaxis = dict(title='Fuel'),
+                      template = zemo_template_spike)
+
+
+    boxfig = go.Figure(data=data, layout=layout)
+    return boxfig
+
+
+@datastore.register('boxmassfig', depends=('df',))
+def build_boxmassfig(df):
+    y = 'MIRO (kg)'
+    a1 = df.query('Fuel== "PLUG-IN HYBRID ELECTRIC"')[y]
+    b1 = df.query('Fuel == "ELECTRICITY"')[y]
+    c1 = df.query('Fuel == "PLUG-IN ELECTRIC DIESEL"')[y]
+    d1 = df.query('Fuel == "EREVS"')[y]
+
+
+    data = [go.Box(y=a1, name = 'Plug-in Hybrid Electric'), go.Box(y=b1, name = 'EV'), go.Box(y=c1, name='Plug-in Electric Diesel'), go.Box(y=d1, name = 'EREV')]
+
+    layout = go.Layout(title = 'Box plot distributions for the MIRO (kg) for different fuels',
+                       yaxis = dict(title='MIRO (kg)'),
+                       xaxis = dict(title='Fuel'), 
+                       hovermode="x unified",
+                       template = zemo_template_spike)
+
+
+    boxmassfig = go.Figure(data=data, layout=layout)
+    return boxmassfig
+
+
+# In[11]:
+
+
+date_format_TU = '%d-%b-%Y'
+
+datastore.source('transportusage', 'COVID19data_11_2022.csv',
+                 schema=dict(dates={'Date': date_format_TU}, scale=[(slice(1, None), 100)]))
+
+
+# In[13]:
+
+
+## Coarser views of the daily series, precomputed once (and cached on disk)
+## so the granularity picker only selects one of them
+@datastore.register('transportusage_weekly', depends=('transportusage',), cache=True)
+def load_transportusage_weekly(transportusage):
+    return timeseries.period_means(transportusage, 'Date', 'W-MON')
+
+
+@datastore.register('transportusage_monthly', depends=('transportusage',), cache=True)
+def load_transportusage_monthly(transportusage):
+    return timeseries.period_means(transportusage, 'Date', 'MS')
+
+
+@datastore.register('transportusage_7d', depends=('transportusage',), cache=True)
+def load_transportusage_7d(transportusage):
+    return timeseries.rolling_means(transportusage, 'Date', 7)
+
+
+@datastore.register('transportusage_28d', depends=('transportusage',), cache=True)
+def load_transportusage_28d(transportusage):
+    return timeseries.rolling_means(transportusage, 'Date', 28)
+
+
+COVIDTUmode_options = ['Cars', 'Light Commercial Vehicles', 'Heavy Goods Vehicles', 'National Rail', 'Transport for London Tube', 'Transport for London Bus', 'Bus (excluding London)', 'Cycling']
+
+
+TU_granularities = {
+    'Daily': 'transportusage',
+    'Weekly': 'transportusage_weekly',
+    'Monthly': 'transportusage_monthly',
+    '7-day average': 'transportusage_7d',
+    '28-day average': 'transportusage_28d',
+}
+TU_granularity_options = list(TU_granularities)
+
+
+# In[49]:
+
+
+def build_transportusage_trace(transportusage, modetype, TU_range=None):
+    ## LTTB-downsampled; TU_range is the zoomed-in window, if any
+    data = downsample.rows(transportusage, 'Date', modetype, TU_range)
+    return go.Scatter(x=data['Date'], y=data[modetype], name=modetype)
+
+
+@figurecache.memoize(depends=tuple(TU_granularities.values()))
+def build_transportusagefig(TU_selected_mode, TU_granularity):
+    transportusage = datastore.get(TU_granularities[TU_granularity])
+    
+    layout = go.Layout()
+    TUfig = go.Figure(layout=layout)
+    
+    for modetype in TU_selected_mode:
+        TUfig.add_trace(build_transportusage_trace(transportusage, modetype))
+    TUfig.update_layout(template = zemo_template_spike, title ='U.K Transport use activity compared to equivalent day pre-COVID-19 pandemic, (Source: <a href="https://www.gov.uk/government/statistics/transport-use-during-the-coronavirus-covid-19-pandemic">DfT, November 2022</a>)'),
+    
+    TUfig.update_yaxes(title = 'Relative Transport Use Activity', rangemode='tozero', ticksuffix = '%')
+    TUfig.update_xaxes(rangeselector = dict(
+                buttons=list([
+                                dict(count=3, label="3M", step="month", stepmode="backward"),
+                                dict(count=2, label="1Y", step="year", stepmode="backward"),                 
+                                dict(step="all")])
+            ))
+    ## Keeps the user's zoom when a zoomed window is patched in
+    TUfig.update_layout(uirevision = TU_granularity)
+    
+    return TUfig
+
+
+@callback([Output('transportusage-graph', 'figure'), Output('TU-drawn-modes', 'data')],
+              [Input('TU-mode-picker', 'value'), Input('TU-granularity', 'value'),
+               Input('transportusage-graph', 'relayoutData')],
+              [State('TU-drawn-modes', 'data')],
+              prevent_initial_call=True)
+
+def update_transportusagefig(TU_selected_mode, TU_granularity, TU_relayout, TU_drawn):
+    if (ctx.triggered_id not in ('TU-mode-picker', 'transportusage-graph') or not TU_drawn
+            or TU_drawn['granularity'] != TU_granularity):
+        return (build_transportusagefig(TU_selected_mode, TU_granularity),
+                {'granularity': TU_granularity, 'modes': list(TU_selected_mode), 'range': None})
+
+    transportusage = datastore.get(TU_granularities[TU_granularity])
+    patch = Patch()
+
+    if ctx.triggered_id == 'transportusage-graph':
+        ## Zoomed or panned: resample the drawn traces for the visible window
+        TU_range = downsample.x_range(TU_relayout)
+        for i, modetype in enumerate(TU_drawn['modes']):
+            data = downsample.rows(transportusage, 'Date', modetype, TU_range)
+            patch['data'][i]['x'] = data['Date']
+            patch['data'][i]['y'] = data[modetype]
+        return patch, dict(TU_drawn, range=TU_range)
+
+    ## Only a mode was toggled: drop the traces of removed modes and send the
+    ## added ones, leaving the rest of the figure as the browser has it
+    kept = []
+    for i, modetype in reversed(list(enumerate(TU_drawn['modes']))):
+        if modetype in TU_selected_mode:
+            kept.insert(0, modetype)
+        else:
+            del patch['data'][i]
+    for modetype in TU_selected_mode:
+        if modetype not in kept:
+            patch['data'].append(build_transportusage_trace(transportusage, modetype, TU_drawn['range']).to_plotly_json())
+            kept.append(modetype)
+    return patch, dict(TU_drawn, modes=kept)
+
+
+# In[50]:
+
+
+@page_layout('page_1_layout', '/page-1', depends=('df', 'dfdropna', 'fig3dpx', 'boxfig', 'boxmassfig'),
+             figures=(build_transportusagefig,))
+def build_page_1_layout(df, dfdropna, fig3dpx, boxfig, boxmassfig):
+    return html.Div([
+         navbar,    
+         html.H1('Other Zemo WG Data', style={'textAlign': 'center'}),
+
+    dbc.Tabs([
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [ 
+         dcc.Graph(id='scatterplot2', 
+                   figure={'data':[
+                       go.Scatter(
+                               x = df['MIRO (kg)'],
+                               y = df['Z (Wh/km)'],
+                               name = 'MIRO(kg) vs Z(Wh/km)',
+                               mode = 'markers',
+                               marker = dict(
+                                   size= np.log(df['Number']),
+                                   showscale = False),
+                               hovertemplate="%{y}%{_xother}"
+                       ),
+                       go.Scatter(x=dfdropna['MIRO (kg)'],
+                                                y=dfdropna['bestfit'],
+                                                hoverlabel=dict(namelength=-1), 
+                                                mode='lines',
+                                                name='y=0.0888x + 0.0485 <br>(OLS regression best fit)<br> R-squared = 0.64',
+                                                line=dict(color='firebrick', width=2, dash = 'dash')
+                                               )
+                       ], 
+
+                           'layout':go.Layout(
+                               title = 'Plug-in cars registered for the first time by fuel type, mass in running order (MIRO),<br><sup> Size of marker is logarithmically proportional to number of vehicles</sup>', 
+                               title_x=0,
+                               title_font_size = 14,
+                               xaxis = {'title':'MIRO (kg)'},
+                               yaxis = {'title':'Z (Wh/km)'},
+                               template = zemo_template_spike,
+                               hovermode="x unified"
+                               )}, 
+                                    responsive = True,
+                                    style={'width': '95vw'}
+                   ),
+
+                  dbc.Row(
+                        [
+                            dbc.Col(html.Div(dcc.Graph(id = 'scatterplot3',
+                            figure={'data':[
+                               go.Scatter(
+                                       x = df['MIRO (kg)'],
+                                       y = df['Z (Wh/km)'],
+                                       text = df['Number'],
+                                       mode = 'markers',
+                                       fill = 'tonext',
+                                       marker = dict(
+                                           color= (df['Number']),
+                                           colorbar=dict(
+                                               title="Number of vehicles"),
+                                           showscale = True),
+                                       hovertemplate="%{y}%{_xother}")
+                               ], 
+
+                                   'layout':go.Layout(
+                                       xaxis = {'title':'MIRO (kg)'},
+                                       yaxis = {'title':'Z (Wh/km)'},
+                                       template = zemo_template_spike,
+                                       hovermode="x unified")},
+                             responsive = True,
+                             style={'width': '70vw, 20vmin'}
+                                                      ),
+                            # style={'display': 'inline-block'}
+                                            )),
+                            dbc.Col(html.Div(dcc.Graph(id = 'px 3d plot',
+                             figure = fig3dpx,
+                             responsive = True,
+                             style={'width': '30vw'}
+                                                      ),
+                                            )),
+                        ], align="center",
+                            ),
+         dcc.Graph(id = 'energy box plot',
+                   figure = boxfig,
+                   #style={'display': 'inline-block'}
+                   ),
+         dcc.Graph(id = 'mass box plot',
+                   figure = boxmassfig,
+                   #style={'display': 'inline-block'}
+                   ),
+            ]
+                    )
+                        ), label = 'PCWG visualisations'),
+    dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [
+         html.Div([
+         dcc.Dropdown(id='TU-mode-picker',
+                 options = [{'label': x, 'value': x} for x in COVIDTUmode_options],
+                 value = ['Cars'],
+                 placeholder='Select transport mode', multi=True),
+         dcc.Dropdown(id='TU-granularity',
+                 options = [{'label': x, 'value': x} for x in TU_granularity_options],
+                 value = 'Daily', clearable=False),
+
+         dcc.Graph(id = 'transportusage-graph',
+                   figure = build_transportusagefig(['Cars'], 'Daily'),
+                   responsive = True
+                   #style={'display': 'inline-block'}
+                   ),
+         dcc.Store(id='TU-drawn-modes', data={'granularity': 'Daily', 'modes': ['Cars'], 'range': None}),
+             ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                           'padding': '6px 0px 0px 8px'}),
+                ]
+                    )
+                        ), label = 'Transport usage statistics')        
+    ])
+         ])
@@ -0,0 +1,556 @@
+# /page-4: Vehicle Data
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+from plotly.subplots import make_subplots
+import dash_bootstrap_components as dbc
+from dash import dcc, html, Input, Output, State, ClientsideFunction, callback, clientside_callback, ctx
+
+import datastore
+import downsample
+import figurecache
+from components import navbar, page_layout
+from theme import zemo_template, zemo_template_spike, width_template
+
+
+# ## Vehicle Data - Key Indicator
+
+# ### Unused SMMT site data
+
+# In[20]:
+
+
+@datastore.register('SMMT', source='SMMTcsv.csv')
+def load_SMMT(SMMT):
+    SMMT['Type']=SMMT['Type'].astype(int)
+
+    print(SMMT.dtypes)
+    return SMMT
+
+
+@datastore.register('vehicleplot', depends=('SMMT',))
+def build_vehicleplot(SMMT):
+    layout = go.Layout(
+            #margin=go.Margin(l=100),
+           )
+    vehicleplot = go.Figure(layout=layout)
+
+    vehicleplot = make_subplots(specs=[[{"secondary_y": True}]])
+
+    #vehicleplot.add_trace(go.Line(x = SMMT['Year'].iloc[18:48], 
+    #                                     y = SMMT['Grand Total'].iloc[18:31].cumsum(), name="Total Cumulative Greenhouse gas emissions, UK 2008-2020 (MtCO2e)"))                
+
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['Diesel'], name="Diesel"))
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['Petrol'], name="Petrol"))
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['BEV'], name="BEV"))
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['PHEV'], name="PHEV"))
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['HEV'], name="HEV"))
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['MHEV (Diesel)'], name="MHEV (Diesel)"))
+    vehicleplot.add_trace(go.Bar(x = SMMT['Type'], 
+                                         y = SMMT['MHEV (Petrol)'], name="MHEV (Petrol)"))
+
+
+
+    vehicleplot.add_trace(go.Line(x = SMMT['Type'], 
+                                         y = SMMT['BEV Market Share']*100, name="BEV Market Share"), secondary_y = True)
+    vehicleplot.add_trace(go.Line(x = SMMT['Type'], 
+                                         y = SMMT['PHEV Market Share']*100, name="PHEV Market Share"), secondary_y = True)
+
+
+    #vehicleplot.add_trace(go.Line(x = SMMT['Year'], y = SMMT['Grand Total'], name="Total Cumulative Greenhouse gas emissions, UK 2008-2020 (MtCO2e)"))                
+    #vehicleplot.add_trace(go.Bar(x = SMMT['Year'], y = SMMT['Carbon Budget Target'], name="Carbon-Budgets Targets"), secondary_y = True)               
+
+    vehicleplot.update_layout(barmode = 'stack')
+
+    vehicleplot.update_yaxes(rangemode="tozero", ticksuffix = '%', secondary_y = True)
+
+    vehicleplot.update_layout(template = zemo_template_spike, xaxis={'tickformat': ',d'},  title = "SMMT data, Source: SMMT, 2021")
+    return vehicleplot
+
+
+# ### Vehicle parc and sales data
+
+# In[21]:
+
+
+## Converting vehicle data to datetime format to allow for rangeslider and buttons
+
+
+## Fuel type columns are published in thousands of vehicles
+
+datastore.source('vehicleparc', 'parc_Q2_2022.csv',
+                 schema=dict(thousands=',', scale=[([slice(1, 12), 'Total'], 1000)]))
+
+
+@datastore.register('vehicleparc_dt', depends=('vehicleparc',), cache=True)
+def load_vehicleparc_dt(vehicleparc):
+    date_format_1 = '%B %Y'
+    date_format_2 = '%Y %B'
+
+    monthlysales = vehicleparc[vehicleparc['Chart_type']=='Sales (Monthly)'].copy()
+    monthlysales['Period'] = pd.to_datetime(monthlysales['Period'], format = date_format_1)
+
+    quarterlysales = vehicleparc[vehicleparc['Chart_type']=='Sales (Quarterly)'].copy()
+    quarterlysales['Period'] = pd.to_datetime(quarterlysales['Period'], format = date_format_2)
+
+    quarterlyparc = vehicleparc[vehicleparc['Chart_type']=='Parc'].copy()
+    quarterlyparc['Period'] = pd.to_datetime(quarterlyparc['Period'], format = date_format_2)
+
+
+    vehicleparc_dt = pd.concat([monthlysales, quarterlysales, quarterlyparc])
+    return vehicleparc_dt
+
+
+## One block per (Vehicle_type, Chart_type), sorted by period, with the fuel
+## columns as float64, so the parc callback picks its rows with a dict lookup
+## instead of scanning the whole table for every request
+
+@datastore.register('vehicleparc_blocks', depends=('vehicleparc_dt',))
+def load_vehicleparc_blocks(vehicleparc_dt):
+    fuel_columns = [column for column in vehicleparc_dt.columns
+                    if column not in ('Period', 'Vehicle_type', 'Chart_type')]
+    blocks = {}
+    for key, block in vehicleparc_dt.groupby(['Vehicle_type', 'Chart_type'], sort=False):
+        block = block.sort_values('Period', kind='stable')
+        blocks[key] = pd.DataFrame(dict(Period=block['Period'].to_numpy(),
+                                        **{column: block[column].to_numpy(dtype='float64')
+                                           for column in fuel_columns}))
+    return blocks
+
+
+# In[22]:
+
+
+##Defining lists to be used in the drop down options in page_x_layout dcc.dropdown
+
+vehicle_types_parc = ['Bus', 'Car', 'HGV', 'Van', 'Motorcycle', 'Other']
+chart_type = ['Parc', 'Sales (Quarterly)', 'Sales (Monthly)']
+chart_type2 = ['Parc', 'Sales (Quarterly)']
+
+hc_chart_type = ['Receipts', 'Quantities']
+
+vehicle_type_veh156 = ['Cars','Light goods vehicles'] 
+
+
+# ### Hydrocarbon bulletin data for receipts and volumes
+
+# In[23]:
+
+
+##Convering data to datetime format
+
+
+date_format_1 = '%B %Y'
+
+datastore.source('hcbulletin', 'hc_oils_bulletin_q2_2022.csv',
+                 schema=dict(thousands=',', dates={'Period': date_format_1}, numeric=[slice(1, 16), 'Road Fuel gases']))
+
+
+@datastore.register('bar_hcbulletinlist', depends=('hcbulletin',))
+def load_bar_hcbulletinlist(hcbulletin):
+    hcbulletinlist = hcbulletin.columns.values.tolist()
+    bar_hcbulletinlist_1 = np.append(hcbulletinlist[1:7], hcbulletinlist[8:12]) 
+    bar_hcbulletinlist = np.append(bar_hcbulletinlist_1 , hcbulletinlist[13:15])
+    return bar_hcbulletinlist
+
+
+@datastore.register('line_hcbulletinlist', depends=('hcbulletin',))
+def load_line_hcbulletinlist(hcbulletin):
+    hcbulletinlist = hcbulletin.columns.values.tolist()
+    line_hcbulletinlist_1 = np.append(hcbulletinlist[7], hcbulletinlist[12])
+    line_hcbulletinlist = np.append(line_hcbulletinlist_1, hcbulletinlist[15])
+    return line_hcbulletinlist
+
+
+#hcbulletin
+#vehicleparc_dt1 = monthlysales.append(quarterlysales)
+
+
+# ### WLTP CO2 Emissions of vehicles registered data
+
+# In[24]:
+
+
+date_format_x = '%B %Y'
+
+datastore.source('veh156', 'veh156_Q2_2022.csv',
+                 schema=dict(thousands=',', dates={'Date': date_format_x}, numeric=[slice(7, 12)]))
+
+
+@datastore.register('veh156list', depends=('veh156',))
+def load_veh156list(veh156):
+    veh156list = veh156.columns.values.tolist()
+
+    veh156list = veh156list[7:12]
+    return veh156list
+
+
+@datastore.register('veh156list_LGV', depends=('veh156list',))
+def load_veh156list_LGV(veh156list):
+    return np.append(veh156list[0:2], veh156list[4])
+
+
+# ### Interactive Vehicle parc and sales visualisation
+
+# In[53]:
+
+
+## Absolute values come from the server; the Percentage view is derived from
+## them in the browser (assets/views.js). Zooming in re-fetches the visible
+## window at full detail.
+@callback(Output('vehicleparc-figure', 'data'),
+              [Input('vehicle-picker', 'value'), Input('chart-picker', 'value'),
+               Input('vehicleparc-graph', 'relayoutData')],
+              prevent_initial_call=True)
+
+def update_vehicleparcfig(selected_vehicle, selected_chart, relayout):
+    if ctx.triggered_id == 'vehicleparc-graph':
+        x_range = downsample.x_range(relayout)
+        if x_range is not None:
+            ## Windows aren't worth caching, build those directly
+            return figurecache.uncached(build_vehicleparcfig, selected_vehicle, selected_chart, x_range)
+    return build_vehicleparcfig(selected_vehicle, selected_chart)
+
+
+@figurecache.memoize(depends=('vehicleparc', 'vehicleparc_blocks'))
+def build_vehicleparcfig(selected_vehicle, selected_chart, x_range=None):
+    vehicleparc = datastore.get('vehicleparc')
+    vehicleparc_blocks = datastore.get('vehicleparc_blocks')
+    
+    layout = go.Layout()
+    vehicleparcfig = go.Figure(layout=layout)   
+    
+    data = vehicleparc_blocks.get((selected_vehicle, selected_chart))
+    if data is None:
+        ## Not published for this vehicle, draw the chart empty
+        data = next(iter(vehicleparc_blocks.values())).iloc[:0]
+    ## Every stacked trace has to keep the same periods, so pick them on the total
+    data = downsample.rows(data, 'Period', 'Total', x_range)
+    vehicleparclist = vehicleparc.columns.values.tolist()
+    fig_list_veh=vehicleparclist[1:12]
+    fig_list_veh.reverse()
+    
+    for fueltype in fig_list_veh:
+        vehicleparcfig.add_trace(go.Scatter(x=data['Period'], y=data[fueltype], 
+                               name=fueltype,
+                                hovertemplate="%{y}%{_xother}",
+                                fill='tonexty', mode = 'none', stackgroup = 'one'          
+                                       )),
+    vehicleparcfig.add_trace(go.Line(x=data['Period'], y=data['Total'], 
+           name="Total")),
+    vehicleparcfig.update_layout(template=zemo_template)
+    vehicleparcfig.update_yaxes(rangemode = 'tozero', title = 'Number of vehicles')
+    
+    vehicleparcfig.update_xaxes(
+        rangeselector = dict(
+                buttons=list([
+                                dict(count=3, label="3M", step="month", stepmode="backward"),
+                                dict(count=2, label="2Y", step="year", stepmode="backward"),
+                                dict(count=4, label="4Y", step="year", stepmode="backward"),                    
+                                dict(step="all")])
+    ))
+
+    
+    vehicleparcfig.update_layout(title = 'Vehicle parc and sales by fuel type (Source: <a href="https://www.gov.uk/government/statistical-data-sets/vehicle-licensing-statistics-data-tables">DfT, September 2022</a>)')        
+    ## Keep the user's zoom while the window is re-fetched
+    vehicleparcfig.update_layout(uirevision = selected_vehicle + selected_chart)
+
+    return vehicleparcfig
+
+
+clientside_callback(
+    ClientsideFunction(namespace='views', function_name='vehicleparc'),
+    Output('vehicleparc-graph', 'figure'),
+    [Input('vehicleparc-figure', 'data'), Input('percentage_button', 'value')])
+     
+
+
+# ### Interactive hydrocarbon bulletin visualisation
+
+# In[54]:
+
+
+## As for the vehicle parc, the Percentage view is made in the browser and
+## zooming in re-fetches the visible window
+@callback(Output('hcbulletin-figure', 'data'),
+              [Input('hc-chart-picker', 'value'), Input('hcbulletin-graph', 'relayoutData')],
+              prevent_initial_call=True)
+
+def update_hcbulletinfig(hc_selected_chart, relayout):
+    if ctx.triggered_id == 'hcbulletin-graph':
+        x_range = downsample.x_range(relayout)
+        if x_range is not None:
+            return figurecache.uncached(build_hcbulletinfig, hc_selected_chart, x_range)
+    return build_hcbulletinfig(hc_selected_chart)
+
+
+@figurecache.memoize(depends=('hcbulletin', 'bar_hcbulletinlist', 'line_hcbulletinlist'))
+def build_hcbulletinfig(hc_selected_chart, x_range=None):
+    hcbulletin = datastore.get('hcbulletin')
+    bar_hcbulletinlist = datastore.get('bar_hcbulletinlist')
+    line_hcbulletinlist = datastore.get('line_hcbulletinlist')
+    
+    layout = go.Layout()
+    hcbulletinfig = go.Figure(layout=layout)   
+
+    hc_data = hcbulletin[hcbulletin['Chart_type']== hc_selected_chart]
+    hc_stacked = hc_data[list(bar_hcbulletinlist) + ['Road Fuel gases']].sum(axis=1)
+    hc_data = downsample.rows(hc_data, 'Period', hc_stacked, x_range)
+
+    for fueltype in bar_hcbulletinlist:
+        hcbulletinfig.add_trace(go.Scatter(x=hc_data['Period'], y=hc_data[fueltype], 
+                               name=fueltype, fill='tonexty', mode = 'none', stackgroup = 'one'         
+                                          )),
+    hcbulletinfig.add_trace(go.Scatter(x=hc_data['Period'], y=hc_data['Road Fuel gases'], 
+                               name='Road Fuel gases', fill='tonexty', mode = 'none', stackgroup = 'one')),        
+    for item in line_hcbulletinlist:
+        hcbulletinfig.add_trace(go.Line(x=hc_data['Period'], y=hc_data[item], 
+                               name=item)),
+            
+    if hc_selected_chart == 'Quantities':
+        hcbulletinfig.update_layout(template=zemo_template),
+        hcbulletinfig.update_yaxes(title ='Total hydrocarbon oil quantities (million litres)')
+    else:
+        hcbulletinfig.update_layout(template=zemo_template)
+        hcbulletinfig.update_yaxes(rangemode = 'tozero', title = 'Total receipts value (£ millions)')
+
+
+    hcbulletinfig.update_xaxes(rangeselector = dict(
+                buttons=list([
+                                dict(count=3, label="3M", step="month", stepmode="backward"),
+                                dict(count=2, label="2Y", step="year", stepmode="backward"),
+                                dict(count=4, label="4Y", step="year", stepmode="backward"),
+                                dict(count=10, label="10Y", step="year", stepmode="backward"),                    
+                                dict(step="all")])
+    ))
+
+    
+    hcbulletinfig.update_layout(bargap = 0, title = 'HMRC Hydrocarbon Oils Quantities and Receipts (Source: <a href="https://www.gov.uk/government/statistics/hydrocarbon-oils-bulletin">HMRC, Q2 2022</a>)')        
+    hcbulletinfig.update_layout(uirevision = hc_selected_chart)
+
+    return hcbulletinfig
+
+
+clientside_callback(
+    ClientsideFunction(namespace='views', function_name='hcbulletin'),
+    Output('hcbulletin-graph', 'figure'),
+    [Input('hcbulletin-figure', 'data'), Input('hc_percentage_button', 'value')])
+       
+
+
+# ### Interactive CO2 vehicle data visualisation
+
+# In[55]:
+
+
+## Both body types are small, so they ship with page 4 in the veh156-figures
+## store and the picker just switches between them in the browser
+@datastore.register('veh156figs', depends=('veh156', 'veh156list', 'veh156list_LGV'))
+def build_veh156figs(veh156, veh156list, veh156list_LGV):
+    return {veh156_selected_chart: build_veh156fig(veh156, veh156list, veh156list_LGV, veh156_selected_chart)
+            for veh156_selected_chart in vehicle_type_veh156}
+
+
+def build_veh156fig(veh156, veh156list, veh156list_LGV, veh156_selected_chart):
+    layout = go.Layout()
+    veh156fig = go.Figure(layout=layout)   
+
+    veh156fig_data = veh156[veh156['BodyType']== veh156_selected_chart]
+     
+    if veh156_selected_chart == 'Cars':
+        for fueltype in veh156list:
+            veh156fig.add_trace(go.Line(x=veh156fig_data['Date'], y=veh156fig_data[fueltype], 
+                                   name=fueltype+' (WLTP)')),
+        veh156fig.update_layout(title ='Average reported carbon dioxide (CO2) emission figures of Cars registered for the first time by fuel type<br><sup><i>Total figure will include vehicles with other fuel types, notably battery electric and hybrid electric (diesel) vehicles.</i></sup>'),
+    else:
+        for fueltype in veh156list_LGV:
+            veh156fig.add_trace(go.Line(x=veh156fig_data['Date'], y=veh156fig_data[fueltype], 
+                                   name=fueltype)),
+        veh156fig.update_layout(title = 'Average reported carbon dioxide (CO2) emission figures of Light goods vehicles registered for the first time by fuel type<br><sup><i>Total figure will include vehicles with other fuel types, notably battery electric and hybrid electric (diesel) vehicles</i></sup>')
+        veh156fig.update_yaxes(rangemode = 'tozero')
+    veh156fig.update_layout(template = zemo_template)
+    veh156fig.update_yaxes(title = 'Grams per kilometre')
+    veh156fig.update_xaxes(rangeselector = dict(
+                buttons=list([
+                                dict(count=3, label="3M", step="month", stepmode="backward"),
+                                dict(count=2, label="1Y", step="year", stepmode="backward"),                 
+                                dict(step="all")])
+    ))
+    
+    return veh156fig
+
+
+clientside_callback(
+    ClientsideFunction(namespace='views', function_name='veh156'),
+    Output('veh156fig-graph', 'figure'),
+    [Input('veh156-vehicle-picker', 'value')],
+    [State('veh156-figures', 'data')])
+
+
+# In[56]:
+
+
+@page_layout('page_4_layout', '/page-4', depends=('veh156figs',),
+             figures=(build_vehicleparcfig, build_hcbulletinfig))
+def build_page_4_layout(veh156figs):
+    return html.Div([
+        navbar,
+        html.H1('Vehicle Data', style={'textAlign': 'center'}),
+        html.Div(id='page-4-content'),
+        html.Div([
+            dcc.Markdown('''
+            Future work will incorporate additional DfT stats data tables and new plots that convert fuels sold using energy density figures  
+
+            _Last updated: October 18th, 2022_
+                         '''),
+                    ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                       'backgroundColor':'#FFFFFF',
+                       'border': 'thin lightgrey dashed', 
+                                       'padding': '6px 0px 0px 8px'}),
+    dbc.Tabs([
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [ 
+        dbc.Row([
+                dbc.Col([
+                    dcc.Markdown('''
+                        **Vehicle Parc by fuel type and vehicle category [Source: DfT stats, Q2 2022](https://www.gov.uk/government/statistical-data-sets/vehicle-licensing-statistics-data-tables)**
+                                 '''),
+                        ], width = width_template)
+                    ]),
+            dbc.Row([
+                dbc.Col([
+                html.Div([
+                    dcc.Markdown('''
+                        Select vehicle type:            
+                        '''),
+                    dcc.Dropdown(
+                        id='vehicle-picker',
+                        options=[{'label': x, 'value': x} for x in vehicle_types_parc],
+                        value='Car', placeholder='Filter by vehicle type (default is Car)', clearable=False),
+
+                ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                                   'padding': '6px 0px 0px 8px'})
+                        ], width = width_template),
+                dbc.Col([
+                html.Div([
+                    dcc.Markdown('''
+                        Choose between Parc and Sales (*Quarterly data only for Bus, Motorcycle and Other*):
+                        '''), 
+                    dcc.Dropdown(
+                        id='chart-picker',
+                        options=[{'label': x, 'value': x} for x in chart_type],
+                        value='Parc', placeholder='Filter by chart type (default is Parc)', clearable=False),
+
+                        ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                                   'padding': '6px 0px 0px 8px'})
+                        ], width = width_template),
+
+                    ]),
+            dbc.Row([
+                dbc.Col(
+                html.Div([   
+                dcc.RadioItems(id = 'percentage_button', options = [
+                    {'label': 'Absolute value', 'value': 'AV'},
+                    {'label': 'Percentage', 'value': 'PX'}
+                                    ], value = 'Absolute value')
+                    ], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                                   'padding': '6px 0px 0px 8px'}), width = width_template
+                        )
+                    ]),
+            dbc.Row([
+                dbc.Col(
+                    dcc.Loading(
+                        id="loading-1",
+                        children=[dcc.Graph(id='vehicleparc-graph', responsive = True),
+                                  dcc.Store(id='vehicleparc-figure', data=build_vehicleparcfig('Car', 'Parc'))],
+                        type="circle"), width = width_template
+                        )
+                    ]),        
+            ]
+                    )
+                        ), label="Vehicle Parc by fuel type and vehicle category"),
+        dbc.Tab(dbc.Card(
+            dbc.CardBody(
+                [
+         dbc.Row([
+            dbc.Col(
+            html.Div([
+            dcc.Markdown('''
+                **Quantity and receipts figures for motor spirit fuels, diesel oils, other fuels [Source: HMRC stats National Hydrocarbon bulletin, Q2 2022](https://www.gov.uk/government/statistics/hydrocarbon-oils-bulletin)**
+                         '''),
+            dcc.Markdown('''
+                These statistics report trends for tax liabilities and payments (receipts) by hydrocarbon oil traders but are less effective for analysis of fuels and oils once they’re circulating within the UK economy.
+                Total hydrocarbon oils quantities do not include 'road fuel gases (natural gas/liquefied petroleum gas)' as these are reported in kilograms rather than litres. The breakdown of receipts statistics for 
+                March 1990 are estimates based on historic quantities released for consumption and duty rates, as only the total receipts figure is available.
+
+                _Next publication is on 28 October 2022_
+                ''')]),
+                )
+            ]),
+         dbc.Row([
+            dbc.Col([    
+                html.Div([
+                   dcc.Dropdown(
+                        id='hc-chart-picker',
+                        options=[{'label': x, 'value': x} for x in hc_chart_type],
+                        value='Quantities', placeholder='Filter by chart type (default is Quantities)', clearable=False),
+                   dcc.Markdown('''
+                        Choose between Quantities and Receipts _(Note: April, May, June 2022 stats are provisional)_:
+                        '''),
+                    dcc.RadioItems(id = 'hc_percentage_button', options = [
+                    {'label': 'Absolute value', 'value': 'AV'},
+                    {'label': 'Percentage', 'value': 'PX'}
+                                    ], value = 'Absolute value')], style={'marginLeft': 10, 'marginRight': 10, 'marginTop': 10, 'marginBottom': 10, 
+                                                   'padding': '6px 0px 0px 8px'}),
+                    ], width = width_template),
+                ]),
+         dbc.Row([
+            dbc.Col(
+                        dcc.Loading(
+                        id="loading-2",
+                        children=[dcc.Graph(id='hcbulletin-graph', responsive = True),
+                                  dcc.Store(id='hcbulletin-figure', data=build_hcbulletinfig('Quantities'))],
+                        type="circle"), width = width_template
+                    )
+                ])   
+                ]
+                        )   
+                        ), label="HMRC Hydrocarbon Oils Quantities and Receipts"),
+
+        dbc.Tab(dbc.Card(
+        dbc.CardBody(
+            [    
+        dcc.Markdown('''
+            **Provisional average reported carbon dioxide (CO2) emission figures of vehicles registered for the first time by body type, fuel type and measure [Source: veh156 DfT, Q2 2022](https://www.gov.uk/government/statistical-data-sets/vehicle-licensing-statistics-data-tables)**
+                    '''),
+        dcc.Markdown('''
+            Transitioning to testing under WLTP was made mandatory for most cars in September 2018 and for most light goods vehicles in September 2019. However, the Reported figure used e-NEDC values to maintain tax and monitoring systems. The Reported figure moved to WLTP for cars in April 2020 and for light goods vehicles in March 2021.
+            Hybrid Electric (Petrol) and Plug-in Hybrid Electric (Petrol) data for Light Goods Vehicles is not available due to low reliability. 
+                    '''),
+            dbc.Row([
+                dbc.Col([
+                    dcc.Dropdown(
+                        id='veh156-vehicle-picker',
+                        options=[{'label': x, 'value': x} for x in vehicle_type_veh156],
+                        value='Cars', placeholder='Filter by vehicle type (default is Cars)', clearable=False),
+                    dcc.Loading(
+                        id="loading-3",
+                        children=[dcc.Graph(id='veh156fig-graph', responsive = True)],
+                        type="circle"),
+                    dcc.Store(id='veh156-figures', data=veh156figs)
+                        ], width = width_template),
+                    ])
+            ]
+                    )
+                        ), label="Average reported carbon dioxide emission figures of vehicles registered")    
+            ]),
+
+    ])
@@ -0,0 +1,178 @@
+# Compact JSON for figures sent to the browser.
+#
+# Numeric arrays in the traces (x, y, z, marker sizes and colours, ...) are
+# sent as base64 typed arrays, {"dtype": "f4", "bdata": "..."}, which
+# Plotly.js decodes itself (since 2.28, bundled from Dash 2.16). That is
+# smaller than a list of decimal numbers and much quicker for the browser to
+# parse. Each array gets the narrowest type that holds it exactly: whole
+# numbers go out as 8, 16 or 32 bit integers. Dates without a time of day
+# are sent as just the date, whether they come as datetime64 arrays or (as
+# older Plotly versions make of pandas columns) arrays of datetime objects.
+#
+# The source data rarely has the precision of a float64, so values can also
+# be rounded to a number of significant digits, set per dataset in DIGITS
+# (or FIGURE_DIGITS="LAem=4,ESCsales=5" in the environment). Rounded arrays
+# of 6 digits or fewer fit in float32. A figure built from several datasets
+# is rounded to the smallest setting among them.
+#
+# FIGURE_TYPED_ARRAYS=0 keeps plain lists (for an older Dash), still rounded.
+
+import base64
+import datetime
+import os
+
+import numpy as np
+import plotly.io as pio
+
+import dash
+
+
+# Significant digits kept per dataset; datasets not listed keep everything
+DIGITS = {
+    'LAem': 4,
+    'LAdf': 4,
+    'hcbulletin': 4,
+    'ESCpub': 4,
+    'ESCpri': 4,
+    'ESCsales': 4,
+    'ESCnewsales': 4,
+    'ESCparc': 4,
+    'WPDcapacity': 4,
+    'transportusage': 3,
+}
+for _setting in filter(None, os.environ.get('FIGURE_DIGITS', '').split(',')):
+    _name, _, _digits = _setting.partition('=')
+    DIGITS[_name.strip()] = int(_digits)
+
+# Trace attributes that hold numeric data, at any depth (marker.size etc.)
+ARRAYS = {'x', 'y', 'z', 'a', 'b', 'c', 'r', 'theta', 'lat', 'lon', 'values', 'locations',
+          'open', 'high', 'low', 'close', 'base', 'width', 'size', 'color', 'opacity',
+          'customdata', 'array', 'arrayminus', 'u', 'v', 'w', 'i', 'j', 'k'}
+# Shorter arrays aren't worth it
+MIN_LENGTH = 8
+
+INTEGERS = ('i1', 'u1', 'i2', 'u2', 'i4', 'u4')
+
+
+def _decodes_typed_arrays():
+    version = tuple(int(part) for part in dash.__version__.split('.')[:2] if part.isdigit())
+    return version >= (2, 16) and os.environ.get('FIGURE_TYPED_ARRAYS', '1') != '0'
+
+
+TYPED_ARRAYS = _decodes_typed_arrays()
+
+
+def digits(datasets):
+    settings = [DIGITS[name] for name in datasets if name in DIGITS]
+    return min(settings) if settings else None
+
+
+def to_json(figure, digits=None):
+    # pio.to_json(figure), with the numeric trace arrays encoded as above
+    if hasattr(figure, 'to_dict'):
+        figure = figure.to_dict()
+    if isinstance(figure, dict) and 'data' in figure:
+        figure = dict(figure, data=[_encode(trace, digits) for trace in figure['data']])
+    return pio.to_json(figure, validate=False)
+
+
+def _encode(value, digits):
+    if not isinstance(value, dict):
+        return value
+    encoded = {}
+    for key, item in value.items():
+        if isinstance(item, dict) and 'bdata' not in item:
+            encoded[key] = _encode(item, digits)
+            continue
+        days = _dates(item) if key in ARRAYS else None
+        if days is not None:
+            encoded[key] = days
+            continue
+        array = _array(item) if key in ARRAYS else None
+        encoded[key] = item if array is None else _typed(array, digits)
+    return encoded
+
+
+def _dates(value):
+    # Daily data as '2020-01-31' rather than '2020-01-31T00:00:00.000000',
+    # or None for anything else
+    array = _datetimes(value)
+    if array is None:
+        return None
+    days = array.astype('datetime64[D]')
+    if not (np.isnat(array) | (days == array)).all():
+        return None
+    return [None if text == 'NaT' else text for text in np.datetime_as_string(days)]
+
+
+def _datetimes(value):
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'M':
+        return value
+    if isinstance(value, np.ndarray) and value.dtype == object and value.ndim == 1:
+        value = value.tolist()
+    if not isinstance(value, (list, tuple)) or not value:
+        return None
+    # datetime, date and pd.Timestamp (a datetime); NaT compares unequal to itself
+    missing = [item is None or isinstance(item, datetime.date) and item != item for item in value]
+    if all(missing) or not all(is_missing or isinstance(item, datetime.date) and getattr(item, 'tzinfo', None) is None
+                               for item, is_missing in zip(value, missing)):
+        return None
+    return np.array([np.datetime64('NaT') if is_missing else np.datetime64(item, 'us')
+                     for item, is_missing in zip(value, missing)])
+
+
+def _array(value):
+    if isinstance(value, dict):
+        # Already a typed array (Plotly 6 encodes numpy arrays itself)
+        dtype = 'u1' if value['dtype'] == 'u1c' else value['dtype']
+        array = np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(dtype).newbyteorder('<'))
+        if 'shape' in value:
+            array = array.reshape([int(size) for size in str(value['shape']).split(',')])
+    elif isinstance(value, np.ndarray):
+        array = value
+    elif isinstance(value, (list, tuple)):
+        if len(value) < MIN_LENGTH:
+            return None
+        if all(isinstance(item, (list, tuple)) for item in value):
+            array = np.array(value)
+        elif all(item is None or isinstance(item, (int, float, np.number)) and not isinstance(item, bool) for item in value):
+            array = np.array(value, dtype='float64' if None in value else None)
+        else:
+            return None
+    else:
+        return None
+    if array.dtype.kind not in 'iuf' or array.size < MIN_LENGTH or array.ndim > 2:
+        return None
+    return array
+
+
+def _typed(array, digits):
+    if digits is not None:
+        array = _round(array.astype('float64'), digits)
+
+    if array.dtype.kind == 'f':
+        finite = np.isfinite(array)
+        if finite.all() and np.array_equal(array, np.round(array)) and np.abs(array).max() < 2 ** 31:
+            array = array.astype('int64')
+
+    if array.dtype.kind in 'iu':
+        low, high = array.min(), array.max()
+        dtype = next((dtype for dtype in INTEGERS
+                      if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max), 'f8')
+    else:
+        dtype = 'f4' if digits is not None and digits <= 6 else 'f8'
+
+    if not TYPED_ARRAYS:
+        return array.astype(dtype).tolist() if dtype != 'f4' else array.tolist()
+    spec = {'dtype': dtype, 'bdata': base64.b64encode(array.astype('<' + dtype).tobytes()).decode('ascii')}
+    if array.ndim == 2:
+        spec['shape'] = '%d, %d' % array.shape
+    return spec
+
+
+def _round(array, digits):
+    nonzero = np.isfinite(array) & (array != 0)
+    magnitude = np.zeros_like(array)
+    magnitude[nonzero] = np.floor(np.log10(np.abs(array[nonzero])))
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.where(nonzero, np.round(array * scale) / scale, array)
@@ -0,0 +1,174 @@
+# Where a cold start of the dashboard spends its time and memory.
+#
+#     python profile_startup.py [--module ultimatedashboard_cleaned_ofgem]
+#                               [--lazy] [--top 40] [--trace startup.folded]
+#
+# Imports the app with every module import and every datastore build timed,
+# then builds all registered datasets, figures and page layouts the way the
+# gunicorn master does (skip that part with --lazy). Each dataset is labelled
+# with the notebook cell (# In[n]:) it is registered in.
+#
+# The report lists the slowest steps by self time (their own time, not
+# counting the imports and datasets they triggered), with total time and the
+# change in resident memory. --trace also writes the whole tree:
+#
+#     *.json   Chrome trace events (chrome://tracing, Perfetto, speedscope)
+#     other    folded stacks in microseconds (flamegraph.pl, speedscope)
+#
+# Run it from the directory holding the data files, like the app itself.
+
+import argparse
+import builtins
+import contextlib
+import importlib
+import inspect
+import json
+import os
+import re
+import resource
+import sys
+import time
+
+
+class Profile:
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+        self._origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, kind, name):
+        self._stack.append(name)
+        stack = tuple(self._stack)
+        start, rss = time.perf_counter(), _rss()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.spans.append({'kind': kind, 'name': name, 'stack': stack,
+                               'start': start - self._origin,
+                               'seconds': time.perf_counter() - start,
+                               'rss_bytes': _rss() - rss})
+
+    def self_times(self):
+        children = {}
+        for span in self.spans:
+            children[span['stack'][:-1]] = children.get(span['stack'][:-1], 0) + span['seconds']
+        return {span['stack']: span['seconds'] - children.get(span['stack'], 0) for span in self.spans}
+
+
+def _rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        # Peak rather than current, but still grows with what is loaded
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _timed_imports(profile):
+    original = builtins.__import__
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        with profile.span('import', name):
+            return original(name, globals, locals, fromlist, level)
+
+    builtins.__import__ = timed_import
+    return original
+
+
+def _cells():
+    # Registry name -> 'pages/grid.py In[44]', from where it is registered
+    registration = re.compile(r"""(?:register|source|page_layout)\(\s*'([^']+)'""")
+    cells = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None) or ''
+        if not path.endswith('.py') or path.startswith((sys.prefix, sys.base_prefix)):
+            continue
+        try:
+            lines = inspect.getsource(module).splitlines()
+        except (OSError, TypeError):
+            continue
+        cell = None
+        for line in lines:
+            marker = re.match(r'# In\[(\d*)\]:', line)
+            if marker:
+                cell = marker.group(1)
+            for name in registration.findall(line):
+                location = module.__name__.replace('.', '/') + '.py'
+                cells.setdefault(name, '%s In[%s]' % (location, cell) if cell else location)
+    return cells
+
+
+def run(module, preload=True):
+    profile = Profile()
+    original = _timed_imports(profile)
+    try:
+        with profile.span('startup', 'import ' + module):
+            # Through the hook, so pandas and friends are timed too
+            datastore = __import__('datastore')
+            datastore.tracer = lambda name: profile.span('dataset', name)
+            importlib.import_module(module)
+        if preload:
+            with profile.span('startup', 'preload'):
+                datastore.preload()
+    finally:
+        builtins.__import__ = original
+        sys.modules['datastore'].tracer = None
+    return profile
+
+
+def report(profile, top):
+    cells = _cells()
+    self_times = profile.self_times()
+    rows = sorted(profile.spans, key=lambda span: self_times[span['stack']], reverse=True)
+    total = max(span['start'] + span['seconds'] for span in profile.spans)
+
+    print('%-8s %-40s %-28s %9s %9s %9s' % ('kind', 'name', 'cell', 'self', 'total', 'memory'))
+    for span in rows[:top]:
+        cell = cells.get(span['name'], '') if span['kind'] == 'dataset' else ''
+        print('%-8s %-40s %-28s %8.0fms %8.0fms %7.1fMB' % (
+            span['kind'], span['name'][:40], cell[:28], self_times[span['stack']] * 1e3,
+            span['seconds'] * 1e3, span['rss_bytes'] / 1e6))
+
+    for kind in ('import', 'dataset'):
+        spans = [span for span in profile.spans if span['kind'] == kind]
+        print('%s: %d, %.2fs self time' % (kind + 's', len(spans),
+                                          sum(self_times[span['stack']] for span in spans)))
+    print('startup: %.2fs, %.0fMB resident' % (total, _rss() / 1e6))
+
+
+def write_trace(profile, path):
+    if path.endswith('.json'):
+        events = [{'name': span['name'], 'cat': span['kind'], 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+                   'ts': span['start'] * 1e6, 'dur': span['seconds'] * 1e6,
+                   'args': {'rss_bytes': span['rss_bytes']}}
+                  for span in profile.spans]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events}, f)
+        return
+
+    with open(path, 'w') as f:
+        for stack, seconds in profile.self_times().items():
+            f.write('%s %d\n' % (';'.join(stack), max(seconds * 1e6, 0)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile a cold start of the dashboard.')
+    parser.add_argument('--module', default='ultimatedashboard_cleaned_ofgem')
+    parser.add_argument('--lazy', action='store_true', help="don't build the registered datasets")
+    parser.add_argument('--top', type=int, default=40)
+    parser.add_argument('--trace', help='also write the tree (.json for Chrome trace events, else folded stacks)')
+    options = parser.parse_args()
+
+    sys.path.insert(0, os.getcwd())
+    profile = run(options.module, preload=not options.lazy)
+    report(profile, options.top)
+    if options.trace:
+        write_trace(profile, options.trace)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+# Opt-in sampling profiler for single callback requests.
+#
+# A callback request is profiled when it carries an X-Profile: 1 header, or
+# when the page it comes from was opened with ?profile=1 (Dash's requests
+# don't have a query string of their own, but their Referer does). Only
+# users listed in PROFILING_USERS (comma-separated) who have logged in can
+# turn it on; with the variable unset profiling is off.
+#
+# While the request runs, a thread samples its stack every INTERVAL seconds.
+# Each sample is put in one phase by the most specific thing on the stack:
+#
+#     json encoding         Dash/Plotly serializing the outputs
+#     template              applying a layout template
+#     plotly express        px.* figure construction
+#     figure construction   graph_objs validation and assembly
+#     pandas / numpy        data wrangling
+#     callback              everything else, i.e. the callback's own code
+#
+# The result (time per phase plus the sampled call tree, rooted at Dash's
+# dispatch) is written to PROFILE_DIR and its URL is returned in the
+# X-Profile response header, e.g. /profiles/1700000000-update_figure.json.
+
+import collections
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+
+import _plotly_utils
+import dash
+import flask
+import numpy
+import pandas
+import plotly
+
+import datastore
+
+
+INTERVAL = float(os.environ.get('PROFILING_INTERVAL', 0.005))
+USERS = {user for user in os.environ.get('PROFILING_USERS', '').split(',') if user}
+PROFILE_DIR = os.path.join(datastore.CACHE_DIR, 'profiles')
+# Older profiles are removed once there are more than this many
+KEEP = 200
+
+
+def _root(module):
+    # Frames are matched on where the installed packages live, not on names
+    # that dash_bootstrap_components or a checkout directory may share
+    return os.path.dirname(module.__file__) + os.sep
+
+
+DASH = _root(dash)
+PLOTLY = _root(plotly)
+PLOTLY_UTILS = _root(_plotly_utils)
+JSON = _root(json)
+PANDAS = _root(pandas)
+NUMPY = _root(numpy)
+
+# Checked in order, so a pandas call made by px counts as plotly express
+PHASES = [
+    ('json encoding', lambda path, function: function in ('to_json', 'to_json_plotly', 'encode', 'iterencode', 'dumps')
+        and path.startswith((PLOTLY, PLOTLY_UTILS, DASH, JSON))),
+    ('template', lambda path, function: 'template' in function and path.startswith((PLOTLY, PLOTLY_UTILS))),
+    ('plotly express', lambda path, function: path.startswith(os.path.join(PLOTLY, 'express') + os.sep)),
+    ('figure construction', lambda path, function: path.startswith(os.path.join(PLOTLY, 'graph_objs') + os.sep)
+        or path in (os.path.join(PLOTLY, 'basedatatypes.py'), os.path.join(PLOTLY_UTILS, 'basevalidators.py'))),
+    ('pandas', lambda path, function: path.startswith(PANDAS)),
+    ('numpy', lambda path, function: path.startswith(NUMPY)),
+]
+
+
+class Sampler:
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.stacks = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self.started
+
+    def _run(self):
+        while not self._stop.wait(INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append((frame.f_code.co_filename, frame.f_code.co_name))
+                frame = frame.f_back
+            stack.reverse()
+            # Start at Dash's dispatch, dropping the WSGI and Flask frames
+            for i, (path, function) in enumerate(stack):
+                if function == 'dispatch' and path.startswith(DASH):
+                    stack = stack[i:]
+                    break
+            self.stacks[tuple(stack)] += 1
+
+
+def phase(stack):
+    for name, matches in PHASES:
+        if any(matches(path, function) for path, function in stack):
+            return name
+    return 'callback'
+
+
+def summary(sampler, callback):
+    samples = sum(sampler.stacks.values())
+    phases = collections.Counter()
+    tree = {'name': 'dispatch', 'samples': 0, 'children': {}}
+    for stack, count in sampler.stacks.items():
+        phases[phase(stack)] += count
+        node = tree
+        node['samples'] += count
+        for path, function in stack[1:]:
+            label = '%s (%s)' % (function, _short(path))
+            node = node['children'].setdefault(label, {'name': label, 'samples': 0, 'children': {}})
+            node['samples'] += count
+    return {'callback': callback, 'seconds': sampler.seconds, 'interval': INTERVAL, 'samples': samples,
+            'phases': {name: sampler.seconds * count / samples for name, count in phases.most_common()}
+                      if samples else {},
+            'tree': _listed(tree)}
+
+
+def _short(path):
+    # Path from the package root, e.g. plotly/express/_core.py
+    parts = path.split(os.sep)
+    for marker in ('site-packages', 'dist-packages'):
+        if marker in parts:
+            return '/'.join(parts[parts.index(marker) + 1:])
+    return '/'.join(parts[-2:])
+
+
+def _listed(node):
+    children = sorted(node['children'].values(), key=lambda child: child['samples'], reverse=True)
+    return dict(node, children=[_listed(child) for child in children])
+
+
+def install(app, auth=None):
+    if not USERS:
+        return
+    server = app.server
+
+    def requested():
+        if not flask.request.path.endswith('_dash-update-component'):
+            return False
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(flask.request.referrer or '').query)
+        if flask.request.headers.get('X-Profile') != '1' and query.get('profile') != ['1']:
+            return False
+        return authorized()
+
+    def authorized():
+        credentials = flask.request.authorization
+        if credentials is None or credentials.username not in USERS:
+            return False
+        return auth is None or auth.is_authorized()
+
+    @server.before_request
+    def start_profile():
+        if requested():
+            flask.g.profile = Sampler(threading.get_ident())
+            flask.g.profile.start()
+
+    @server.after_request
+    def finish_profile(response):
+        sampler = flask.g.pop('profile', None)
+        if sampler is None:
+            return response
+        sampler.stop()
+        body = flask.request.get_json(silent=True) or {}
+        entry = app.callback_map.get(body.get('output'), {})
+        callback = getattr(entry.get('callback'), '__name__', body.get('output'))
+        name = '%d-%s.json' % (time.time() * 1000, callback)
+        _save(name, summary(sampler, callback))
+        response.headers['X-Profile'] = '/profiles/' + name
+        return response
+
+    @server.route('/profiles/<name>')
+    def profile_file(name):
+        if not authorized():
+            flask.abort(403)
+        return flask.send_from_directory(os.path.abspath(PROFILE_DIR), name, mimetype='application/json')
+
+
+def _save(name, profile):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    datastore._atomic_write(os.path.join(PROFILE_DIR, name), json.dumps(profile, indent=1).encode())
+    names = sorted(name for name in os.listdir(PROFILE_DIR) if name.endswith('.json'))
+    for old in names[:-KEEP]:
+        os.remove(os.path.join(PROFILE_DIR, old))
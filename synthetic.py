@@ -0,0 +1,283 @@
+# Synthetic stand-ins for the dashboard's data files, used by benchmark.py.
+#
+# Every generator writes a file with the same name, columns, value formats
+# and categories as the published one, with roughly its row count times
+# `scale`. Values are random walks, so charts have a realistic shape for
+# downsampling and serialization, but nothing else about them is real.
+#
+# Time series grow by going further back in time. Monthly and daily series
+# long enough to run past the start of pandas' timestamp range (or of a
+# two-digit year format) repeat their periods instead, which keeps the row
+# count right at the cost of duplicate dates.
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+import geometry
+
+
+FILES = {}
+
+
+def _file(name):
+    def decorator(generator):
+        FILES[name] = generator
+        return generator
+    return decorator
+
+
+def write(directory, scale, names=None, seed=0):
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    for name in names or sorted(FILES):
+        data = FILES[name](scale, rng)
+        path = os.path.join(directory, name)
+        if isinstance(data, pd.DataFrame):
+            data.to_csv(path, index=False)
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f)
+
+
+def _periods(count, freq, end='2022-06-30', first='1678-01-01'):
+    available = len(pd.date_range(first, end, freq=freq))
+    periods = pd.date_range(end=end, periods=min(count, available), freq=freq)
+    if count > len(periods):
+        periods = pd.DatetimeIndex(np.sort(np.resize(periods.values, count)))
+    return periods
+
+
+def _walk(rng, count, size=1000.0):
+    return np.round(np.abs(np.cumsum(rng.normal(0, 0.05, count))) * size + size, 1)
+
+
+## Vehicle Data
+
+PARC_FUELS = ['Petrol', 'Diesel', 'Battery electric', 'Hybrid electric (petrol)',
+              'Hybrid electric (diesel)', 'Plug-in hybrid electric (petrol)',
+              'Plug-in hybrid electric (diesel)', 'Range extended electric', 'Fuel cell electric',
+              'Gas', 'Other fuel types']
+PARC_VEHICLES = ['Bus', 'Car', 'HGV', 'Van', 'Motorcycle', 'Other']
+
+
+@_file('parc_Q2_2022.csv')
+def parc(scale, rng):
+    # Quarterly parc and sales since 1994, monthly sales since 2001
+    charts = [('Parc', 'QS', '%Y %B', 114), ('Sales (Quarterly)', 'QS', '%Y %B', 114),
+              ('Sales (Monthly)', 'MS', '%B %Y', 258)]
+    frames = []
+    for vehicle in PARC_VEHICLES:
+        for chart, freq, date_format, count in charts:
+            periods = _periods(count * scale, freq)
+            frame = pd.DataFrame({'Period': periods.strftime(date_format)})
+            for fuel in PARC_FUELS:
+                frame[fuel] = _walk(rng, len(periods))
+            frame['Total'] = frame[PARC_FUELS].sum(axis=1)
+            frame['Vehicle_type'] = vehicle
+            frame['Chart_type'] = chart
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+HC_COLUMNS = ['Ultra low sulphur petrol', 'Lead replacement petrol', 'Super unleaded petrol',
+              'Ultra low sulphur diesel', 'Sulphur free diesel', 'Other diesel', 'Total road fuels',
+              'Gas oil', 'Fuel oil', 'Aviation turbine fuel', 'Aviation gasoline', 'Total other fuels',
+              'Bioethanol', 'Biodiesel', 'Total hydrocarbon oils']
+
+
+@_file('hc_oils_bulletin_q2_2022.csv')
+def hcbulletin(scale, rng):
+    # Monthly since 2000 for both the receipts and the quantities tables
+    frames = []
+    for chart in ['Receipts', 'Quantities']:
+        periods = _periods(270 * scale, 'MS')
+        frame = pd.DataFrame({'Period': periods.strftime('%B %Y')})
+        for column in HC_COLUMNS + ['Road Fuel gases']:
+            frame[column] = _walk(rng, len(periods), 100)
+        frame['Chart_type'] = chart
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+VEH156_FUELS = ['Petrol', 'Diesel', 'Hybrid electric (petrol)', 'Plug-in hybrid electric (petrol)', 'Total']
+
+
+@_file('veh156_Q2_2022.csv')
+def veh156(scale, rng):
+    # Monthly since WLTP reporting started in 2018
+    frames = []
+    for body in ['Cars', 'Light goods vehicles']:
+        periods = _periods(54 * scale, 'MS')
+        frame = pd.DataFrame({'Date': periods.strftime('%B %Y'), 'BodyType': body,
+                              'Geography': 'United Kingdom', 'Units': 'g/km', 'Measure': 'Mean',
+                              'Keepership': 'All', 'Licence status': 'Registered'})
+        for fuel in VEH156_FUELS:
+            frame[fuel] = _walk(rng, len(periods), 120)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+## Local Authority Data
+
+REGIONS = ['North East', 'North West', 'Yorkshire and the Humber', 'East Midlands', 'West Midlands',
+           'East of England', 'London', 'South East', 'South West', 'Wales', 'Scotland']
+SUBSECTORS = ['Industry Electricity', 'Industry Gas', 'Large Industrial Installations', 'Industry Other',
+              'Commercial Electricity', 'Commercial Gas', 'Commercial Other', 'Public Sector Electricity',
+              'Public Sector Gas', 'Public Sector Other', 'Domestic Electricity', 'Domestic Gas',
+              'Domestic Other', 'Road Transport (A roads)', 'Road Transport (Motorways)',
+              'Road Transport (Minor roads)', 'Diesel Railways', 'Transport Other', 'Total']
+LA_COUNT = 361
+
+
+def _authorities():
+    return ['Authority %03d' % i for i in range(LA_COUNT)]
+
+
+@_file('uk-local-authority-ghg-emissions-2020-dataset.csv')
+def LAem(scale, rng):
+    # One row per authority and sub-sector for each year, 2020 going back
+    names = _authorities()
+    years = 2020 - np.arange(scale)
+    rows = pd.MultiIndex.from_product([years, range(LA_COUNT), SUBSECTORS],
+                                      names=['Calendar Year', 'index', 'LA GHG Sub-sector']).to_frame(index=False)
+    rows['Local Authority'] = np.take(names, rows.pop('index'))
+    rows['Local Authority Code'] = 'E0' + rows['Local Authority'].str[-3:]
+    rows['Region'] = np.take(REGIONS, rows['Local Authority'].str[-3:].astype(int) % len(REGIONS))
+    rows['LA GHG Sector'] = rows['LA GHG Sub-sector'].str.split().str[0]
+    rows['Greenhouse gas'] = 'CO2'
+    rows['Territorial emissions (kt CO2e)'] = np.round(rng.gamma(2, 50, len(rows)), 2)
+    rows['CO2 emissions within the scope of influence of LAs (kt CO2e)'] = np.round(
+        rows['Territorial emissions (kt CO2e)'] * rng.uniform(0.5, 1, len(rows)), 2)
+    return rows
+
+
+@_file(geometry.SOURCE)
+def LA_map2(scale, rng):
+    # A grid of square districts named like the authorities in LAem
+    features = []
+    for i, name in enumerate(_authorities()):
+        lon, lat = -6 + (i % 19) * 0.4, 50 + (i // 19) * 0.4
+        ring = [[lon, lat], [lon + 0.4, lat], [lon + 0.4, lat + 0.4], [lon, lat + 0.4], [lon, lat]]
+        features.append({'type': 'Feature',
+                         'properties': {'LAD21CD': 'E0%03d' % i, 'LAD21NM': name},
+                         'geometry': {'type': 'Polygon', 'coordinates': [ring]}})
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+## Grid Infrastructure Data
+
+@_file('new-connections-may-2022-update.csv')
+def WPDcapacity(scale, rng):
+    count = 2000 * scale
+    statuses = ['Budget Estimates Provided', 'Connection Offer Accepted', 'Connection Offer Not Accepted']
+    return pd.DataFrame({
+        'Licence Area': rng.choice(['East Midlands', 'West Midlands', 'South Wales', 'South West'], count),
+        'Grid Supply Point': rng.choice(['GSP %d' % i for i in range(40)], count),
+        'Bulk Supply Point': rng.choice(['BSP %d' % i for i in range(200)], count),
+        'Primary': rng.choice(['Primary %d' % i for i in range(900)], count),
+        'Connection Status': rng.choice(statuses, count),
+        'Proposed Connection Voltage (kV)': rng.choice([0.4, 11, 33, 66, 132], count),
+        'Total Demand Capacity (MW)': np.round(rng.gamma(1, 2, count), 3),
+        'Total Generation Capacity (MW)': np.round(rng.gamma(1, 3, count), 3),
+        'Total Storage Capacity (MW)': np.round(rng.gamma(1, 1, count), 3),
+        'Number of Connections': rng.integers(1, 50, count),
+        'year': rng.choice([2021, 2022], count),
+    })
+
+
+## Chargepoint and EVET Modelling Data
+
+def _years(count, last):
+    return np.arange(last - count + 1, last + 1)
+
+
+@_file('ZapMapPUBCP.csv')
+def ZapMapPUBCP(scale, rng):
+    years = _years(12 * scale, 2022)
+    frame = pd.DataFrame({'': years})
+    for column in ['slow', 'fast', 'Rapid', 'Ultra - Rapid']:
+        frame[column] = np.round(_walk(rng, len(years), 2000)).astype(int)
+    frame['Total'] = frame[['slow', 'fast', 'Rapid', 'Ultra - Rapid']].sum(axis=1)
+    frame['Forecast'] = np.round(np.linspace(1000, frame['Total'].iloc[-1] * 1.5, len(years)))
+    return frame
+
+
+@_file('EVHS-WCSdata.csv')
+def EVHS(scale, rng):
+    periods = _periods(60 * scale, 'MS', first='1969-01-01')
+    return pd.DataFrame({'Date': periods.strftime('%y-%b'),
+                         'Charging Devices Installed': rng.integers(1000, 8000, len(periods)),
+                         'Sockets installed': rng.integers(0, 3000, len(periods))})
+
+
+ESC_POWERTRAINS = ['BEV', 'PHEV', 'HEV', 'ICE']
+
+
+@_file('ESC_cp_numbers.csv')
+def ESCpub(scale, rng):
+    years = _years(18 * scale, 2035)
+    frame = pd.DataFrame({'Year': years})
+    for column in ['Destination', 'En-route', 'On-street residential', 'Workplace']:
+        frame[column] = np.round(_walk(rng, len(years), 20000)).astype(int)
+    frame['Total Public Chargepoints'] = frame.iloc[:, 1:].sum(axis=1)
+    return frame
+
+
+@_file('ESC_home_cp.csv')
+def ESCpri(scale, rng):
+    years = _years(15 * scale, 2035)
+    return pd.DataFrame({'Year': years,
+                         'Home Chargepoints': np.round(_walk(rng, len(years), 500000)).astype(int)})
+
+
+def _ESCsales(scale, rng, size):
+    frames = []
+    for vehicle in ['Car', 'Van']:
+        years = _years(16 * scale, 2035)
+        frame = pd.DataFrame({'Year': years})
+        shares = rng.dirichlet(np.ones(len(ESC_POWERTRAINS)), len(years))
+        for i, powertrain in enumerate(ESC_POWERTRAINS):
+            frame[powertrain] = np.round(shares[:, i] * size, 4)
+        frame['Type'] = vehicle
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+@_file('ESC_propofsales_powertrain.csv')
+def ESCsales(scale, rng):
+    return _ESCsales(scale, rng, 1)
+
+
+@_file('ESC_new_sales_powertrain.csv')
+def ESCnewsales(scale, rng):
+    return _ESCsales(scale, rng, 2.5)
+
+
+@_file('ESC_vehicle_parc.csv')
+def ESCparc(scale, rng):
+    # Rows are years written as floats (the page reads the 2030.0 and 2035.0
+    # columns after transposing); the four powertrains line up with SMMT's
+    years = np.concatenate([[2030.0, 2035.0], 2040.0 + np.arange(2 * scale - 2)])
+    frame = pd.DataFrame({'Year': years})
+    for powertrain in ['BEV', 'PHEV', 'HEV', 'ICE']:
+        frame[powertrain] = np.round(_walk(rng, len(years), 5e6))
+    return frame
+
+
+## Other Zemo WG Data
+
+TU_MODES = ['Cars', 'Light Commercial Vehicles', 'Heavy Goods Vehicles', 'National Rail',
+            'Transport for London Tube', 'Transport for London Bus', 'Bus (excluding London)', 'Cycling']
+
+
+@_file('COVID19data_11_2022.csv')
+def transportusage(scale, rng):
+    # Daily since March 2020, as fractions of the pre-pandemic level
+    periods = _periods(980 * scale, 'D', end='2022-11-06')
+    frame = pd.DataFrame({'Date': periods.strftime('%d-%b-%Y')})
+    for mode in TU_MODES:
+        frame[mode] = np.round(_walk(rng, len(periods), 0.8), 3)
+    return frame
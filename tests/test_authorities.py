@@ -0,0 +1,75 @@
+# Joining Local Authority data to the boundary index: every spelling of a
+# district lands on its ID, and the joined tables have one row per ID.
+#
+#     python -m unittest discover tests
+
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import authorities
+
+
+DISTRICTS = [('E06000058', 'Bournemouth, Christchurch and Poole'), ('E07000244', 'East Suffolk'),
+             ('E06000023', 'Bristol, City of'), ('W06000016', 'Rhondda Cynon Taf')]
+
+
+def _index():
+    collection = {'type': 'FeatureCollection', 'features': [
+        {'type': 'Feature', 'properties': {'LAD21CD': code, 'LAD21NM': name}, 'geometry': None}
+        for code, name in DISTRICTS]}
+    return authorities.build(collection)
+
+
+class IdsTest(unittest.TestCase):
+    def test_spellings(self):
+        entries = _index()
+        found = authorities.ids(entries, ['City of Bristol LPA', 'Bristol, City of', 'Rhondda Cynon Taff', 'Poole',
+                                          'Bournemouth, Christchurch and Poole'])
+        self.assertEqual(list(found), [2, 2, 3, 0, 0])
+
+    def test_codes_first(self):
+        found = authorities.ids(_index(), ['Somewhere else'], ['E07000244'])
+        self.assertEqual(list(found), [1])
+
+    def test_unknown(self):
+        with self.assertLogs('authorities', 'WARNING'):
+            self.assertEqual(list(authorities.ids(_index(), ['Atlantis'])), [-1])
+
+    def test_ids_kept_across_rebuilds(self):
+        previous = [{'id': 7, 'code': 'E06000023', 'name': 'Bristol, City of'}]
+        collection = {'features': [{'properties': {'LAD21CD': code, 'LAD21NM': name}} for code, name in DISTRICTS]}
+        ids = {entry['code']: entry['id'] for entry in authorities.build(collection, previous)}
+        self.assertEqual(ids['E06000023'], 7)
+        self.assertEqual(sorted(ids.values()), [7, 8, 9, 10])
+
+
+class LAdfTest(unittest.TestCase):
+    def test_joined_ids_unique(self):
+        from pages import local_authorities
+
+        names = ['Bournemouth LPA', 'Poole LPA', 'Bournemouth, Christchurch and Poole LPA',
+                 'Waveney LPA', 'Suffolk Coastal LPA', 'Bristol, City of LPA', 'Atlantis LPA', 'Lyonesse LPA']
+        LAdf = pd.DataFrame({'name': names, 'percapita': range(len(names))})
+        for i in range(8):
+            # The loader drops the trailing columns of the source file
+            LAdf['unused %d' % i] = 0
+
+        with self.assertLogs('authorities', 'WARNING') as logs:
+            joined = local_authorities.load_LAdf(LAdf, _index())
+
+        placed = joined[joined['LA id'] >= 0]
+        self.assertTrue(placed['LA id'].is_unique)
+        self.assertEqual(list(placed['Local Planning Authority']),
+                         ['Bournemouth, Christchurch and Poole', 'Waveney', 'Bristol, City of'])
+        # Unplaced authorities are all kept (and logged)
+        self.assertEqual((joined['LA id'] < 0).sum(), 2)
+        self.assertTrue(any('Poole' in message and 'dropped' in message for message in logs.output))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# Single-flight builds in the in-memory figure cache, and how they are counted.
+#
+#     python -m unittest discover tests
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import plotly.graph_objs as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import figurecache
+
+
+@mock.patch.object(figurecache, 'backend', figurecache.MemoryBackend())
+class MemoizeTest(unittest.TestCase):
+    def setUp(self):
+        figurecache.clear()
+
+    def test_concurrent_requests_build_once(self):
+        builds = []
+
+        @figurecache.memoize()
+        def slow(n):
+            builds.append(n)
+            time.sleep(0.2)
+            return go.Figure(go.Bar(y=[n]))
+
+        threads = [threading.Thread(target=slow, args=(1,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(builds, [1])
+        counts = figurecache.stats()['callbacks']['slow']
+        self.assertEqual(counts, {'hits': 3, 'misses': 1})
+        self.assertEqual(figurecache.backend._flights, {})
+
+    def test_nested_builds(self):
+        @figurecache.memoize()
+        def inner(n):
+            return go.Figure(go.Bar(y=[n]))
+
+        @figurecache.memoize()
+        def outer(n):
+            return go.Figure(data=inner(n)['data'] + inner(n + 1)['data'])
+
+        done = threading.Event()
+        threading.Thread(target=lambda: (outer(1), done.set()), daemon=True).start()
+        self.assertTrue(done.wait(10), 'nested memoized builds deadlocked')
+
+    def test_unrelated_builds_run_side_by_side(self):
+        running = threading.Barrier(2, timeout=10)
+
+        @figurecache.memoize()
+        def waits_for_the_other(n):
+            running.wait()
+            return go.Figure(go.Bar(y=[n]))
+
+        threads = [threading.Thread(target=waits_for_the_other, args=(n,)) for n in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(running.broken)
+
+
+if __name__ == '__main__':
+    unittest.main()
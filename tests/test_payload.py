@@ -0,0 +1,117 @@
+# The compact figure encoding of payload.py: dtype choice, rounding, which
+# arrays are left alone, and that the typed arrays decode to the values sent.
+#
+#     python -m unittest discover tests
+
+import base64
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import payload
+
+
+def _decode(spec):
+    array = np.frombuffer(base64.b64decode(spec['bdata']), dtype=np.dtype(spec['dtype']).newbyteorder('<'))
+    if 'shape' in spec:
+        array = array.reshape([int(size) for size in spec['shape'].split(',')])
+    return array
+
+
+@mock.patch.object(payload, 'TYPED_ARRAYS', True)
+class TypedTest(unittest.TestCase):
+    def test_integer_dtypes(self):
+        for values, dtype in [([-5, 5], 'i1'), ([0, 200], 'u1'), ([-300, 300], 'i2'), ([0, 60000], 'u2'),
+                              ([-70000, 70000], 'i4'), ([0, 3000000000], 'u4')]:
+            array = np.linspace(values[0], values[1], payload.MIN_LENGTH).round().astype('int64')
+            spec = payload._typed(array, None)
+            self.assertEqual(spec['dtype'], dtype, values)
+            np.testing.assert_array_equal(_decode(spec), array)
+
+    def test_whole_floats_become_integers(self):
+        spec = payload._typed(np.arange(10, dtype='float64'), None)
+        self.assertEqual(spec['dtype'], 'i1')
+
+    def test_float_dtypes(self):
+        array = np.linspace(0.1, 2.7, 10)
+        self.assertEqual(payload._typed(array, None)['dtype'], 'f8')
+        self.assertEqual(payload._typed(array, 4)['dtype'], 'f4')
+        self.assertEqual(payload._typed(array, 7)['dtype'], 'f8')
+        np.testing.assert_array_equal(_decode(payload._typed(array, None)), array)
+
+    def test_rounded_values_survive_float32(self):
+        array = np.array([123.456789, -0.00123456, 98765.4321, 1.5, np.nan, 0.0, 7.77777, -42.4242])
+        decoded = _decode(payload._typed(array, 4))
+        np.testing.assert_allclose(decoded, payload._round(array, 4), rtol=1e-6)
+        self.assertTrue(np.isnan(decoded[4]))
+
+    def test_two_dimensional_shape(self):
+        array = np.arange(24, dtype='float64').reshape(3, 8) / 4
+        spec = payload._typed(array, None)
+        self.assertEqual(spec['shape'], '3, 8')
+        np.testing.assert_array_equal(_decode(spec), array)
+
+    def test_plain_lists_without_typed_arrays(self):
+        array = np.linspace(0.1, 2.7, 10)
+        with mock.patch.object(payload, 'TYPED_ARRAYS', False):
+            self.assertEqual(payload._typed(array, 2), payload._round(array, 2).tolist())
+            self.assertEqual(payload._typed(np.arange(10), None), list(range(10)))
+
+
+class RoundTest(unittest.TestCase):
+    def test_significant_digits(self):
+        array = np.array([123456.0, 0.000123456, -9.87654, 1.0, 999.96])
+        np.testing.assert_allclose(payload._round(array, 3), [123000.0, 0.000123, -9.88, 1.0, 1000.0])
+
+    def test_zero_and_missing_kept(self):
+        rounded = payload._round(np.array([0.0, np.nan, np.inf, -np.inf]), 3)
+        self.assertEqual(rounded[0], 0.0)
+        self.assertTrue(np.isnan(rounded[1]))
+        self.assertEqual(list(rounded[2:]), [np.inf, -np.inf])
+
+
+@mock.patch.object(payload, 'TYPED_ARRAYS', True)
+class ToJsonTest(unittest.TestCase):
+    def trace(self, **attributes):
+        return json.loads(payload.to_json({'data': [dict(type='scatter', **attributes)], 'layout': {}}))['data'][0]
+
+    def test_short_arrays_left_alone(self):
+        short = list(range(payload.MIN_LENGTH - 1))
+        self.assertEqual(self.trace(y=short)['y'], short)
+        self.assertIn('bdata', self.trace(y=short + [7])['y'])
+
+    def test_non_numeric_arrays_left_alone(self):
+        names = ['a'] * payload.MIN_LENGTH
+        self.assertEqual(self.trace(x=names)['x'], names)
+        self.assertEqual(self.trace(text=list(range(10)))['text'], list(range(10)))
+
+    def test_nested_attributes(self):
+        trace = self.trace(marker={'size': list(range(10))})
+        np.testing.assert_array_equal(_decode(trace['marker']['size']), range(10))
+
+    def test_daily_dates(self):
+        days = pd.date_range('2020-01-30', periods=10, freq='D')
+        expected = [day.strftime('%Y-%m-%d') for day in days]
+        self.assertEqual(self.trace(x=days.values)['x'], expected)
+        # Older Plotly versions hand over datetime objects rather than datetime64
+        self.assertEqual(self.trace(x=np.array(list(days), dtype=object))['x'], expected)
+        self.assertEqual(self.trace(x=list(days.to_pydatetime()))['x'], expected)
+        with_gap = [days[0].to_pydatetime(), None, pd.NaT] + list(days[3:])
+        self.assertEqual(self.trace(x=with_gap)['x'], [expected[0], None, None] + expected[3:])
+
+    def test_dates_with_times_kept(self):
+        hours = list(pd.date_range('2020-01-30', periods=10, freq='h').to_pydatetime())
+        self.assertTrue(self.trace(x=hours)['x'][1].startswith('2020-01-30T01:00:00'))
+        zoned = list(pd.date_range('2020-01-30', periods=10, freq='D', tz='UTC'))
+        self.assertGreater(len(self.trace(x=zoned)['x'][0]), len('2020-01-30'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# Who gets profiled, and where samples are counted.
+#
+#     python -m unittest discover tests
+
+import base64
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import dash
+from dash import html, Input, Output
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import profiling
+
+
+class PhaseTest(unittest.TestCase):
+    def test_installed_packages(self):
+        stack = [(os.path.join(profiling.DASH, '_callback.py'), 'dispatch'),
+                 (os.path.join(profiling.PANDAS, 'core', 'frame.py'), '__getitem__')]
+        self.assertEqual(profiling.phase(stack), 'pandas')
+        encoder = [(os.path.join(profiling.JSON, 'encoder.py'), 'iterencode')]
+        self.assertEqual(profiling.phase(encoder), 'json encoding')
+
+    def test_lookalike_paths_are_the_callback(self):
+        # dash_bootstrap_components, or a checkout called dashboard, isn't Dash
+        stack = [('/srv/dashboard/pages/vehicles.py', 'dumps'),
+                 (os.path.join(os.path.dirname(profiling.DASH.rstrip(os.sep)), 'dash_bootstrap_components',
+                               '_components', 'Tab.py'), 'encode'),
+                 ('/srv/my-plotly-tools/pandas/helpers.py', 'build')]
+        self.assertEqual(profiling.phase(stack), 'callback')
+
+
+class RequestedTest(unittest.TestCase):
+    def setUp(self):
+        self.app = dash.Dash(__name__)
+        self.app.layout = html.Div([html.Div(id='in'), html.Div(id='out')])
+
+        @self.app.callback(Output('out', 'children'), Input('in', 'children'))
+        def echo(value):
+            return value
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for patch in (mock.patch.object(profiling, 'USERS', {'analyst'}),
+                      mock.patch.object(profiling, 'PROFILE_DIR', directory.name)):
+            patch.start()
+            self.addCleanup(patch.stop)
+        profiling.install(self.app)
+        self.client = self.app.server.test_client()
+        self.client.get('/')
+
+    def profiled(self, referrer, user='analyst'):
+        body = {'output': 'out.children', 'outputs': {'id': 'out', 'property': 'children'},
+                'inputs': [{'id': 'in', 'property': 'children', 'value': 'x'}], 'changedPropIds': ['in.children']}
+        credentials = base64.b64encode(('%s:secret' % user).encode()).decode()
+        response = self.client.post('/_dash-update-component', data=json.dumps(body),
+                                    content_type='application/json',
+                                    headers={'Referer': referrer, 'Authorization': 'Basic ' + credentials})
+        self.assertEqual(response.status_code, 200)
+        return 'X-Profile' in response.headers
+
+    def test_query_parameter(self):
+        self.assertTrue(self.profiled('http://host/page-4?profile=1'))
+        self.assertTrue(self.profiled('http://host/page-4?tab=2&profile=1'))
+
+    def test_lookalike_parameters(self):
+        self.assertFalse(self.profiled('http://host/page-4?xprofile=1'))
+        self.assertFalse(self.profiled('http://host/page-4?profile=10'))
+        self.assertFalse(self.profiled('http://host/page-4#profile=1'))
+
+    def test_only_listed_users(self):
+        self.assertFalse(self.profiled('http://host/page-4?profile=1', user='visitor'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# Reloading a changed data file has to reach the figures a page layout
+# carries inline, not just the datasets it was drawn from.
+#
+#     python -m unittest discover tests
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datastore
+import figurecache
+import synthetic
+
+
+def _find(node, component_id):
+    if isinstance(node, dict):
+        if node.get('props', {}).get('id') == component_id:
+            return node
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    for child in children:
+        found = _find(child, component_id)
+        if found is not None:
+            return found
+    return None
+
+
+class ReloadTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        synthetic.write(self.directory, 1, names=['parc_Q2_2022.csv', 'veh156_Q2_2022.csv',
+                                                  'hc_oils_bulletin_q2_2022.csv'])
+        os.chdir(self.directory)
+        datastore.CACHE_DIR = os.path.join(self.directory, '.datacache')
+        figurecache.clear()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def parc_figure(self):
+        store = _find(datastore.get('page_4_layout'), 'vehicleparc-figure')
+        return store['props']['data']
+
+    def test_inline_figure_follows_the_file(self):
+        from pages import vehicles
+
+        before = self.parc_figure()
+        parc = pd.read_csv('parc_Q2_2022.csv')
+        parc['Petrol'] = parc['Petrol'] * 3
+        parc.to_csv('parc_Q2_2022.csv', index=False)
+        stale = datastore.reload(['parc_Q2_2022.csv'])
+
+        self.assertIn('page_4_layout', stale)
+        after = self.parc_figure()
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, vehicles.build_vehicleparcfig('Car', 'Parc'))
+
+
+if __name__ == '__main__':
+    unittest.main()
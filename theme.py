@@ -0,0 +1,83 @@
+# Plot templates, colours and box styles shared by every page.
+
+import plotly.express as px
+import plotly.graph_objs as go
+
+
+# # 2. Define Plot Themes
+# 
+# Three themes based on Zemo colors:
+# 1. Graphs
+# 2. Range slider
+# 3. Choropleths
+
+# In[3]:
+
+
+## Zemo Graph Template Theme (w/ spikes on hover)
+
+#label_annex = str(28)
+#if label != label_annex:
+cw = ['#00A8E0', '#0070C4', '#42B029', '#007526','#001A70'] + px.colors.qualitative.Vivid_r
+#else:
+#    cw = ['#ffffff', '#ffffff', '#ffffff', '#ffffff','#ffffff']
+    
+## Zemo Graph Template Theme
+zemo_template = dict(
+    layout=go.Layout(
+                    title_x = 0, title_xanchor = 'left', title_xref = 'paper', 
+                    title_font=dict(family="Arial", size=20), 
+                     font=dict(family="Arial", size=14),
+                     plot_bgcolor='White',
+                     paper_bgcolor = 'White',
+                     colorway = cw,
+                     xaxis = dict(linecolor = 'black', 
+                                  showline= True, linewidth= 1, tickangle = 30, ticks='outside', gridcolor='Lavenderblush', ticklabelmode = 'instant', showgrid = True),
+                     yaxis = dict(linecolor = 'black', showline=True, linewidth = 1, tickangle = 0, gridcolor='Lavenderblush', ticklabelmode = 'instant', showgrid = True),
+                     legend = dict(bgcolor = 'whitesmoke', bordercolor = 'grey', borderwidth = 1)
+                    )
+                    )
+
+## Zemo Graph Template Theme (w/ spikes on hover)
+zemo_template_spike = dict(
+    layout=go.Layout(
+                    title_x = 0, title_xanchor = 'left', title_xref = 'paper', 
+                    title_font=dict(family="Arial", size=20), 
+                     font=dict(family="Arial", size=14),
+                     plot_bgcolor='White',
+                     paper_bgcolor = 'White',
+                     colorway = cw,
+                                    hovermode="x",
+                                    hoverdistance=100, # Distance to show hover label of data point
+                                    spikedistance=1000, # Distance to show spike
+                     xaxis = dict(linecolor = 'black', 
+                                    showspikes=True, # Show spike line for X-axis
+                                    spikethickness=2,
+                                    spikedash="dot",
+                                    spikecolor="#999999",
+                                    spikemode="across",
+                                  showline= True, linewidth= 1, tickangle = 30, ticks='outside', gridcolor='Lavenderblush', ticklabelmode = 'instant', showgrid = True),
+                     yaxis = dict(linecolor = 'black', 
+                                  showline=True, linewidth = 1, tickangle = 0, gridcolor='Lavenderblush', ticklabelmode = 'instant', showgrid = True),
+                     legend = dict(bgcolor = 'whitesmoke', bordercolor = 'grey', borderwidth = 1)
+                    )
+                        )
+
+## Zemo Choropleth Graph Theme
+zemo_template_choro = dict(
+    layout=go.Layout(title_font=dict(family="Arial", size=15), 
+                     font=dict(family="Arial", size=14),
+                     plot_bgcolor='White',
+                     paper_bgcolor = 'White',
+                     #colorway=px.colors.sequential.Oranges,
+                     #basemap_visible = False,
+                     margin={'r': 0, 't': 5, 'l': 15, 'b': 0}, 
+                     #geo=dict(bgcolor= 'rgba(0,255,255,0.3)')
+                        ))
+theme_color_scale=["#F8ED94", "#42B029", "#00A8E0", "#001A70"]    
+
+
+## Style template for div boxes
+style_template = {'border': '0px solid #001a70'}
+
+width_template = {"size": 10, "offset": 1}
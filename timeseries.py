@@ -0,0 +1,47 @@
+# Resampling and rolling windows for daily time series.
+#
+# Used to precompute the coarser views of a dataset once, through the
+# datastore, so callbacks only pick a series instead of slicing or
+# aggregating per request. Every column apart from the date is averaged;
+# missing days are ignored rather than counted as zero.
+
+import numpy as np
+import pandas as pd
+
+
+def period_means(frame, date_column, freq):
+    # Calendar means labelled by the start of each period, e.g. freq='W-MON'
+    # for weeks starting on Monday or 'MS' for months
+    daily = _daily(frame, date_column)
+    return (daily.resample(freq, label='left', closed='left').mean()
+                 .reset_index())
+
+
+def rolling_means(frame, date_column, days):
+    # Trailing mean over the last `days` calendar days, computed from running
+    # sums so the cost doesn't depend on the window length. Days before a full
+    # window has elapsed, and windows without any data, are left empty.
+    daily = _daily(frame, date_column).asfreq('D')
+    values = daily.to_numpy(dtype='float64')
+    present = ~np.isnan(values)
+
+    zeros = np.zeros((1, values.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(np.where(present, values, 0), axis=0)])
+    counts = np.concatenate([zeros, np.cumsum(present, axis=0)])
+
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - days, 0)
+    window_sums = sums[end] - sums[start]
+    window_counts = counts[end] - counts[start]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = window_sums / window_counts
+    means[(window_counts == 0) | (end < days)[:, None]] = np.nan
+
+    return pd.DataFrame(means, index=daily.index, columns=daily.columns).reset_index()
+
+
+def _daily(frame, date_column):
+    numeric = frame.set_index(date_column).select_dtypes('number')
+    numeric = numeric[~numeric.index.duplicated(keep='last')]
+    return numeric.sort_index()